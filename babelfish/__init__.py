@@ -2,38 +2,115 @@
 # Use of this source code is governed by the 3-clause BSD license
 # that can be found in the LICENSE file.
 #
+from functools import partial
+
+from . import country, language, script
+from .cache import LazyAttributes
 from .converters import (
     CountryConverter,
     CountryReverseConverter,
     LanguageConverter,
     LanguageEquivalenceConverter,
     LanguageReverseConverter,
+    LanguageTranscoder,
+)
+from .country import Country, country_converters
+from .exceptions import (
+    AmbiguousLanguageError,
+    CountryConvertError,
+    CountryReverseError,
+    Error,
+    LanguageConvertError,
+    LanguageReverseError,
+)
+from .language import Language, language_converters
+from .script import Script
+from .search import search_countries, search_languages, search_scripts
+from .serialization import dumps, loads
+from .sets import CountrySet, LanguageSet
+
+# data tables are loaded on first access
+__getattr__ = LazyAttributes(
+    __name__,
+    COUNTRIES=lambda: country.COUNTRIES,
+    COUNTRY_MATRIX=lambda: country.COUNTRY_MATRIX,
+    LANGUAGES=lambda: language.LANGUAGES,
+    LANGUAGE_MATRIX=lambda: language.LANGUAGE_MATRIX,
+    SCRIPTS=lambda: script.SCRIPTS,
+    SCRIPT_MATRIX=lambda: script.SCRIPT_MATRIX,
 )
-from .country import COUNTRIES, COUNTRY_MATRIX, Country, country_converters
-from .exceptions import CountryConvertError, CountryReverseError, Error, LanguageConvertError, LanguageReverseError
-from .language import LANGUAGE_MATRIX, LANGUAGES, Language, language_converters
-from .script import SCRIPT_MATRIX, SCRIPTS, Script
+
+
+def warmup(*, freeze: bool = False) -> None:
+    """Load the data tables and all the language and country converters upfront.
+
+    Call it before forking worker processes, followed by :func:`gc.freeze`, so that workers
+    share the loaded tables instead of each loading them on first use. Values converted
+    afterwards are still cached on the :class:`Language` and :class:`Country` instances.
+
+    :param bool freeze: also freeze the converter managers, see
+        :meth:`~babelfish.converters.ConverterManager.freeze`
+
+    """
+    for name in ('LANGUAGES', 'LANGUAGE_INDEX', 'LANGUAGE_MATRIX'):
+        language._data(name)
+    for name in ('COUNTRIES', 'COUNTRY_INDEX', 'COUNTRY_MATRIX'):
+        country._data(name)
+    for name in ('SCRIPTS', 'SCRIPT_INDEX', 'SCRIPT_MATRIX'):
+        script._data(name)
+    for manager in (language_converters, country_converters):
+        if freeze:
+            manager.freeze()
+        else:
+            manager.load_all()
+
+
+async def awarmup(*, freeze: bool = False) -> None:
+    """Like :func:`warmup`, loading in the default executor of the running event loop.
+
+    Await it on startup so that converting languages and countries afterwards does not block
+    the event loop.
+
+    :param bool freeze: also freeze the converter managers, see
+        :meth:`~babelfish.converters.ConverterManager.freeze`
+
+    """
+    import asyncio  # only needed within an event loop
+
+    await asyncio.get_running_loop().run_in_executor(None, partial(warmup, freeze=freeze))
+
 
 __all__ = [
     'LanguageConverter',
     'LanguageReverseConverter',
     'LanguageEquivalenceConverter',
+    'LanguageTranscoder',
     'CountryConverter',
     'CountryReverseConverter',
     'country_converters',
     'COUNTRIES',
     'COUNTRY_MATRIX',
     'Country',
+    'CountrySet',
     'Error',
     'LanguageConvertError',
     'LanguageReverseError',
+    'AmbiguousLanguageError',
     'CountryConvertError',
     'CountryReverseError',
     'language_converters',
     'LANGUAGES',
     'LANGUAGE_MATRIX',
     'Language',
+    'LanguageSet',
     'SCRIPTS',
     'SCRIPT_MATRIX',
     'Script',
+    'search_countries',
+    'search_languages',
+    'search_scripts',
+    'warmup',
+    'awarmup',
+    'dumps',
+    'loads',
 ]
@@ -0,0 +1,149 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Resolution of language codes in any format.
+
+Codes of the loaded language reverse converters are merged into a single index, along with
+the ISO-639-3 codes and deprecated codes, so that a code in an unknown format is resolved
+with one lookup instead of trying each converter in turn::
+
+    >>> Language.fromany('fre')
+    <Language [fr]>
+    >>> Language.fromany('pt_BR')
+    <Language [pt-BR]>
+
+A code matching several languages resolves to the first one in the order of :data:`PRIORITY`,
+all of them being reported by :func:`candidates`. Codes are looked up before names, so a code
+which is also a name, e.g. ``en`` and the ISO name of ``enc``, designates the code.
+
+The internal converters are loaded if needed. Installed and registered converters are never
+loaded by the index: they join it once loaded, e.g. with :func:`babelfish.warmup`.
+
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from . import language
+from .converters import LanguageReverseConverter
+from .exceptions import LanguageReverseError
+from .language import language_converters
+
+#: Deprecated ISO-639 codes still found in the wild, to their alpha3 ISO-639-3 code
+DEPRECATED_CODES = {
+    'iw': 'heb',
+    'in': 'ind',
+    'ji': 'yid',
+    'jw': 'jav',
+    'mo': 'ron',
+    'mol': 'ron',
+    'scc': 'srp',
+    'scr': 'hrv',
+}
+
+#: Order in which codes are looked up, other reverse converters coming after by name
+PRIORITY = ('alpha2', 'alpha3', 'alpha3b', 'alpha3t', 'deprecated', 'opensubtitles', 'name')
+
+#: Converters of language names rather than codes, ranked after the codes of the other converters
+NAME_CONVERTERS = frozenset({'name'})
+
+#: Separators of the language from the script and the country
+SEPARATORS = ('-', '_')
+
+Codes = Tuple[str, Optional[str], Optional[str]]
+Candidates = Tuple[Tuple[str, Codes], ...]
+
+
+def loaded_converters() -> tuple[str, ...]:
+    """Names of the loaded language converters, loading the internal converters if needed.
+
+    :rtype: tuple
+
+    """
+    for entry_point in language_converters.internal_converters:
+        language_converters[entry_point.partition('=')[0].strip()]
+    return tuple(sorted(language_converters.converters))
+
+
+def alias_index() -> dict[str, Candidates]:
+    """Merged index of the language codes of the :func:`loaded_converters`, built once for each set of
+    loaded converters and rebuilt when language converters change.
+
+    :return: the source and the alpha3, country and script codes of the languages matching a casefolded code,
+        in the order of :data:`PRIORITY`
+    :rtype: dict
+
+    """
+    return _alias_index(loaded_converters())
+
+
+@lru_cache(maxsize=None)
+def _alias_index(names: tuple[str, ...]) -> dict[str, Candidates]:
+    tables: dict[str, dict[str, Codes]] = {
+        'alpha3': {alpha3: (alpha3, None, None) for alpha3 in language.LANGUAGE_COLUMNS.alpha3},
+        'deprecated': {code: (alpha3, None, None) for code, alpha3 in DEPRECATED_CODES.items()},
+    }
+    for name in names:
+        converter = language_converters.converters.get(name)
+        if isinstance(converter, LanguageReverseConverter):
+            codes = sorted(converter.codes)
+            tables[name] = {
+                code: reversed_codes
+                for code, reversed_codes in zip(codes, converter.reverse_many(codes))
+                if reversed_codes is not None
+            }
+    order = [name for name in PRIORITY if name in tables] + sorted(set(tables).difference(PRIORITY))
+
+    index: dict[str, list[tuple[str, Codes]]] = {}
+    for name in order:
+        for code, reversed_codes in tables[name].items():
+            # converters may omit the script
+            reversed_codes = (*reversed_codes, None, None)[:3]
+            candidates = index.setdefault(code.casefold(), [])
+            if all(reversed_codes != other for _, other in candidates):
+                candidates.append((name, reversed_codes))
+    return {code: tuple(candidates) for code, candidates in index.items()}
+
+
+def candidates(code: str) -> Candidates:
+    """Find the languages a code may designate, in any format.
+
+    The code is looked up case-insensitively in the :func:`alias_index`. Otherwise, a code
+    with a separator is split into a language code, looked up the same way, and a script
+    and a country parsed as in an IETF language tag, e.g. ``pt_BR``, ``fre-FR`` or ``zh-Hant-TW``.
+
+    Results are memoized in a bounded LRU cache, cleared when language converters change.
+
+    :param string code: the code
+    :return: the source and the alpha3, country and script codes of the matching languages, best first
+    :rtype: tuple
+
+    """
+    return _candidates(code, loaded_converters())
+
+
+@lru_cache(maxsize=4096)
+def _candidates(code: str, names: tuple[str, ...]) -> Candidates:
+    index = _alias_index(names)
+    key = code.strip().casefold()
+    if key in index:
+        return index[key]
+    for separator in SEPARATORS:
+        base, found, rest = key.partition(separator)
+        if found and base in index:
+            try:
+                _, country, script = language.parse_ietf('und-' + rest.replace('_', '-'))
+            except (ValueError, LanguageReverseError):
+                return ()
+            return tuple(
+                (name, (alpha3, country or base_country, script or base_script))
+                for name, (alpha3, base_country, base_script) in index[base]
+            )
+    return ()
+
+
+language_converters.listeners.append(_alias_index.cache_clear)
+language_converters.listeners.append(_candidates.cache_clear)
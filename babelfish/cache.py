@@ -0,0 +1,194 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+from __future__ import annotations
+
+import sys
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+T = TypeVar('T')
+
+
+class InstanceCache(Generic[T]):
+    """A bounded table of canonical instances.
+
+    Instances are stored twice: under the constructor arguments used to create them and
+    under themselves, so that equal instances built from different arguments resolve to
+    the same canonical object. Each table holds at most `maxsize` entries, the oldest
+    entries being evicted first. Evicting an instance also evicts the constructor arguments
+    resolving to it, so that they never resolve to another instance than the canonical one.
+    A `maxsize` of 0 disables the cache.
+
+    :param int maxsize: maximum number of entries per table
+
+    """
+
+    maxsize: int
+    lookups: dict[Hashable, T]
+    instances: dict[T, T]
+    _keys: dict[T, list[Hashable]]
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+
+        #: Constructor arguments to canonical instance
+        self.lookups = {}
+
+        #: Canonical instances
+        self.instances = {}
+
+        # constructor arguments by canonical instance
+        self._keys = {}
+
+    def get(self, key: Hashable) -> T | None:
+        """Get the canonical instance built from constructor arguments `key`, if any."""
+        return self.lookups.get(key)
+
+    def add(self, key: Hashable, instance: T) -> T:
+        """Add an `instance` built from constructor arguments `key` and return its canonical instance."""
+        if self.maxsize <= 0:
+            return instance
+        canonical = self.instances.get(instance)
+        if canonical is None:
+            if len(self.instances) >= self.maxsize:
+                self._evict_instance()
+            canonical = self.instances.setdefault(instance, instance)
+        if len(self.lookups) >= self.maxsize:
+            self._evict_lookup()
+        self.lookups[key] = canonical
+        self._keys.setdefault(canonical, []).append(key)
+        return canonical
+
+    def clear(self) -> None:
+        """Remove all the cached instances."""
+        self.lookups.clear()
+        self.instances.clear()
+        self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def _evict_instance(self) -> None:
+        with suppress(StopIteration, KeyError, RuntimeError):  # concurrent eviction
+            instance = next(iter(self.instances))
+            del self.instances[instance]
+            for key in self._keys.pop(instance, ()):
+                self.lookups.pop(key, None)
+
+    def _evict_lookup(self) -> None:
+        with suppress(StopIteration, KeyError, ValueError, RuntimeError):  # concurrent eviction
+            key = next(iter(self.lookups))
+            self._keys[self.lookups.pop(key)].remove(key)
+
+
+class AttributeCache:
+    """Computed values cached as attributes of immutable instances.
+
+    Once cached, a value is found by the regular attribute lookup and ``__getattr__`` is
+    no longer called for it. :meth:`clear` removes all the cached values, i.e. when the
+    functions computing them change.
+
+    """
+
+    instances: WeakValueDictionary[int, Any]
+    names: set[str]
+
+    def __init__(self) -> None:
+        #: Instances with cached values by id
+        self.instances = WeakValueDictionary()
+
+        #: Names of the cached values
+        self.names = set()
+
+    def set(self, instance: Any, name: str, value: Any) -> None:
+        """Cache the `value` as the `name` attribute of `instance`."""
+        object.__setattr__(instance, name, value)
+        self.names.add(name)
+        self.instances[id(instance)] = instance
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        for instance in list(self.instances.values()):
+            namespace = instance.__dict__
+            for name in self.names:
+                namespace.pop(name, None)
+        self.instances.clear()
+
+
+class InterningMeta(type):
+    """Metaclass returning canonical instances from the class ``_instances`` :class:`InstanceCache`."""
+
+    _instances: InstanceCache[Any]
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        key = (cls, args, *kwargs.items()) if kwargs else (cls, args)
+        try:
+            instance = cls._instances.lookups.get(key)
+        except TypeError:  # unhashable arguments
+            return super().__call__(*args, **kwargs)
+        if instance is None:
+            instance = cls._instances.add(key, super().__call__(*args, **kwargs))
+        return instance
+
+
+class LazyClassAttribute(Generic[T]):
+    """Class attribute computed by `factory` on first access, then stored on the class defining it,
+    so that subsequent accesses from the class, its subclasses or their instances are regular
+    attribute lookups.
+
+    :param factory: function computing the attribute
+
+    """
+
+    factory: Callable[[], T]
+    owner: type
+    name: str
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self.factory = factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: object, owner: type | None = None) -> T:
+        value = self.factory()
+        setattr(self.owner, self.name, value)
+        return value
+
+
+class LazyAttributes:
+    """Module attributes computed on first access, to be used as a module ``__getattr__`` (:pep:`562`).
+
+    Computed values are stored in the module namespace so that subsequent accesses are
+    regular attribute lookups. Calling the instance with an attribute name is also the way
+    for the module itself to access its lazy attributes.
+
+    :param string module: name of the module
+    :param factories: functions computing the attributes, by attribute name
+
+    """
+
+    module: str
+    factories: dict[str, Callable[[], Any]]
+
+    def __init__(self, module: str, **factories: Callable[[], Any]) -> None:
+        self.module = module
+        self.factories = factories
+
+    def __call__(self, name: str) -> Any:
+        namespace = sys.modules[self.module].__dict__
+        if name in namespace:
+            return namespace[name]
+        try:
+            factory = self.factories[name]
+        except KeyError:
+            msg = f'module {self.module!r} has no attribute {name!r}'
+            raise AttributeError(msg) from None
+        return namespace.setdefault(name, factory())
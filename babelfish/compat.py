@@ -5,7 +5,12 @@
 from __future__ import annotations
 
 from sys import version_info as _python
-from typing import IO, Any
+from typing import IO, TYPE_CHECKING, Any
+
+from .cache import LazyAttributes
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoints
 
 if _python >= (3, 9):
     # introduced in python 3.9
@@ -14,13 +19,26 @@ else:
     from importlib_resources import files  # type: ignore[import-not-found,no-redef]
 
 
-if _python >= (3, 10):
-    # .select() was introduced in 3.10
-    from importlib.metadata import EntryPoint as _EntryPoint
-    from importlib.metadata import EntryPoints, entry_points
-else:
-    from importlib_metadata import EntryPoint as _EntryPoint  # type: ignore[assignment]
-    from importlib_metadata import EntryPoints, entry_points  # type: ignore[assignment]
+def _metadata() -> Any:
+    # importlib.metadata is slow to import and only needed to load converters
+    if _python >= (3, 10):
+        # .select() was introduced in 3.10
+        import importlib.metadata as metadata
+    else:
+        import importlib_metadata as metadata  # type: ignore[import-not-found,no-redef]
+    return metadata
+
+
+def _entry_point_class() -> type:
+    class EntryPoint(_metadata().EntryPoint):  # type: ignore[misc,name-defined]
+        @staticmethod
+        def parse(eps: str) -> EntryPoint:
+            return EntryPoint(*map(str.strip, eps.split('=')), None)
+
+        def resolve(self) -> Any:
+            return self.load()
+
+    return EntryPoint
 
 
 def resource_stream(pkg: str, path: str) -> IO[bytes]:
@@ -28,13 +46,7 @@ def resource_stream(pkg: str, path: str) -> IO[bytes]:
 
 
 def iter_entry_points(group: str, **kwargs: Any) -> EntryPoints:
-    return entry_points().select(group=group, **kwargs)
-
+    return _metadata().entry_points().select(group=group, **kwargs)  # type: ignore[no-any-return]
 
-class EntryPoint(_EntryPoint):
-    @staticmethod
-    def parse(eps: str) -> EntryPoint:
-        return EntryPoint(*map(str.strip, eps.split('=')), None)  # type: ignore[call-arg]
 
-    def resolve(self) -> Any:
-        return self.load()
+__getattr__ = LazyAttributes(__name__, EntryPoint=_entry_point_class)
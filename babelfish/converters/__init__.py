@@ -4,15 +4,27 @@
 #
 from __future__ import annotations
 
+import sys
+import threading
+import time
+import warnings
 from collections.abc import Iterable, Iterator, Mapping
-from typing import Any, ClassVar, Generic, MutableMapping, TypeVar, Union
+from contextlib import suppress
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, MutableMapping, TypeVar, Union
 
-from babelfish.compat import EntryPoint, iter_entry_points
+from babelfish import compat
 from babelfish.exceptions import LanguageConvertError, LanguageReverseError
 
+if TYPE_CHECKING:
+    from babelfish.instrumentation import Instrumentation
+
 V = TypeVar('V')
 
 
+_missing = object()
+
+
 # from https://github.com/kennethreitz/requests/blob/master/requests/structures.py
 class CaseInsensitiveDict(Generic[V], MutableMapping[str, V]):
     """A case-insensitive ``dict``-like object.
@@ -32,30 +44,84 @@ class CaseInsensitiveDict(Generic[V], MutableMapping[str, V]):
         cid['ENGLISH'] == 'eng'  # True
         list(cid) == ['English']  # True
 
+    Keys are compared by their :meth:`str.casefold`. Lookups try the keys as
+    they were set and the last :attr:`ALIASES` keys found in another case first,
+    so that repeated lookups do not casefold the key.
+
     If the constructor, ``.update``, or equality comparison
-    operations are given keys that have equal ``.lower()``s, the
+    operations are given keys that have equal ``.casefold()``s, the
     behavior is undefined.
 
     """
 
+    #: Number of keys found in another case to remember, the oldest ones being forgotten first
+    ALIASES: ClassVar[int] = 1024
+
     _store: dict[str, tuple[str, V]]
+    _lookups: dict[str, V]
+    _aliases: dict[str, None]
 
     def __init__(self, data: Mapping[str, V] | Iterable[tuple[str, V]] | None = None, **kwargs: V) -> None:
-        self._store = {}
+        items: Iterable[tuple[str, V]]
         if data is None:
-            data = {}
-        self.update(data, **kwargs)
+            items = ()
+        elif isinstance(data, Mapping):
+            items = data.items()
+        elif hasattr(data, 'keys'):
+            # mapping-like objects which are not registered as Mapping
+            mapping: Any = data
+            items = ((key, mapping[key]) for key in mapping)
+        else:
+            items = data
+        # Casefolded key to the actual key and the value
+        self._store = {key.casefold(): (key, value) for key, value in chain(items, kwargs.items())}
+        # Actual keys and aliases to the value
+        self._lookups = {}
+        # Aliases in the order they were found
+        self._aliases = {}
+        self._reset_lookups()
 
     def __setitem__(self, key: str, value: V) -> None:
-        # Use the lowercased key for lookups, but store the actual
+        # Use the casefolded key for lookups, but store the actual
         # key alongside the value.
-        self._store[key.lower()] = (key, value)
+        folded = key.casefold()
+        replaced = folded in self._store
+        self._store[folded] = (key, value)
+        if replaced:
+            self._reset_lookups()
+        else:
+            self._lookups[key] = value
 
     def __getitem__(self, key: str) -> V:
-        return self._store[key.lower()][1]
+        value = self._lookups.get(key, _missing)
+        if value is _missing:
+            value = self._store[key.casefold()][1]
+            self._add_alias(key, value)
+        return value  # type: ignore[return-value]
 
     def __delitem__(self, key: str) -> None:
-        del self._store[key.lower()]
+        del self._store[key.casefold()]
+        self._reset_lookups()
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            if key in self._lookups:
+                return True
+        except TypeError:  # unhashable key
+            return False
+        return isinstance(key, str) and key.casefold() in self._store
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookups.get(key, _missing)
+        if value is not _missing:
+            return value
+        if not isinstance(key, str):  # i.e. nulls of a column
+            return default
+        item = self._store.get(key.casefold())
+        if item is None:
+            return default
+        self._add_alias(key, item[1])
+        return item[1]
 
     def __iter__(self) -> Iterator[str]:
         return (casedkey for casedkey, _ in self._store.values())
@@ -64,26 +130,58 @@ class CaseInsensitiveDict(Generic[V], MutableMapping[str, V]):
         return len(self._store)
 
     def lower_items(self) -> Iterator[tuple[str, V]]:
-        """Like iteritems(), but with all lowercase keys."""
+        """Like iteritems(), but with all casefolded keys."""
         return ((lowerkey, keyval[1]) for (lowerkey, keyval) in self._store.items())
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Mapping):
-            other = CaseInsensitiveDict(other)
-        else:
+        if not isinstance(other, Mapping):
             return NotImplemented
-        # Compare insensitively
-        return dict(self.lower_items()) == dict(other.lower_items())
+        if len(self) != len(other):
+            return False
+        # Compare insensitively without building dicts
+        store = self._store
+        if isinstance(other, CaseInsensitiveDict):
+            return all(folded in store and store[folded][1] == item[1] for folded, item in other._store.items())
+        for key, value in other.items():
+            item = store.get(key.casefold()) if isinstance(key, str) else None
+            if item is None or item[1] != value:
+                return False
+        return True
 
     # Copy is required
     def copy(self) -> CaseInsensitiveDict[V]:
         """Make a shallow copy."""
         return CaseInsensitiveDict(self._store.values())
 
+    def _add_alias(self, key: str, value: V) -> None:
+        if self.ALIASES <= 0:
+            return
+        if len(self._aliases) >= self.ALIASES:
+            with suppress(StopIteration, KeyError, RuntimeError):  # concurrent eviction
+                oldest = next(iter(self._aliases))
+                del self._aliases[oldest]
+                del self._lookups[oldest]
+        self._aliases[key] = None
+        self._lookups[key] = value
+
+    def _reset_lookups(self) -> None:
+        # aliases may resolve to a replaced or deleted value
+        self._lookups = dict(self._store.values())
+        self._aliases = {}
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({dict(self.items())!r})'
 
 
+def array_values(values: Iterable[Any]) -> Iterable[Any]:
+    """Iterable of python objects from `values`, converting pyarrow and numpy arrays to lists."""
+    if hasattr(values, 'to_pylist'):
+        return values.to_pylist()  # type: ignore[no-any-return]
+    if hasattr(values, 'tolist'):
+        return values.tolist()  # type: ignore[no-any-return]
+    return values
+
+
 class LanguageConverter:
     """A :class:`LanguageConverter` supports converting an alpha3 language code with an
     alpha2 country code and a script code into a custom code.
@@ -110,6 +208,68 @@ class LanguageConverter:
         """
         raise NotImplementedError
 
+    def try_convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str | None:
+        """Like :meth:`convert` but return ``None`` instead of raising when the conversion fails.
+
+        Converters should override this method when they can fail without raising an exception.
+
+        :param string alpha3: ISO-639-3 language code
+        :param country: ISO-3166 country code, if any
+        :type country: string or None
+        :param script: ISO-15924 script code, if any
+        :type script: string or None
+        :return: the corresponding custom code, if any
+        :rtype: string or None
+
+        """
+        try:
+            return self.convert(alpha3, country, script)
+        except LanguageConvertError:
+            return None
+
+    def convert_many(
+        self, languages: Iterable[str | tuple[str, str | None, str | None]], default: Any = None
+    ) -> list[Any]:
+        """Convert many languages into custom codes, each distinct language being converted once.
+
+        :param languages: alpha3 codes or tuples of alpha3, country and script codes, as an iterable,
+            a numpy or a pyarrow array
+        :param default: value for the languages that failed conversion
+        :return: the corresponding custom codes, in the same order
+        :rtype: list
+
+        """
+        converted: dict[Any, Any] = {}
+        codes = []
+        for language in array_values(languages):
+            if language not in converted:
+                code = self.try_convert(*language) if isinstance(language, tuple) else self.try_convert(language)
+                converted[language] = default if code is None else code
+            codes.append(converted[language])
+        return codes
+
+    def convert_ids(self, language_ids: Iterable[int], default: Any = None) -> list[Any]:
+        """Convert many language ids into custom codes, each distinct id being converted once.
+
+        :param language_ids: ids of the languages, see :meth:`~babelfish.language.Language.to_id`,
+            as an iterable, an array, a numpy or a pyarrow array
+        :param default: value for the languages that failed conversion
+        :return: the corresponding custom codes, in the same order
+        :rtype: list
+        :raise: ValueError if a language id is invalid
+
+        """
+        from babelfish.language import split_id  # circular import
+
+        converted: dict[int, Any] = {}
+        codes = []
+        for language_id in array_values(language_ids):
+            if language_id not in converted:
+                code = self.try_convert(*split_id(language_id))
+                converted[language_id] = default if code is None else code
+            codes.append(converted[language_id])
+        return codes
+
 
 class LanguageReverseConverter(LanguageConverter):
     """A :class:`LanguageConverter` able to reverse a custom code into a alpha3
@@ -131,17 +291,56 @@ class LanguageReverseConverter(LanguageConverter):
         """
         raise NotImplementedError
 
+    def try_reverse(self, code: str) -> tuple[str, str | None, str | None] | None:
+        """Like :meth:`reverse` but return ``None`` instead of raising when the reverse conversion fails.
+
+        Converters should override this method when they can fail without raising an exception.
+
+        :param string code: custom code to reverse
+        :return: the corresponding alpha3 ISO-639-3 language code,
+            alpha2 ISO-3166-1 country code and ISO-15924 script code, if any
+        :rtype: tuple or None
+
+        """
+        try:
+            return self.reverse(code)
+        except LanguageReverseError:
+            return None
+
+    def reverse_many(self, codes: Iterable[str], default: Any = None) -> list[Any]:
+        """Reverse many custom codes, each distinct code being reversed once.
+
+        :param codes: custom codes to reverse, as an iterable, a numpy or a pyarrow array
+        :param default: value for the codes that failed reverse conversion and the codes that are not strings
+        :return: the corresponding tuples of alpha3, country and script codes, in the same order
+        :rtype: list
+
+        """
+        reversed_codes: dict[str, Any] = {}
+        languages = []
+        for code in array_values(codes):
+            if code not in reversed_codes:
+                language = self.try_reverse(code) if isinstance(code, str) else None
+                reversed_codes[code] = default if language is None else language
+            languages.append(reversed_codes[code])
+        return languages
+
 
 class LanguageEquivalenceConverter(LanguageReverseConverter):
     """A :class:`LanguageEquivalenceConverter` is a utility class that allows you to
     easily define a :class:`LanguageReverseConverter` by only specifying the dict from
     alpha3 to their corresponding symbols.
 
-    You must specify the dict of equivalence as a class variable named SYMBOLS.
+    You must specify the dict of equivalence as a class variable named SYMBOLS or
+    override :meth:`symbols` to compute it when the converter is instantiated.
 
     If you also set the class variable CASE_SENSITIVE to ``True`` then the reverse
     conversion function will be case-sensitive (it is case-insensitive by default).
 
+    When the symbols only depend on the class, set the class variable SHARED_TABLES to
+    ``True`` to build the tables once and share them between the instances, which must
+    then leave them unchanged.
+
     Example::
 
         class MyCodeConverter(babelfish.LanguageEquivalenceConverter):
@@ -152,23 +351,45 @@ class LanguageEquivalenceConverter(LanguageReverseConverter):
 
     CASE_SENSITIVE: ClassVar[bool] = False
     SYMBOLS: ClassVar[dict[str, str]] = {}
+    SHARED_TABLES: ClassVar[bool] = False
 
     codes: set[str]
     to_symbol: dict[str, str]
     from_symbol: dict[str, tuple[str, str | None, str | None]] | CaseInsensitiveDict[tuple[str, str | None, str | None]]
+    index_symbols: tuple[str | None, ...] | None
+
+    #: Tables shared between the instances by class, see SHARED_TABLES
+    _shared_tables: ClassVar[dict[type, tuple[Any, ...]]] = {}
 
     def __init__(self) -> None:
-        self.codes = set()
-        self.to_symbol = {}
-        if self.CASE_SENSITIVE:
-            self.from_symbol = {}
-        else:
-            self.from_symbol = CaseInsensitiveDict()
+        self.index_symbols = None
+        tables = self._shared_tables.get(self.__class__) if self.SHARED_TABLES else None
+        if tables is None:
+            tables = self.build_tables()
+            if self.SHARED_TABLES:
+                tables = self._shared_tables.setdefault(self.__class__, tables)
+        self.codes, self.to_symbol, self.from_symbol = tables
+
+    def build_tables(self) -> tuple[Any, ...]:
+        """Build the :attr:`codes`, :attr:`to_symbol` and :attr:`from_symbol` tables from :meth:`symbols`.
+
+        :return: the tables
+        :rtype: tuple
+
+        """
+        to_symbol = dict(self.symbols())
+        reverse = [(symbol, (alpha3, None, None)) for alpha3, symbol in to_symbol.items()]
+        from_symbol = dict(reverse) if self.CASE_SENSITIVE else CaseInsensitiveDict(reverse)
+        return set(to_symbol.values()), to_symbol, from_symbol
 
-        for alpha3, symbol in self.SYMBOLS.items():
-            self.to_symbol[alpha3] = symbol
-            self.from_symbol[symbol] = (alpha3, None, None)
-            self.codes.add(symbol)
+    def symbols(self) -> Mapping[str, str]:
+        """The dict of equivalence from alpha3 to symbols, SYMBOLS by default.
+
+        :return: the symbols by alpha3 code
+        :rtype: dict
+
+        """
+        return self.SYMBOLS
 
     def convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str:
         try:
@@ -182,6 +403,140 @@ class LanguageEquivalenceConverter(LanguageReverseConverter):
         except KeyError as err:
             raise LanguageReverseError(code) from err
 
+    def try_convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str | None:
+        return self.to_symbol.get(alpha3)
+
+    def try_reverse(self, code: str) -> tuple[str, str | None, str | None] | None:
+        return self.from_symbol.get(code)
+
+    def convert_many(
+        self, languages: Iterable[str | tuple[str, str | None, str | None]], default: Any = None
+    ) -> list[Any]:
+        to_symbol = self.to_symbol
+        return [
+            to_symbol.get(language[0] if isinstance(language, tuple) else language, default)
+            for language in array_values(languages)
+        ]
+
+    def convert_ids(self, language_ids: Iterable[int], default: Any = None) -> list[Any]:
+        from babelfish.language import LANGUAGE_ID_MASK, split_id  # circular import
+
+        symbols = self._index_symbols()
+        count = len(symbols)
+
+        def index(language_id: int) -> int:
+            split_id(language_id)  # raises ValueError if the id is invalid
+            return language_id & LANGUAGE_ID_MASK
+
+        # languages without country nor script are their index, the other ones are checked
+        converted = [
+            symbols[language_id if 0 <= language_id < count else index(language_id)]
+            for language_id in array_values(language_ids)
+        ]
+        if default is not None:
+            converted = [default if symbol is None else symbol for symbol in converted]
+        return converted
+
+    def _index_symbols(self) -> tuple[str | None, ...]:
+        from babelfish.language import LANGUAGE_COLUMNS  # circular import
+
+        # symbols by index in the language matrix, None for the languages without one
+        if self.index_symbols is None:
+            self.index_symbols = tuple(map(self.to_symbol.get, LANGUAGE_COLUMNS.alpha3))
+        return self.index_symbols
+
+    def reverse_many(self, codes: Iterable[str], default: Any = None) -> list[Any]:
+        if not self.CASE_SENSITIVE:
+            return super().reverse_many(codes, default)
+        from_symbol = self.from_symbol
+        return [from_symbol.get(code, default) for code in array_values(codes)]
+
+
+class LanguageTranscoder:
+    """A :class:`LanguageTranscoder` translates the custom codes of a source converter into the
+    custom codes of a target converter without creating :class:`~babelfish.language.Language` instances.
+
+    When the source converter is a :class:`LanguageEquivalenceConverter` all the translations are
+    precomputed in a single lookup table, other converters are chained on each translation.
+
+    Example::
+
+        transcoder = LanguageTranscoder(language_converters['alpha3b'], language_converters['name'])
+        transcoder.translate('fre')  # 'French'
+
+    :param source: converter to reverse the codes to translate
+    :type source: :class:`LanguageReverseConverter`
+    :param target: converter to convert the translated codes
+    :type target: :class:`LanguageConverter`
+
+    """
+
+    source: LanguageReverseConverter
+    target: LanguageConverter
+    table: dict[str, str] | CaseInsensitiveDict[str] | None
+
+    def __init__(self, source: LanguageReverseConverter, target: LanguageConverter) -> None:
+        self.source = source
+        self.target = target
+
+        #: Precomputed translations, if the source converter allows it
+        self.table = None
+        if isinstance(source, LanguageEquivalenceConverter):
+            table: dict[str, str] | CaseInsensitiveDict[str] = {} if source.CASE_SENSITIVE else CaseInsensitiveDict()
+            for code in source.codes:
+                with suppress(LanguageConvertError):
+                    table[code] = target.convert(*source.reverse(code))
+            self.table = table
+
+    def translate(self, code: str) -> str:
+        """Translate a custom code of the source converter into a custom code of the target converter.
+
+        :param string code: custom code of the source converter
+        :return: the corresponding custom code of the target converter
+        :rtype: string
+        :raise: :class:`~babelfish.exceptions.LanguageReverseError` or
+            :class:`~babelfish.exceptions.LanguageConvertError`
+
+        """
+        if self.table is not None:
+            translation = self.table.get(code)
+            if translation is not None:
+                return translation
+        return self.target.convert(*self.source.reverse(code))
+
+    def try_translate(self, code: str) -> str | None:
+        """Like :meth:`translate` but return ``None`` instead of raising when the translation fails.
+
+        :param string code: custom code of the source converter
+        :return: the corresponding custom code of the target converter, if any
+        :rtype: string or None
+
+        """
+        if self.table is not None:
+            return self.table.get(code)
+        language = self.source.try_reverse(code)
+        if language is None:
+            return None
+        return self.target.try_convert(*language)
+
+    def translate_many(self, codes: Iterable[str], default: Any = None) -> list[Any]:
+        """Translate many custom codes, each distinct code being translated once.
+
+        :param codes: custom codes of the source converter, as an iterable, a numpy or a pyarrow array
+        :param default: value for the codes that failed translation
+        :return: the corresponding custom codes of the target converter, in the same order
+        :rtype: list
+
+        """
+        translated: dict[str, Any] = {}
+        translations = []
+        for code in array_values(codes):
+            if code not in translated:
+                translation = self.try_translate(code)
+                translated[code] = default if translation is None else translation
+            translations.append(translated[code])
+        return translations
+
 
 class CountryConverter:
     """A :class:`CountryConverter` supports converting an alpha2 country code
@@ -235,6 +590,25 @@ class ConverterManager(Generic[C]):
     * Registered converters
     * Internal converters
 
+    Installed entry points are looked up once, call :meth:`refresh` to look them up again.
+    Names that cannot be loaded are remembered until a converter is registered or loaded.
+
+    The :attr:`listeners` are called whenever converters are loaded, unloaded, registered
+    or unregistered so that values computed with the previous converters can be invalidated.
+
+    :meth:`load_all` loads all the converters upfront and :meth:`freeze` also prevents any
+    further change, i.e. before forking worker processes.
+
+    Managers are thread-safe: each converter is loaded once even when requested by several
+    threads at the same time, the other threads waiting for it. Loading, unloading,
+    registering and unregistering converters are atomic, and the :attr:`listeners` are called
+    after the change is complete. Loaded converters are shared between threads and must not
+    be modified.
+
+    Loading imports modules and reads data files, which blocks. Within an event loop, preload
+    converters in an executor with :meth:`aload` or :func:`babelfish.awarmup`: a RuntimeWarning
+    is issued when a converter is loaded while an event loop is running in the current thread.
+
     .. attribute:: entry_point
 
         The entry point where to look for converters
@@ -250,6 +624,9 @@ class ConverterManager(Generic[C]):
 
     registered_converters: list[str]
     converters: dict[str, C]
+    listeners: list[Callable[[], None]]
+    frozen: bool
+    instrumentation: Instrumentation | None
 
     def __init__(self) -> None:
         #: Registered converters with entry point syntax
@@ -258,58 +635,239 @@ class ConverterManager(Generic[C]):
         #: Loaded converters
         self.converters = {}
 
+        #: Functions called when converters change
+        self.listeners = []
+
+        #: Whether converters can no longer change, see :meth:`freeze`
+        self.frozen = False
+
+        #: Whether all the converters are loaded once frozen, other names being missing
+        self._complete = False
+
+        #: Instrumentation of the converters when enabled, see :mod:`babelfish.instrumentation`
+        self.instrumentation = None
+
+        #: Installed entry points by name, looked up on first use
+        self._entry_points: dict[str, Any] | None = None
+
+        #: Registered and internal converters by name, parsed on first use
+        self._parsed_converters: dict[str, Any] | None = None
+
+        #: Names of converters that could not be found
+        self._missing: set[str] = set()
+
+        #: Lock of the manager state
+        self._lock = threading.RLock()
+
+        #: Locks of the converters being loaded by name, a converter may load others
+        self._loading: dict[str, threading.RLock] = {}
+
     def __getitem__(self, name: str) -> C:
         """Get a converter, lazy loading it if necessary."""
-        if name in self.converters:
-            return self.converters[name]
-        for ep in iter_entry_points(self.entry_point):
-            if ep.name == name:
-                self.converters[ep.name] = ep.load()()
-                return self.converters[ep.name]
-        for ep in (EntryPoint.parse(c) for c in self.registered_converters + self.internal_converters):
-            if ep.name == name:
+        converter = self.converters.get(name)
+        if converter is not None:
+            return converter
+        if self._complete or name in self._missing:
+            raise KeyError(name)
+        with self._name_lock(name):
+            # another thread may have loaded it in the meantime
+            if name in self.converters:
+                return self.converters[name]
+            start = time.perf_counter()
+            # looking up the entry points and loading block, unlike finding out the name is missing
+            if self._entry_points is None or name in self._entry_points or name in self.parsed_converters:
+                self._warn_blocking(name)
+            if name in self.entry_points:
+                plugin = self.entry_points[name].load()
+            elif name in self.parsed_converters:
+                ep = self.parsed_converters[name]
                 # `require` argument of ep.load() is deprecated in newer versions of setuptools
                 if hasattr(ep, 'resolve'):
                     plugin = ep.resolve()
                 elif hasattr(ep, '_load'):
                     plugin = ep._load()
                 else:
-                    plugin = ep.load(require=False)  # type: ignore[call-arg]
-                self.converters[ep.name] = plugin()
-                return self.converters[ep.name]
-        raise KeyError(name)
+                    plugin = ep.load(require=False)
+            else:
+                with self._lock:
+                    # the registry may have changed in the meantime, and once frozen, all the
+                    # converters are loaded and the state is left untouched
+                    if not self.frozen and name not in self.entry_points and name not in self.parsed_converters:
+                        self._missing.add(name)
+                    # only the locks of existing converters are kept, threads waiting for this one still hold it
+                    self._loading.pop(name, None)
+                raise KeyError(name)
+            converter = plugin()
+            if self.instrumentation is not None:
+                self.instrumentation.loaded(self, name, converter, time.perf_counter() - start)
+            with self._lock:
+                self.converters[name] = converter
+            return converter
 
     def __setitem__(self, name: str, converter: C) -> None:
         """Load a converter."""
-        self.converters[name] = converter
+        with self._name_lock(name), self._lock:
+            self._check_frozen()
+            if self.instrumentation is not None:
+                self.instrumentation.loaded(self, name, converter)
+            self.converters[name] = converter
+            self._missing.discard(name)
+        self.changed()
 
     def __delitem__(self, name: str) -> None:
         """Unload a converter."""
-        del self.converters[name]
+        with self._name_lock(name), self._lock:
+            self._check_frozen()
+            converter = self.converters.pop(name)
+            if self.instrumentation is not None:
+                self.instrumentation.unloaded(converter)
+        self.changed()
 
     def __iter__(self) -> Iterator[str]:
         """Iterator over loaded converters."""
         return iter(self.converters)
 
+    def available(self, name: str) -> bool:
+        """Whether a converter is loaded, or installed, registered or internal, without loading it.
+
+        :param string name: name of the converter
+        :rtype: bool
+
+        """
+        return name in self.converters or name in self.parsed_converters or name in self.entry_points
+
+    async def aload(self, name: str) -> C:
+        """Get a converter, lazy loading it in the default executor of the running event loop.
+
+        :param string name: name of the converter
+        :return: the converter
+        :raise: KeyError if the converter cannot be found
+
+        """
+        converter = self.converters.get(name)
+        if converter is not None:
+            return converter
+        import asyncio  # only needed within an event loop
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.__getitem__, name)
+
+    @property
+    def entry_points(self) -> dict[str, Any]:
+        """Installed entry points by name."""
+        entry_points = self._entry_points
+        if entry_points is None:
+            with self._lock:
+                if self._entry_points is None:
+                    self._entry_points = {}
+                    for ep in compat.iter_entry_points(self.entry_point):
+                        self._entry_points.setdefault(ep.name, ep)
+                entry_points = self._entry_points
+        return entry_points
+
+    @property
+    def parsed_converters(self) -> dict[str, Any]:
+        """Registered and internal converters by name."""
+        parsed_converters = self._parsed_converters
+        if parsed_converters is None:
+            with self._lock:
+                parsed_converters = {}
+                for ep in (compat.EntryPoint.parse(c) for c in self.registered_converters + self.internal_converters):
+                    parsed_converters.setdefault(ep.name, ep)
+                self._parsed_converters = parsed_converters
+        return parsed_converters
+
+    def refresh(self) -> None:
+        """Look up the installed entry points again, i.e. after installing a distribution."""
+        with self._lock:
+            self._check_frozen()
+            self._entry_points = None
+            self._missing.clear()
+
     def register(self, entry_point: str) -> None:
         """Register a converter.
 
         :param string entry_point: converter to register (entry point syntax)
         :raise: ValueError if already registered
+        :raise: RuntimeError if the manager is frozen
 
         """
-        if entry_point in self.registered_converters:
-            msg = 'Already registered'
-            raise ValueError(msg)
-        self.registered_converters.insert(0, entry_point)
+        with self._name_lock(compat.EntryPoint.parse(entry_point).name), self._lock:
+            self._check_frozen()
+            if entry_point in self.registered_converters:
+                msg = 'Already registered'
+                raise ValueError(msg)
+            self.registered_converters.insert(0, entry_point)
+            self._parsed_converters = None
+            self._missing.clear()
+        self.changed()
 
     def unregister(self, entry_point: str) -> None:
         """Unregister a converter.
 
         :param string entry_point: converter to unregister (entry point syntax)
+        :raise: RuntimeError if the manager is frozen
+
+        """
+        with self._name_lock(compat.EntryPoint.parse(entry_point).name), self._lock:
+            self._check_frozen()
+            self.registered_converters.remove(entry_point)
+            self._parsed_converters = None
+        self.changed()
+
+    def load_all(self) -> list[str]:
+        """Load all the installed, registered and internal converters.
+
+        :return: names of the loaded converters
+        :rtype: list
 
         """
-        self.registered_converters.remove(entry_point)
+        for name in [*self.entry_points, *self.parsed_converters]:
+            self[name]
+        return list(self.converters)
+
+    def freeze(self) -> None:
+        """Load all the converters and prevent any further change.
+
+        Once frozen, loading, unloading, registering or unregistering converters and refreshing
+        the entry points raise a RuntimeError. Converters and their tables are then left untouched
+        so that forked processes share them, along with :func:`gc.freeze`, and names that cannot
+        be loaded raise a KeyError right away.
+
+        Freezing does not cover the values converted with the converters, which are still cached
+        on the :class:`~babelfish.language.Language` and :class:`~babelfish.country.Country` instances.
+
+        """
+        with self._lock:
+            self.frozen = True
+        self.load_all()
+        self._complete = True
+
+    def changed(self) -> None:
+        """Notify the :attr:`listeners` that converters changed."""
+        for listener in self.listeners:
+            listener()
+
+    def _name_lock(self, name: str) -> threading.RLock:
+        with self._lock:
+            return self._loading.setdefault(name, threading.RLock())
+
+    def _warn_blocking(self, name: str) -> None:
+        # asyncio cannot be running if it was never imported
+        asyncio = sys.modules.get('asyncio')
+        if asyncio is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        msg = f'Loading {name!r} blocks the running event loop, preload it with aload() or babelfish.awarmup()'
+        # point at the code accessing the converted value
+        warnings.warn(msg, RuntimeWarning, stacklevel=4)
+
+    def _check_frozen(self) -> None:
+        if self.frozen:
+            msg = f'{self.__class__.__name__} is frozen'
+            raise RuntimeError(msg)
 
     def __contains__(self, name: str) -> bool:
         return name in self.converters
@@ -6,15 +6,18 @@ from __future__ import annotations
 
 from typing import ClassVar
 
-from babelfish.language import LANGUAGE_MATRIX
+from babelfish import language
+from babelfish.cache import LazyClassAttribute
 
 from . import LanguageEquivalenceConverter
 
 
+def _symbols() -> dict[str, str]:
+    columns = language.LANGUAGE_COLUMNS
+    return {alpha3: alpha3b for alpha3, alpha3b in zip(columns.alpha3, columns.alpha3b) if alpha3b}
+
+
 class Alpha3BConverter(LanguageEquivalenceConverter):
     CASE_SENSITIVE: ClassVar[bool] = True
-    SYMBOLS: ClassVar[dict[str, str]] = {}
-
-    for iso_language in LANGUAGE_MATRIX:
-        if iso_language.alpha3b:
-            SYMBOLS[iso_language.alpha3] = iso_language.alpha3b
+    SYMBOLS = LazyClassAttribute(_symbols)
+    SHARED_TABLES: ClassVar[bool] = True
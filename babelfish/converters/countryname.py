@@ -4,7 +4,7 @@
 #
 from __future__ import annotations
 
-from babelfish.country import COUNTRY_MATRIX
+from babelfish import country
 from babelfish.exceptions import CountryConvertError, CountryReverseError
 
 from . import CaseInsensitiveDict, CountryReverseConverter
@@ -19,10 +19,10 @@ class CountryNameConverter(CountryReverseConverter):
         self.codes = set()
         self.to_name = {}
         self.from_name = CaseInsensitiveDict()
-        for country in COUNTRY_MATRIX:
-            self.codes.add(country.name)
-            self.to_name[country.alpha2] = country.name
-            self.from_name[country.name] = country.alpha2
+        for iso_country in country.COUNTRY_MATRIX:
+            self.codes.add(iso_country.name)
+            self.to_name[iso_country.alpha2] = iso_country.name
+            self.from_name[iso_country.name] = iso_country.alpha2
 
     def convert(self, alpha2: str) -> str:
         if alpha2 not in self.to_name:
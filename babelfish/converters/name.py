@@ -6,15 +6,18 @@ from __future__ import annotations
 
 from typing import ClassVar
 
-from babelfish.language import LANGUAGE_MATRIX
+from babelfish import language
+from babelfish.cache import LazyClassAttribute
 
 from . import LanguageEquivalenceConverter
 
 
+def _symbols() -> dict[str, str]:
+    columns = language.LANGUAGE_COLUMNS
+    return {alpha3: name for alpha3, name in zip(columns.alpha3, columns.name) if name}
+
+
 class NameConverter(LanguageEquivalenceConverter):
     CASE_SENSITIVE: ClassVar[bool] = False
-    SYMBOLS: ClassVar[dict[str, str]] = {}
-
-    for iso_language in LANGUAGE_MATRIX:
-        if iso_language.name:
-            SYMBOLS[iso_language.alpha3] = iso_language.name
+    SYMBOLS = LazyClassAttribute(_symbols)
+    SHARED_TABLES: ClassVar[bool] = True
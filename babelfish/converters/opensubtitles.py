@@ -4,54 +4,96 @@
 #
 from __future__ import annotations
 
-from typing import cast
+from functools import lru_cache
+from typing import Any
 
-from babelfish.exceptions import LanguageReverseError
-from babelfish.language import language_converters
+from babelfish import language, snapshot
+from babelfish.exceptions import LanguageConvertError, LanguageReverseError
 
 from . import CaseInsensitiveDict, LanguageReverseConverter
 
+#: OpenSubtitles codes other than alpha3b codes, to the alpha3 and country codes of their language
+SPECIAL_CODES: dict[str, tuple[str, str | None]] = {
+    'pob': ('por', 'BR'),
+    'ell': ('ell', None),
+    'scc': ('srp', None),
+    # Montenegrin is unofficially accepted as Serbian from Montenegro
+    'mne': ('srp', 'ME'),
+    # used by the API but missing from the data file
+    'zht': ('zho', 'TW'),
+}
+
+
+@lru_cache(maxsize=None)
+def _tables() -> tuple[Any, ...]:
+    columns = language.LANGUAGE_COLUMNS
+    opensubtitles_codes, iso639_codes, _, upload_enabled, web_enabled = snapshot.load('opensubtitles_languages.txt')
+
+    to_opensubtitles: dict[tuple[str, str | None], str] = {
+        (alpha3, None): alpha3b for alpha3, alpha3b in zip(columns.alpha3, columns.alpha3b) if alpha3b
+    }
+    from_opensubtitles: dict[str, tuple[str, str | None, str | None]] = {
+        alpha2: (alpha3, None, None) for alpha3, alpha2 in zip(columns.alpha3, columns.alpha2) if alpha2
+    }
+    from_opensubtitles.update((alpha3b, (alpha3, None, None)) for (alpha3, _), alpha3b in to_opensubtitles.items())
+    for code, (alpha3, country) in SPECIAL_CODES.items():
+        to_opensubtitles[alpha3, country] = code
+        from_opensubtitles[code] = (alpha3, country, None)
+    # 2-letter codes of the data file not in ISO-639-1, e.g. pb for pob
+    for code, iso639 in zip(opensubtitles_codes, iso639_codes):
+        if iso639 and code in from_opensubtitles:
+            from_opensubtitles.setdefault(iso639, from_opensubtitles[code])
+
+    return (
+        set(from_opensubtitles),
+        to_opensubtitles,
+        CaseInsensitiveDict(from_opensubtitles),
+        frozenset(code for code, enabled in zip(opensubtitles_codes, upload_enabled) if enabled == '1'),
+        frozenset(code for code, enabled in zip(opensubtitles_codes, web_enabled) if enabled == '1'),
+    )
+
 
 class OpenSubtitlesConverter(LanguageReverseConverter):
+    """Converter of the OpenSubtitles codes, the alpha3b codes along with :data:`SPECIAL_CODES`.
+
+    Codes are reversed case-insensitively, 2-letter codes included. Tables are built once from
+    the OpenSubtitles languages data file and shared between the instances.
+
+    """
+
     codes: set[str]
     to_opensubtitles: dict[tuple[str, str | None], str]
-    from_opensubtitles: CaseInsensitiveDict[tuple[str, str | None]]
+    from_opensubtitles: CaseInsensitiveDict[tuple[str, str | None, str | None]]
+
+    #: Codes of the languages subtitles can be uploaded in
+    upload_enabled: frozenset[str]
+
+    #: Codes of the languages of the web interface
+    web_enabled: frozenset[str]
 
     def __init__(self) -> None:
-        self.alpha3b_converter = language_converters['alpha3b']
-        self.alpha2_converter = language_converters['alpha2']
-        self.to_opensubtitles = {
-            ('por', 'BR'): 'pob',
-            ('gre', None): 'ell',
-            ('srp', None): 'scc',
-            ('srp', 'ME'): 'mne',
-            ('chi', 'TW'): 'zht',
-        }
-        self.from_opensubtitles = CaseInsensitiveDict(
-            {
-                'pob': ('por', 'BR'),
-                'pb': ('por', 'BR'),
-                'ell': ('ell', None),
-                'scc': ('srp', None),
-                'mne': ('srp', 'ME'),
-                'zht': ('zho', 'TW'),
-            },
-        )
-        self.codes = self.alpha2_converter.codes | self.alpha3b_converter.codes | set(self.from_opensubtitles.keys())
+        self.codes, self.to_opensubtitles, self.from_opensubtitles, self.upload_enabled, self.web_enabled = _tables()
 
     def convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str:
-        alpha3b = self.alpha3b_converter.convert(alpha3, country, script)
-        if (alpha3b, country) in self.to_opensubtitles:
-            return self.to_opensubtitles[(alpha3b, country)]
-        return alpha3b
+        code = self.to_opensubtitles.get((alpha3, country))
+        if code is None:
+            code = self.to_opensubtitles.get((alpha3, None))
+            if code is None:
+                raise LanguageConvertError(alpha3, country, script)
+        return code
+
+    def try_convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str | None:
+        code = self.to_opensubtitles.get((alpha3, country))
+        if code is None:
+            # only a few codes are specific to a country
+            code = self.to_opensubtitles.get((alpha3, None))
+        return code
 
     def reverse(self, code: str) -> tuple[str, str | None, str | None]:
-        if code in self.from_opensubtitles:
-            return (*self.from_opensubtitles[code], None)
-        for conv in [self.alpha3b_converter, self.alpha2_converter]:
-            conv = cast(LanguageReverseConverter, conv)
-            try:
-                return conv.reverse(code)
-            except LanguageReverseError:
-                pass
-        raise LanguageReverseError(code)
+        language = self.from_opensubtitles.get(code)
+        if language is None:
+            raise LanguageReverseError(code)
+        return language  # type: ignore[no-any-return]
+
+    def try_reverse(self, code: str) -> tuple[str, str | None, str | None] | None:
+        return self.from_opensubtitles.get(code)  # type: ignore[no-any-return]
@@ -0,0 +1,230 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Converters backed by mapping files.
+
+A mapping file lists codes with the alpha3, country and script codes of their language,
+as TSV (``.tsv``, ``.tab`` or ``.txt``), CSV (``.csv``) with a header row, or JSON (``.json``)
+as a list of objects::
+
+    code	alpha3	country	script
+    pob	por	BR
+    pb	por	BR
+    zht	zho	TW	Hant
+
+The ``country`` and ``script`` columns are optional. Several codes may designate the same
+language, the first one being used for conversion.
+
+Files are parsed and validated once, then compiled into a :mod:`marshal` cache in the :func:`cache_dir`,
+named after the hash of their format, their content and the data tables, so that large tables load
+in milliseconds.
+
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import marshal
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+from babelfish import country, language, script, serialization
+from babelfish.exceptions import LanguageConvertError, LanguageReverseError
+
+from . import CaseInsensitiveDict, LanguageReverseConverter
+
+#: Version of the compiled tables, compiled tables with another version are ignored
+COMPILED_VERSION = 1
+
+#: Version of the :mod:`marshal` format, readable by all supported python versions
+MARSHAL_VERSION = 4
+
+#: Columns of a mapping file
+COLUMNS = ('code', 'alpha3', 'country', 'script')
+
+Codes = Tuple[str, Optional[str], Optional[str]]
+Tables = Tuple[Dict[Codes, str], Dict[str, Codes]]
+
+
+def cache_dir() -> Path:
+    """Directory of the compiled tables: ``$BABELFISH_CACHE_DIR``, else ``babelfish`` in ``$XDG_CACHE_HOME``
+    or ``~/.cache``.
+
+    :rtype: :class:`~pathlib.Path`
+
+    """
+    directory = os.environ.get('BABELFISH_CACHE_DIR')
+    if directory:
+        return Path(directory)
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'babelfish'
+
+
+def read_rows(data: bytes, suffix: str) -> list[dict[str, Any]]:
+    """Read the rows of a mapping file.
+
+    :param bytes data: content of the mapping file
+    :param string suffix: suffix of the mapping file, giving its format
+    :return: the rows as dicts by column
+    :rtype: list
+    :raise: ValueError if the format is not supported or the file cannot be read
+
+    """
+    if suffix == '.json':
+        rows = json.loads(data)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            msg = 'JSON mapping files must contain a list of objects'
+            raise ValueError(msg)
+        return rows
+    if suffix in ('.tsv', '.tab', '.txt', '.csv'):
+        text = io.StringIO(data.decode('utf-8-sig'), newline='')
+        return list(csv.DictReader(text, delimiter=',' if suffix == '.csv' else '\t'))
+    msg = f'Unsupported mapping file format {suffix!r}'
+    raise ValueError(msg)
+
+
+def compile_rows(rows: list[dict[str, Any]]) -> Tables:
+    """Validate the rows of a mapping file and compile them into conversion tables.
+
+    :param list rows: the rows as dicts by column
+    :return: the codes by alpha3, country and script codes, and the reverse
+    :rtype: tuple
+    :raise: ValueError if a row is invalid or a code designates several languages
+
+    """
+    languages = language.LANGUAGES
+    countries = country.COUNTRIES
+    scripts = script.SCRIPTS
+    to_code: dict[Codes, str] = {}
+    from_code: dict[str, Codes] = {}
+    for number, row in enumerate(rows, 1):
+        values = [row.get(column) or None for column in COLUMNS]
+        if not all(value is None or isinstance(value, str) for value in values):
+            msg = f'Row {number}: codes must be strings, got {values!r}'
+            raise ValueError(msg)
+        code, alpha3, country_code, script_code = values
+        if code is None or alpha3 not in languages:
+            msg = f'Row {number}: missing code or invalid alpha3 {alpha3!r}'
+            raise ValueError(msg)
+        if (country_code is not None and country_code not in countries) or (
+            script_code is not None and script_code not in scripts
+        ):
+            msg = f'Row {number}: invalid country {country_code!r} or script {script_code!r}'
+            raise ValueError(msg)
+        codes = (alpha3, country_code, script_code)
+        if from_code.setdefault(code, codes) != codes:
+            msg = f'Row {number}: {code!r} already designates {from_code[code]!r}'
+            raise ValueError(msg)
+        to_code.setdefault(codes, code)
+    return to_code, from_code
+
+
+def load_tables(path: str | os.PathLike[str], *, cache: bool = True) -> Tables:
+    """Load the conversion tables of a mapping file, compiling them unless cached.
+
+    The compiled tables are cached in the :func:`cache_dir` when it is writable.
+
+    :param path: path of the mapping file
+    :param bool cache: whether to use the compiled tables cache
+    :return: the codes by alpha3, country and script codes, and the reverse
+    :rtype: tuple
+    :raise: ValueError if the mapping file is invalid
+
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    suffix = path.suffix.lower()
+    compiled = None
+    if cache:
+        # the same content parses differently in another format, and is validated against the data tables
+        digest = hashlib.sha256(f'{COMPILED_VERSION}{suffix}{serialization.fingerprint()}\n'.encode() + data)
+        compiled = cache_dir() / f'table-{COMPILED_VERSION}-{digest.hexdigest()}.marshal'
+        try:
+            # compiled by load_tables, found by the hash of the mapping file
+            version, tables = marshal.loads(compiled.read_bytes())  # noqa: S302
+            if version == COMPILED_VERSION:
+                return tables  # type: ignore[no-any-return]
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+    tables = compile_rows(read_rows(data, suffix))
+    if compiled is not None:
+        try:
+            compiled.parent.mkdir(parents=True, exist_ok=True)
+            # written aside then renamed, so that concurrent writers never read a partial file
+            partial = tempfile.NamedTemporaryFile(dir=compiled.parent, prefix=compiled.name, delete=False)  # noqa: SIM115
+            try:
+                with partial:
+                    partial.write(marshal.dumps((COMPILED_VERSION, tables), MARSHAL_VERSION))
+                os.replace(partial.name, compiled)
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(partial.name)
+                raise
+        except OSError:
+            pass
+    return tables
+
+
+class TableConverter(LanguageReverseConverter):
+    """Converter backed by a mapping file, see :mod:`babelfish.converters.table`.
+
+    Subclass it with the :attr:`PATH` of the mapping file to register it with the entry point
+    syntax, i.e. ``language_converters.register('myprovider = mypackage.converters:MyConverter')``,
+    or load an instance with the path, i.e. ``language_converters['myprovider'] = TableConverter(path)``.
+
+    Conversion looks up the language with its country and script, then without its script and
+    then without its country. Reverse conversion is case-insensitive unless :attr:`CASE_SENSITIVE`.
+
+    :param path: path of the mapping file, defaults to :attr:`PATH`
+
+    """
+
+    #: Path of the mapping file
+    PATH: ClassVar[str | os.PathLike[str] | None] = None
+
+    #: Whether reverse conversion is case-sensitive
+    CASE_SENSITIVE: ClassVar[bool] = False
+
+    codes: set[str]
+    to_code: dict[Codes, str]
+    from_code: dict[str, Codes] | CaseInsensitiveDict[Codes]
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        if path is None:
+            path = self.PATH
+        if path is None:
+            msg = f'{self.__class__.__name__} has no mapping file'
+            raise ValueError(msg)
+        self.to_code, from_code = load_tables(path)
+        self.from_code = from_code if self.CASE_SENSITIVE else CaseInsensitiveDict(from_code)
+        self.codes = set(from_code)
+
+    def convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str:
+        code = self.try_convert(alpha3, country, script)
+        if code is None:
+            raise LanguageConvertError(alpha3, country, script)
+        return code
+
+    def try_convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str | None:
+        to_code = self.to_code
+        code = to_code.get((alpha3, country, script))
+        if code is None and script is not None:
+            code = to_code.get((alpha3, country, None))
+        if code is None and country is not None:
+            code = to_code.get((alpha3, None, None))
+        return code
+
+    def reverse(self, code: str) -> tuple[str, str | None, str | None]:
+        language = self.from_code.get(code)
+        if language is None:
+            raise LanguageReverseError(code)
+        return language
+
+    def try_reverse(self, code: str) -> tuple[str, str | None, str | None] | None:
+        return self.from_code.get(code)
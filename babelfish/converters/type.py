@@ -6,12 +6,22 @@ from __future__ import annotations
 
 from typing import ClassVar
 
+from babelfish import language
+from babelfish.cache import LazyClassAttribute
 from babelfish.exceptions import LanguageConvertError
-from babelfish.language import LANGUAGE_MATRIX
 
 from . import LanguageConverter
 
 
+def _symbols() -> dict[str, str]:
+    columns = language.LANGUAGE_COLUMNS
+    return dict(zip(columns.alpha3, columns.type))
+
+
+def _codes() -> set[str]:
+    return set(language.LANGUAGE_COLUMNS.type)
+
+
 class LanguageTypeConverter(LanguageConverter):
     FULLNAME: ClassVar[dict[str, str]] = {
         'A': 'ancient',
@@ -21,10 +31,8 @@ class LanguageTypeConverter(LanguageConverter):
         'L': 'living',
         'S': 'special',
     }
-    SYMBOLS: ClassVar[dict[str, str]] = {}
-    for iso_language in LANGUAGE_MATRIX:
-        SYMBOLS[iso_language.alpha3] = iso_language.type
-    codes: ClassVar[set[str]] = set(SYMBOLS.values())
+    SYMBOLS = LazyClassAttribute(_symbols)
+    codes = LazyClassAttribute(_codes)
 
     def convert(self, alpha3: str, country: str | None = None, script: str | None = None) -> str:
         if self.SYMBOLS[alpha3] in self.FULLNAME:
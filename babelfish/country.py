@@ -5,29 +5,41 @@
 from __future__ import annotations
 
 from collections import namedtuple
+from contextlib import suppress
 from dataclasses import dataclass
-from functools import partial
+from functools import lru_cache
+from types import MethodType
 from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
-from .compat import resource_stream
+from . import snapshot
+from .cache import AttributeCache, InstanceCache, InterningMeta, LazyAttributes
 from .converters import ConverterManager, CountryReverseConverter
 
 #: The namedtuple used in the :data:`COUNTRY_MATRIX`
 IsoCountry = namedtuple('IsoCountry', ['name', 'alpha2'])
 
 #: Country code to country name mapping
-COUNTRIES: dict[str, str] = {}
+COUNTRIES: dict[str, str]
 
 #: List of countries in the ISO-3166-1 as namedtuple of name, code
-COUNTRY_MATRIX: list[IsoCountry] = []
+COUNTRY_MATRIX: list[IsoCountry]
 
+#: Columns of the :data:`COUNTRY_MATRIX` as namedtuple of tuples, indexed like the matrix
+COUNTRY_COLUMNS: IsoCountry
 
-with resource_stream('babelfish', 'data/iso-3166-1.txt') as f:
-    f.readline()
-    for raw_line in f:
-        iso_country = IsoCountry(*raw_line.decode('utf-8').strip().split(';'))
-        COUNTRIES[iso_country.alpha2] = iso_country.name
-        COUNTRY_MATRIX.append(iso_country)
+#: Country code to index in the :data:`COUNTRY_MATRIX` mapping
+COUNTRY_INDEX: dict[str, int]
+
+#: Lazy loading of the module attributes above from the data file
+_data: LazyAttributes = LazyAttributes(
+    __name__,
+    COUNTRY_COLUMNS=lambda: IsoCountry._make(snapshot.load('iso-3166-1.txt')),
+    COUNTRY_INDEX=lambda: {alpha2: index for index, alpha2 in enumerate(_data('COUNTRY_COLUMNS').alpha2)},
+    COUNTRIES=lambda: dict(zip(_data('COUNTRY_COLUMNS').alpha2, _data('COUNTRY_COLUMNS').name)),
+    COUNTRY_MATRIX=lambda: list(map(IsoCountry._make, zip(*_data('COUNTRY_COLUMNS')))),
+)
+__getattr__ = _data
 
 
 class CountryConverterManager(ConverterManager[CountryReverseConverter]):
@@ -39,17 +51,56 @@ class CountryConverterManager(ConverterManager[CountryReverseConverter]):
 
 country_converters = CountryConverterManager()
 
+#: Converted values cached on :class:`Country` instances
+converted_countries = AttributeCache()
+country_converters.listeners.append(converted_countries.clear)
+
+
+@lru_cache(maxsize=1024)
+def _fromcode(cls: type[Country], converter: str, code: str) -> Country:
+    return cls(country_converters[converter].reverse(code))
+
+
+country_converters.listeners.append(_fromcode.cache_clear)
+
+#: Names of the from<converter> constructors created by :class:`CountryMeta`, by class
+_constructors: WeakKeyDictionary[type, set[str]] = WeakKeyDictionary()
+
+
+def _clear_constructors() -> None:
+    # converters may have been unloaded or unregistered, constructors are created again on access
+    for cls, names in list(_constructors.items()):
+        for name in names:
+            with suppress(AttributeError):
+                type.__delattr__(cls, name)
+    _constructors.clear()
 
-class CountryMeta(type):
+
+country_converters.listeners.append(_clear_constructors)
+
+
+class CountryMeta(InterningMeta):
     """The :class:`Country` metaclass.
 
-    Dynamically redirect :meth:`Country.frommycode` to :meth:`Country.fromcode` with the ``mycode`` `converter`
+    Dynamically redirect :meth:`Country.frommycode` to :meth:`Country.fromcode` with the ``mycode`` `converter`,
+    the redirection being created once and stored on the class when the converter is available,
+    until converters change
 
     """
 
     def __getattr__(cls, name: str) -> Any:
         if name.startswith('from'):
-            return partial(cls.fromcode, converter=name[4:])
+            converter = name[4:]
+
+            def fromconverter(cls: Any, code: str) -> Any:
+                return cls.fromcode(code, converter)
+
+            if not country_converters.available(converter):
+                return MethodType(fromconverter, cls)
+            # found by the regular attribute lookup from now on, bound to subclasses too
+            type.__setattr__(cls, name, classmethod(fromconverter))
+            _constructors.setdefault(cls, set()).add(name)
+            return getattr(cls, name)
         return type.__getattribute__(cls, name)
 
 
@@ -59,30 +110,63 @@ class Country(metaclass=CountryMeta):
 
     A country is represented by a 2-letter code from the ISO-3166 standard
 
+    Equal countries share the same canonical instance, see :class:`~babelfish.cache.InstanceCache`
+
     :param string country: 2-letter ISO-3166 country code
 
     """
 
+    # instance dict is only allocated to cache converted values
+    __slots__ = ('__dict__', '__weakref__', '_hash', 'country')
+    _instances: ClassVar[InstanceCache[Country]] = InstanceCache(1024)
+
     #: ISO-3166 2-letter country code
     country: str
 
     def __post_init__(self) -> None:
-        if self.country not in COUNTRIES:
+        if self.country not in _data('COUNTRIES'):
             msg = f'{self.country!r} is not a valid country'
             raise ValueError(msg)
+        object.__setattr__(self, '_hash', hash((self.country,)))
 
     @classmethod
     def fromcode(cls, code: str, converter: str) -> Country:
         """Create a :class:`Country` by its `code` using `converter` to
         :meth:`~babelfish.converters.CountryReverseConverter.reverse` it.
 
+        Results are memoized in a bounded LRU cache, cleared when country converters change.
+
         :param string code: the code to reverse
         :param string converter: name of the :class:`~babelfish.converters.CountryReverseConverter` to use
         :return: the corresponding :class:`Country` instance
         :rtype: :class:`Country`
 
         """
-        return cls(country_converters[converter].reverse(code))
+        return _fromcode(cls, converter, code)
+
+    @classmethod
+    def from_id(cls, country_id: int) -> Country:
+        """Create a :class:`Country` from its id.
+
+        :param int country_id: the country id, see :meth:`to_id`
+        :return: the corresponding :class:`Country` instance
+        :rtype: :class:`Country`
+        :raise: ValueError if the country id is invalid
+
+        """
+        if not 0 <= country_id < len(_data('COUNTRY_COLUMNS').alpha2):
+            msg = f'{country_id!r} is not a valid country id'
+            raise ValueError(msg)
+        return cls(_data('COUNTRY_COLUMNS').alpha2[country_id])
+
+    def to_id(self) -> int:
+        """Small integer identifying the country, its index in the :data:`COUNTRY_MATRIX`.
+
+        :return: the country id
+        :rtype: int
+
+        """
+        return _data('COUNTRY_INDEX')[self.country]  # type: ignore[no-any-return]
 
     @property
     def alpha2(self) -> str:
@@ -95,9 +179,24 @@ class Country(metaclass=CountryMeta):
             raise AttributeError
 
         try:
-            return country_converters[name].convert(self.alpha2)
+            value = country_converters[name].convert(self.alpha2)
         except KeyError as err:
             raise AttributeError(name) from err
+        converted_countries.set(self, name, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.country == other.country  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return self._hash  # type: ignore[return-value]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.country,)
 
     def __repr__(self) -> str:
         return f'<Country [{self}]>'
@@ -4,6 +4,8 @@
 #
 from __future__ import annotations
 
+from typing import Any
+
 
 class Error(Exception):
     """Base class for all exceptions in babelfish."""
@@ -56,6 +58,22 @@ class LanguageReverseError(LanguageError):
         return repr(self.code)
 
 
+class AmbiguousLanguageError(LanguageReverseError):
+    """Exception raised when a code designates several languages, see :meth:`~babelfish.language.Language.fromany`.
+
+    :param string code: the ambiguous code
+    :param list candidates: the languages designated by the code, best first
+
+    """
+
+    def __init__(self, code: str, candidates: list[Any]) -> None:
+        super().__init__(code)
+        self.candidates = candidates
+
+    def __str__(self) -> str:
+        return f'{self.code!r} designates {", ".join(map(str, self.candidates))}'
+
+
 class CountryError(Error, AttributeError):
     """Base class for all country exceptions in babelfish."""
 
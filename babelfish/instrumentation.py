@@ -0,0 +1,267 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Usage counters of the converters.
+
+Instrumentation is disabled by default and costs nothing then. Once enabled, the methods of
+the loaded converters are wrapped to count their calls and their misses, i.e. the conversions
+raising an error or returning ``None``, and the loading time of the converters is recorded.
+Methods calling other methods of the same converter, such as :meth:`try_reverse` calling
+:meth:`reverse`, are counted once, as the outermost call::
+
+    >>> from babelfish import instrumentation
+    >>> instrumentation.enable()
+    >>> Language.fromopensubtitles('pob').name
+    'Portuguese'
+    >>> instrumentation.stats()['language_converters']['opensubtitles']['calls']
+    {'reverse': 1}
+    >>> instrumentation.disable()
+
+A callback receives each event as it happens, with the event type (``call``, ``miss`` or
+``load``), the qualified name of the converter such as ``language_converters.name`` and a detail:
+the name of the method for calls and misses, the loading time in seconds for loads.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable
+
+from . import country, language
+from .country import Country, country_converters
+from .exceptions import CountryError, LanguageError
+from .language import Language, language_converters, parse_ietf
+from .script import Script
+
+if TYPE_CHECKING:
+    from .converters import ConverterManager
+
+#: Instrumented methods of the converters
+METHODS = (
+    'convert',
+    'reverse',
+    'try_convert',
+    'try_reverse',
+    'convert_many',
+    'reverse_many',
+    'convert_ids',
+)
+
+#: Instrumented converter managers
+MANAGERS: list[ConverterManager[Any]] = [language_converters, country_converters]
+
+#: Callback receiving the event type, the qualified name of the converter and a detail
+Callback = Callable[[str, str, Any], None]
+
+
+def qualified_name(manager: ConverterManager[Any], name: str) -> str:
+    """Name of a converter qualified by the entry point of its manager, e.g. ``language_converters.name``."""
+    return f'{manager.entry_point.rpartition(".")[2]}.{name}'
+
+
+class Instrumentation:
+    """Counters of the calls, misses and loading times of converters.
+
+    :param callback: function called on each event, if any
+
+    """
+
+    callback: Callback | None
+    calls: Counter[tuple[str, str]]
+    misses: Counter[tuple[str, str]]
+    load_seconds: dict[str, float]
+
+    def __init__(self, callback: Callback | None = None) -> None:
+        self.callback = callback
+
+        #: Number of calls by qualified converter name and method
+        self.calls = Counter()
+
+        #: Number of misses by qualified converter name and method
+        self.misses = Counter()
+
+        #: Loading time in seconds by qualified converter name
+        self.load_seconds = {}
+
+        #: Instrumented converters by id with the names of their wrapped methods
+        self._wrapped: dict[int, tuple[Any, list[str]]] = {}
+        self._lock = threading.Lock()
+
+        #: Qualified names of the converters with a method being called, by thread
+        self._calling = threading.local()
+
+    def record(self, event: str, qualified: str, detail: Any) -> None:
+        """Record an event and pass it to the callback."""
+        with self._lock:
+            if event == 'call':
+                self.calls[qualified, detail] += 1
+            elif event == 'miss':
+                self.misses[qualified, detail] += 1
+            elif event == 'load':
+                self.load_seconds[qualified] = detail
+        if self.callback is not None:
+            self.callback(event, qualified, detail)
+
+    def instrument(self, qualified: str, converter: Any) -> None:
+        """Wrap the methods of a converter to count their calls and misses."""
+        if id(converter) in self._wrapped:
+            return
+        names = [name for name in METHODS if callable(getattr(converter, name, None))]
+        for name in names:
+            setattr(converter, name, self._wrap(qualified, name, getattr(converter, name)))
+        self._wrapped[id(converter)] = (converter, names)
+
+    def uninstrument(self, converter: Any) -> None:
+        """Restore the methods of a converter."""
+        _, names = self._wrapped.pop(id(converter), (None, []))
+        for name in names:
+            vars(converter).pop(name, None)
+
+    def loaded(self, manager: ConverterManager[Any], name: str, converter: Any, seconds: float | None = None) -> None:
+        """Instrument a converter loaded by a manager, in `seconds` when known."""
+        qualified = qualified_name(manager, name)
+        if seconds is not None:
+            self.record('load', qualified, seconds)
+        self.instrument(qualified, converter)
+
+    def unloaded(self, converter: Any) -> None:
+        """Restore a converter unloaded from a manager."""
+        self.uninstrument(converter)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the counters.
+
+        :return: calls, misses and loading time by converter name, grouped by manager, and cache statistics
+        :rtype: dict
+
+        """
+        stats: dict[str, Any] = {}
+        with self._lock:
+            events = [('calls', key, count) for key, count in self.calls.items()]
+            events += [('misses', key, count) for key, count in self.misses.items()]
+            load_seconds = dict(self.load_seconds)
+        for kind, (qualified, method), count in events:
+            converter_stats(stats, qualified)[kind][method] = count
+        for qualified, seconds in load_seconds.items():
+            converter_stats(stats, qualified)['load_seconds'] = seconds
+        stats['caches'] = cache_stats()
+        return stats
+
+    def _wrap(self, qualified: str, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        record = self.record
+        calling = self._calling
+        try_method = name.startswith('try_')
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            converters: set[str] = calling.__dict__.setdefault('converters', set())
+            # called by another method of the converter, counted by the outermost call
+            if qualified in converters:
+                return method(*args, **kwargs)
+            converters.add(qualified)
+            try:
+                record('call', qualified, name)
+                try:
+                    result = method(*args, **kwargs)
+                except (LanguageError, CountryError):
+                    record('miss', qualified, name)
+                    raise
+                if try_method and result is None:
+                    record('miss', qualified, name)
+                return result
+            finally:
+                converters.discard(qualified)
+
+        wrapper.__wrapped__ = method  # type: ignore[attr-defined]
+        return wrapper
+
+
+def converter_stats(stats: dict[str, Any], qualified: str) -> dict[str, Any]:
+    """Statistics of a converter in `stats`, created if needed."""
+    manager, _, name = qualified.partition('.')
+    return stats.setdefault(manager, {}).setdefault(name, {'calls': {}, 'misses': {}, 'load_seconds': None})
+
+
+def cache_stats() -> dict[str, Any]:
+    """Statistics of the caches, collected whether instrumentation is enabled or not."""
+    return {
+        'parse_ietf': lru_cache_stats(parse_ietf),
+        'language_fromcode': lru_cache_stats(language._fromcode),
+        'language_fromany': lru_cache_stats(language._fromany),
+        'country_fromcode': lru_cache_stats(country._fromcode),
+        'languages': len(Language._instances),
+        'countries': len(Country._instances),
+        'scripts': len(Script._instances),
+    }
+
+
+def lru_cache_stats(function: Any) -> dict[str, Any]:
+    """Statistics of the :func:`~functools.lru_cache` of a function."""
+    info = function.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / lookups if lookups else None,
+        'size': info.currsize,
+    }
+
+
+#: The enabled instrumentation, if any
+_instrumentation: Instrumentation | None = None
+_lock = threading.Lock()
+
+
+def enable(callback: Callback | None = None) -> Instrumentation:
+    """Enable the instrumentation of the converters, replacing the enabled one if any.
+
+    :param callback: function called on each event, if any
+    :return: the enabled instrumentation
+    :rtype: :class:`Instrumentation`
+
+    """
+    global _instrumentation
+    with _lock:
+        _disable()
+        _instrumentation = Instrumentation(callback)
+        for manager in MANAGERS:
+            with manager._lock:
+                manager.instrumentation = _instrumentation
+                for name, converter in manager.converters.items():
+                    _instrumentation.instrument(qualified_name(manager, name), converter)
+            # values converted before are cached and would not be counted
+            manager.changed()
+        return _instrumentation
+
+
+def disable() -> None:
+    """Disable the instrumentation, restoring the converters."""
+    with _lock:
+        _disable()
+
+
+def _disable() -> None:
+    global _instrumentation
+    if _instrumentation is None:
+        return
+    for manager in MANAGERS:
+        with manager._lock:
+            manager.instrumentation = None
+    for converter, _ in list(_instrumentation._wrapped.values()):
+        _instrumentation.uninstrument(converter)
+    _instrumentation = None
+
+
+def stats() -> dict[str, Any]:
+    """Snapshot of the counters of the enabled instrumentation, see :meth:`Instrumentation.stats`.
+
+    :return: the counters, only cache statistics when instrumentation is disabled
+    :rtype: dict
+
+    """
+    instrumentation = _instrumentation
+    if instrumentation is None:
+        return {'caches': cache_stats()}
+    return instrumentation.stats()
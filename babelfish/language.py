@@ -5,32 +5,51 @@
 from __future__ import annotations
 
 from collections import namedtuple
+from contextlib import suppress
 from dataclasses import InitVar, dataclass
-from functools import partial
-from typing import Any, ClassVar
-
-from .compat import resource_stream
-from .converters import ConverterManager, LanguageReverseConverter
+from functools import lru_cache
+from types import MethodType
+from typing import Any, ClassVar, Iterable
+from weakref import WeakKeyDictionary
+
+from . import snapshot
+from .cache import AttributeCache, InstanceCache, InterningMeta, LazyAttributes
+from .converters import ConverterManager, LanguageReverseConverter, LanguageTranscoder, array_values
 from .country import Country
-from .exceptions import LanguageConvertError
+from .exceptions import AmbiguousLanguageError, LanguageReverseError
 from .script import Script
 
 #: The namedtuple used in the :data:`LANGUAGE_MATRIX`
 IsoLanguage = namedtuple('IsoLanguage', ['alpha3', 'alpha3b', 'alpha3t', 'alpha2', 'scope', 'type', 'name', 'comment'])
 
 #: Language code set
-LANGUAGES = set()
+LANGUAGES: set[str]
 
 #: List of languages in the ISO-639-3 as namedtuple of alpha3, alpha3b, alpha3t, alpha2, scope, type, name and comment
-LANGUAGE_MATRIX = []
+LANGUAGE_MATRIX: list[IsoLanguage]
+
+#: Columns of the :data:`LANGUAGE_MATRIX` as namedtuple of tuples, indexed like the matrix
+LANGUAGE_COLUMNS: IsoLanguage
+
+#: Language code to index in the :data:`LANGUAGE_MATRIX` mapping
+LANGUAGE_INDEX: dict[str, int]
 
+#: Lazy loading of the module attributes above from the data file
+_data: LazyAttributes = LazyAttributes(
+    __name__,
+    LANGUAGE_COLUMNS=lambda: IsoLanguage._make(snapshot.load('iso-639-3.tab')),
+    LANGUAGE_INDEX=lambda: {alpha3: index for index, alpha3 in enumerate(_data('LANGUAGE_COLUMNS').alpha3)},
+    LANGUAGES=lambda: set(_data('LANGUAGE_COLUMNS').alpha3),
+    LANGUAGE_MATRIX=lambda: list(map(IsoLanguage._make, zip(*_data('LANGUAGE_COLUMNS')))),
+)
+__getattr__ = _data
 
-with resource_stream('babelfish', 'data/iso-639-3.tab') as f:
-    f.readline()
-    for line in f:
-        iso_language = IsoLanguage(*line.decode('utf-8').split('\t'))
-        LANGUAGES.add(iso_language.alpha3)
-        LANGUAGE_MATRIX.append(iso_language)
+#: Bit offsets of the country and the script in a language id, see :meth:`Language.to_id`
+COUNTRY_ID_SHIFT = 14
+SCRIPT_ID_SHIFT = 23
+
+#: Bit mask of the language index in a language id
+LANGUAGE_ID_MASK = (1 << COUNTRY_ID_SHIFT) - 1
 
 
 class LanguageConverterManager(ConverterManager[LanguageReverseConverter]):
@@ -47,9 +66,188 @@ class LanguageConverterManager(ConverterManager[LanguageReverseConverter]):
         'opensubtitles = babelfish.converters.opensubtitles:OpenSubtitlesConverter',
     ]
 
+    def transcoder(self, source: str, target: str) -> LanguageTranscoder:
+        """Create a :class:`~babelfish.converters.LanguageTranscoder` between two converters.
+
+        The transcoder precomputes its translations, create it once and reuse it.
+
+        :param string source: name of the converter of the codes to translate
+        :param string target: name of the converter of the translated codes
+        :return: the transcoder
+        :rtype: :class:`~babelfish.converters.LanguageTranscoder`
+
+        """
+        return LanguageTranscoder(self[source], self[target])
+
 
 language_converters = LanguageConverterManager()
 
+#: Converted values cached on :class:`Language` instances
+converted_languages = AttributeCache()
+language_converters.listeners.append(converted_languages.clear)
+
+
+@lru_cache(maxsize=None)
+def _id_columns() -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    from .country import COUNTRY_COLUMNS
+    from .script import SCRIPT_COLUMNS
+
+    return _data('LANGUAGE_COLUMNS').alpha3, COUNTRY_COLUMNS.alpha2, SCRIPT_COLUMNS.code
+
+
+def split_id(language_id: int) -> tuple[str, str | None, str | None]:
+    """Split a language id into its alpha3, country and script codes.
+
+    :param int language_id: the language id, see :meth:`Language.to_id`
+    :return: the alpha3 ISO-639-3 language code, alpha2 ISO-3166-1 country code and ISO-15924 script code
+    :rtype: tuple
+    :raise: ValueError if the language id is invalid
+
+    """
+    if language_id < 0:
+        msg = f'{language_id!r} is not a valid language id'
+        raise ValueError(msg)
+    alpha3s, alpha2s, codes = _id_columns()
+    country_id = (language_id >> COUNTRY_ID_SHIFT) & ((1 << (SCRIPT_ID_SHIFT - COUNTRY_ID_SHIFT)) - 1)
+    script_id = language_id >> SCRIPT_ID_SHIFT
+    try:
+        alpha3 = alpha3s[language_id & LANGUAGE_ID_MASK]
+        country = alpha2s[country_id - 1] if country_id else None
+        script = codes[script_id - 1] if script_id else None
+    except IndexError as err:
+        msg = f'{language_id!r} is not a valid language id'
+        raise ValueError(msg) from err
+    return alpha3, country, script
+
+
+def _alphanum(subtag: str, min_length: int, max_length: int) -> bool:
+    return min_length <= len(subtag) <= max_length and subtag.isascii() and subtag.isalnum()
+
+
+@lru_cache(maxsize=4096)
+def parse_ietf(ietf: str) -> tuple[str, str | None, str | None]:
+    """Parse an IETF BCP 47 language tag into its alpha3, country and script codes.
+
+    The subtags are read in a single pass: language, extended language, script, region,
+    variants, extensions and private use. The region may also precede the script, as in
+    the string representation of :class:`Language`. An extended language replaces its
+    prefix, which must be a macrolanguage, e.g. ``zh-yue`` is ``yue``. Numeric UN M.49 regions designate areas without
+    an ISO-3166 code, e.g. ``419`` for Latin America, so they are ignored just like variants,
+    extensions and private use.
+
+    Results are memoized in a bounded LRU cache, cleared when language converters change.
+
+    :param string ietf: the ietf code
+    :return: the alpha3 ISO-639-3 language code, alpha2 ISO-3166-1 country code and ISO-15924 script code
+    :rtype: tuple
+    :raise: :class:`~babelfish.exceptions.LanguageReverseError` if the 2-letter language code is unknown
+    :raise: ValueError if the ietf code is malformed
+
+    """
+    subtags = ietf.split('-')
+    count = len(subtags)
+    language = subtags[0].lower()
+    if not 2 <= len(language) <= 3 or not language.isascii() or not language.isalpha():
+        msg = f'{ietf!r} is not a valid IETF language code'
+        raise ValueError(msg)
+    if len(language) == 2:
+        simple_language = language_converters['alpha2'].try_reverse(language)
+        if simple_language is None:
+            raise LanguageReverseError(language)
+        language = simple_language[0]
+    i = 1
+    if i < count and len(subtags[i]) == 3 and subtags[i].isascii() and subtags[i].isalpha():
+        # only macrolanguages have extended languages, e.g. not en-USA nor pt-BRA
+        extlang = subtags[i].lower()
+        index = _data('LANGUAGE_INDEX').get(language)
+        if index is None or _data('LANGUAGE_COLUMNS').scope[index] != 'M' or extlang not in _data('LANGUAGES'):
+            msg = f'{ietf!r} is not a valid IETF language code, {subtags[i]!r} is not an extended language'
+            raise ValueError(msg)
+        language = extlang
+        i += 1
+
+    # Script and region in any order
+    country: str | None = None
+    script: str | None = None
+    region = False
+    while i < count:
+        subtag = subtags[i]
+        if script is None and len(subtag) == 4 and subtag.isascii() and subtag.isalpha():
+            script = subtag.capitalize()
+        elif not region and len(subtag) == 2 and subtag.isascii() and subtag.isalpha():
+            country = subtag.upper()
+            region = True
+        elif not region and len(subtag) == 3 and subtag.isascii() and subtag.isdigit():
+            region = True
+        else:
+            break
+        i += 1
+
+    # Variants, extensions and private use
+    while i < count and (_alphanum(subtags[i], 5, 8) or (_alphanum(subtags[i], 4, 4) and subtags[i][0].isdigit())):
+        i += 1
+    while i < count and _alphanum(subtags[i], 1, 1):
+        private_use = subtags[i].lower() == 'x'
+        start = i + 1
+        end = start
+        while end < count and _alphanum(subtags[end], 1 if private_use else 2, 8):
+            end += 1
+        if end == start:  # singleton without subtags
+            break
+        i = end
+        if private_use:
+            break
+    if i < count:
+        msg = f'Wrong IETF format. Unmatched subtags: {subtags[i:]!r}'
+        raise ValueError(msg)
+
+    return language, country, script
+
+
+language_converters.listeners.append(parse_ietf.cache_clear)
+
+
+@lru_cache(maxsize=4096)
+def _fromcode(cls: type[Language], converter: str, code: str) -> Language:
+    return cls(*language_converters[converter].reverse(code))
+
+
+language_converters.listeners.append(_fromcode.cache_clear)
+
+#: Names of the from<converter> constructors created by :class:`LanguageMeta`, by class
+_constructors: WeakKeyDictionary[type, set[str]] = WeakKeyDictionary()
+
+
+def _clear_constructors() -> None:
+    # converters may have been unloaded or unregistered, constructors are created again on access
+    for cls, names in list(_constructors.items()):
+        for name in names:
+            with suppress(AttributeError):
+                type.__delattr__(cls, name)
+    _constructors.clear()
+
+
+language_converters.listeners.append(_clear_constructors)
+
+
+@lru_cache(maxsize=4096)
+def _fromany(cls: type[Language], code: str, *, strict: bool) -> Language:
+    from .aliases import NAME_CONVERTERS, candidates  # circular import
+
+    matches = candidates(code)
+    if not matches:
+        raise LanguageReverseError(code)
+    if strict and len(matches) > 1:
+        # a code which is also a name designates the code
+        names = matches[0][0] in NAME_CONVERTERS
+        ambiguous = [codes for source, codes in matches if (source in NAME_CONVERTERS) == names]
+        if len(ambiguous) > 1:
+            raise AmbiguousLanguageError(code, [cls(*codes) for codes in ambiguous])
+    return cls(*matches[0][1])
+
+
+language_converters.listeners.append(_fromany.cache_clear)
+
 
 def to_country(country: str | Country | None) -> Country | None:
     """Convert to Country or None."""
@@ -69,16 +267,28 @@ def to_script(script: str | Script | None) -> Script | None:
     return Script(script)
 
 
-class LanguageMeta(type):
+class LanguageMeta(InterningMeta):
     """The :class:`Language` metaclass.
 
-    Dynamically redirect :meth:`Language.frommycode` to :meth:`Language.fromcode` with the ``mycode`` `converter`
+    Dynamically redirect :meth:`Language.frommycode` to :meth:`Language.fromcode` with the ``mycode`` `converter`,
+    the redirection being created once and stored on the class when the converter is available,
+    until converters change
 
     """
 
     def __getattr__(cls, name: str) -> Any:
         if name.startswith('from'):
-            return partial(cls.fromcode, converter=name[4:])
+            converter = name[4:]
+
+            def fromconverter(cls: Any, code: str) -> Any:
+                return cls.fromcode(code, converter)
+
+            if not language_converters.available(converter):
+                return MethodType(fromconverter, cls)
+            # found by the regular attribute lookup from now on, bound to subclasses too
+            type.__setattr__(cls, name, classmethod(fromconverter))
+            _constructors.setdefault(cls, set()).add(name)
+            return getattr(cls, name)
         return type.__getattribute__(cls, name)
 
 
@@ -92,6 +302,8 @@ class Language(metaclass=LanguageMeta):
 
     The :class:`Language` is extensible with custom converters (see :ref:`custom_converters`)
 
+    Equal languages share the same canonical instance, see :class:`~babelfish.cache.InstanceCache`
+
     :param string language: the language as a 3-letter ISO-639-3 code
     :param country: the country (if any) as a 2-letter ISO-3166 code or :class:`~babelfish.country.Country` instance
     :type country: string or :class:`~babelfish.country.Country` or None
@@ -103,6 +315,10 @@ class Language(metaclass=LanguageMeta):
 
     """
 
+    # instance dict is only allocated to cache converted values
+    __slots__ = ('__dict__', '__weakref__', '_hash', '_id', 'country', 'language', 'script')
+    _instances: ClassVar[InstanceCache[Language]] = InstanceCache(4096)
+
     language: str
     country: Country | None
     script: Script | None
@@ -115,10 +331,11 @@ class Language(metaclass=LanguageMeta):
         script: str | Script | None = None,
         unknown: str | None = None,
     ) -> None:
-        if unknown is not None and language not in LANGUAGES:
+        languages = _data('LANGUAGES')
+        if unknown is not None and language not in languages:
             language = unknown
 
-        if language not in LANGUAGES:
+        if language not in languages:
             msg = f'{language!r} is not a valid language'
             raise ValueError(msg)
         country = to_country(country)
@@ -127,57 +344,130 @@ class Language(metaclass=LanguageMeta):
         object.__setattr__(self, 'language', language)
         object.__setattr__(self, 'country', country)
         object.__setattr__(self, 'script', script)
+        object.__setattr__(self, '_hash', hash((language, country, script)))
 
     @classmethod
     def fromcode(cls, code: str, converter: str) -> Language:
         """Create a :class:`Language` by its `code` using `converter` to
         :meth:`~babelfish.converters.LanguageReverseConverter.reverse` it.
 
+        Results are memoized in a bounded LRU cache, cleared when language converters change.
+
         :param string code: the code to reverse
         :param string converter: name of the :class:`~babelfish.converters.LanguageReverseConverter` to use
         :return: the corresponding :class:`Language` instance
         :rtype: :class:`Language`
 
         """
-        return cls(*language_converters[converter].reverse(code))
+        return _fromcode(cls, converter, code)
 
     @classmethod
     def fromietf(cls, ietf: str) -> Language:
-        """Create a :class:`Language` by from an IETF language code.
+        """Create a :class:`Language` by from an IETF language code, see :func:`parse_ietf`.
 
         :param string ietf: the ietf code
         :return: the corresponding :class:`Language` instance
         :rtype: :class:`Language`
 
         """
-        subtags = ietf.split('-')
-        # Parse language from the first subtags
-        language_subtag = subtags.pop(0).lower()
-        if len(language_subtag) == 2:
-            simple_language = cls.fromalpha2(language_subtag)
-            language_subtag = simple_language.alpha3
-
-        # Parse country and script from the rest of subtags
-        country_subtag: Country | None = None
-        script_subtag: Script | None = None
-        while subtags:
-            subtag = subtags.pop(0)
-            if len(subtag) == 2:
-                country_subtag = Country(subtag.upper())
-            else:
-                script_subtag = Script(subtag.capitalize())
-            if script_subtag is not None:
-                if subtags:
-                    msg = f'Wrong IETF format. Unmatched subtags: {subtags!r}'
-                    raise ValueError(msg)
-                break
-
-        return cls(language_subtag, country_subtag, script_subtag)
+        return cls(*parse_ietf(ietf))
+
+    @classmethod
+    def fromany(cls, code: str, *, strict: bool = False) -> Language:
+        """Create a :class:`Language` from a code in any format, e.g. ``en``, ``fre``, ``French``, ``pt_BR``,
+        ``zh-Hant-TW`` or the deprecated ``iw``, see :func:`~babelfish.aliases.candidates`.
+
+        Results are memoized in a bounded LRU cache, cleared when language converters change.
+
+        :param string code: the code
+        :param bool strict: whether to refuse codes designating several languages, codes taking
+            precedence over names
+        :return: the corresponding :class:`Language` instance, the first in priority order
+        :rtype: :class:`Language`
+        :raise: :class:`~babelfish.exceptions.LanguageReverseError` if the code is unknown
+        :raise: :class:`~babelfish.exceptions.AmbiguousLanguageError` if `strict` and the code designates
+            several languages
+        :raise: ValueError if the country or the script is invalid
+
+        """
+        return _fromany(cls, code, strict=strict)
+
+    @classmethod
+    def fromietf_many(cls, ietfs: Iterable[str], default: Any = None) -> list[Any]:
+        """Create many :class:`Language` from IETF language codes, each distinct code being parsed once.
+
+        :param ietfs: the ietf codes, as an iterable, a numpy or a pyarrow array
+        :param default: value for the ietf codes that could not be recognized
+        :return: the corresponding :class:`Language` instances, in the same order
+        :rtype: list
+
+        """
+        parsed: dict[str, Any] = {}
+        languages = []
+        for ietf in array_values(ietfs):
+            if ietf not in parsed:
+                try:
+                    parsed[ietf] = cls.fromietf(ietf)
+                except (ValueError, LanguageReverseError):
+                    parsed[ietf] = default
+            languages.append(parsed[ietf])
+        return languages
+
+    @classmethod
+    def from_id(cls, language_id: int) -> Language:
+        """Create a :class:`Language` from its id.
+
+        :param int language_id: the language id, see :meth:`to_id`
+        :return: the corresponding :class:`Language` instance
+        :rtype: :class:`Language`
+        :raise: ValueError if the language id is invalid
+
+        """
+        return cls(*split_id(language_id))
+
+    def to_id(self) -> int:
+        """Small integer identifying the language, its country and its script.
+
+        The index of the language in the :data:`LANGUAGE_MATRIX` is packed with the ids of the
+        country and of the script, plus one, or 0 when there is none. Ids are stable as long as
+        the data files do not change.
+
+        :return: the language id
+        :rtype: int
+
+        """
+        try:
+            return self._id  # type: ignore[return-value]
+        except AttributeError:
+            pass
+        language_id: int = _data('LANGUAGE_INDEX')[self.language]
+        if self.country is not None:
+            language_id |= (self.country.to_id() + 1) << COUNTRY_ID_SHIFT
+        if self.script is not None:
+            language_id |= (self.script.to_id() + 1) << SCRIPT_ID_SHIFT
+        object.__setattr__(self, '_id', language_id)
+        return language_id
 
     @property
     def alpha3(self) -> str:
         return self.language
 
+    @property
+    def ietf(self) -> str:
+        """IETF BCP 47 language tag, the inverse of :meth:`fromietf`.
+
+        Unlike the string representation, the script precedes the country as recommended by BCP 47.
+
+        """
+        country = self.country.alpha2 if self.country is not None else None
+        script = self.script.code if self.script is not None else None
+        ietf = language_converters['alpha2'].try_convert(self.alpha3, country, script) or self.alpha3
+        if self.script is not None:
+            ietf += '-' + self.script.code
+        if self.country is not None:
+            ietf += '-' + self.country.alpha2
+        return ietf
+
     def __getattr__(self, name: str) -> str:
         # Handle private attributes by raising AttributeError
         # so the class is pickable, see: https://stackoverflow.com/a/50888571
@@ -188,9 +478,34 @@ class Language(metaclass=LanguageMeta):
             alpha3 = self.alpha3
             country = self.country.alpha2 if self.country is not None else None
             script = self.script.code if self.script is not None else None
-            return language_converters[name].convert(alpha3, country, script)
+            value = language_converters[name].convert(alpha3, country, script)
         except KeyError as err:
             raise AttributeError(name) from err
+        converted_languages.set(self, name, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.language == other.language  # type: ignore[attr-defined]
+            and self.country == other.country  # type: ignore[attr-defined]
+            and self.script == other.script  # type: ignore[attr-defined]
+        )
+
+    def __hash__(self) -> int:
+        return self._hash  # type: ignore[return-value]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # codes rather than nested objects, without trailing None
+        if self.script is not None:
+            country = self.country.alpha2 if self.country is not None else None
+            return self.__class__, (self.language, country, self.script.code)
+        if self.country is not None:
+            return self.__class__, (self.language, self.country.alpha2)
+        return self.__class__, (self.language,)
 
     def __bool__(self) -> bool:
         return self.language != 'und'
@@ -201,10 +516,9 @@ class Language(metaclass=LanguageMeta):
         return f'<Language [{self}]>'
 
     def __str__(self) -> str:
-        try:
-            s = self.alpha2
-        except LanguageConvertError:
-            s = self.alpha3
+        country = self.country.alpha2 if self.country is not None else None
+        script = self.script.code if self.script is not None else None
+        s = language_converters['alpha2'].try_convert(self.alpha3, country, script) or self.alpha3
         if self.country is not None:
             s += '-' + str(self.country)
         if self.script is not None:
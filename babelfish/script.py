@@ -6,47 +6,84 @@ from __future__ import annotations
 
 from collections import namedtuple
 from dataclasses import dataclass
+from typing import Any, ClassVar
 
-from .compat import resource_stream
+from . import snapshot
+from .cache import InstanceCache, InterningMeta, LazyAttributes
 
 #: The namedtuple used in the :data:`SCRIPT_MATRIX`
 IsoScript = namedtuple('IsoScript', ['code', 'number', 'name', 'french_name', 'pva', 'date'])
 
 #: Script code to script name mapping
-SCRIPTS: dict[str, str] = {}
+SCRIPTS: dict[str, str]
 
 #: List of scripts in the ISO-15924 as namedtuple of code, number, name, french_name, pva and date
-SCRIPT_MATRIX: list[IsoScript] = []
+SCRIPT_MATRIX: list[IsoScript]
 
+#: Columns of the :data:`SCRIPT_MATRIX` as namedtuple of tuples, indexed like the matrix
+SCRIPT_COLUMNS: IsoScript
 
-with resource_stream('babelfish', 'data/iso15924-utf8-20131012.txt') as f:
-    f.readline()
-    for raw_line in f:
-        line = raw_line.decode('utf-8').strip()
-        if not line or line.startswith('#'):
-            continue
-        script = IsoScript._make(line.split(';'))
-        SCRIPT_MATRIX.append(script)
-        SCRIPTS[script.code] = script.name
+#: Script code to index in the :data:`SCRIPT_MATRIX` mapping
+SCRIPT_INDEX: dict[str, int]
+
+#: Lazy loading of the module attributes above from the data file
+_data: LazyAttributes = LazyAttributes(
+    __name__,
+    SCRIPT_COLUMNS=lambda: IsoScript._make(snapshot.load('iso15924-utf8-20131012.txt')),
+    SCRIPT_INDEX=lambda: {code: index for index, code in enumerate(_data('SCRIPT_COLUMNS').code)},
+    SCRIPTS=lambda: dict(zip(_data('SCRIPT_COLUMNS').code, _data('SCRIPT_COLUMNS').name)),
+    SCRIPT_MATRIX=lambda: list(map(IsoScript._make, zip(*_data('SCRIPT_COLUMNS')))),
+)
+__getattr__ = _data
 
 
 @dataclass(frozen=True)
-class Script:
+class Script(metaclass=InterningMeta):
     """A human writing system.
 
     A script is represented by a 4-letter code from the ISO-15924 standard
 
+    Equal scripts share the same canonical instance, see :class:`~babelfish.cache.InstanceCache`
+
     :param string script: 4-letter ISO-15924 script code
 
     """
 
+    __slots__ = ('__weakref__', '_hash', 'script')
+    _instances: ClassVar[InstanceCache[Script]] = InstanceCache(1024)
+
     #: ISO-15924 4-letter script code
     script: str
 
     def __post_init__(self) -> None:
-        if self.script not in SCRIPTS:
+        if self.script not in _data('SCRIPTS'):
             msg = f'{self.script!r} is not a valid script'
             raise ValueError(msg)
+        object.__setattr__(self, '_hash', hash((self.script,)))
+
+    @classmethod
+    def from_id(cls, script_id: int) -> Script:
+        """Create a :class:`Script` from its id.
+
+        :param int script_id: the script id, see :meth:`to_id`
+        :return: the corresponding :class:`Script` instance
+        :rtype: :class:`Script`
+        :raise: ValueError if the script id is invalid
+
+        """
+        if not 0 <= script_id < len(_data('SCRIPT_COLUMNS').code):
+            msg = f'{script_id!r} is not a valid script id'
+            raise ValueError(msg)
+        return cls(_data('SCRIPT_COLUMNS').code[script_id])
+
+    def to_id(self) -> int:
+        """Small integer identifying the script, its index in the :data:`SCRIPT_MATRIX`.
+
+        :return: the script id
+        :rtype: int
+
+        """
+        return _data('SCRIPT_INDEX')[self.script]  # type: ignore[no-any-return]
 
     @property
     def code(self) -> str:
@@ -55,7 +92,20 @@ class Script:
     @property
     def name(self) -> str:
         """English name of the script."""
-        return SCRIPTS[self.code]
+        return _data('SCRIPTS')[self.code]  # type: ignore[no-any-return]
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.script == other.script  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return self._hash  # type: ignore[attr-defined]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.script,)
 
     def __repr__(self) -> str:
         return f'<Script [{self}]>'
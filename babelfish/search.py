@@ -0,0 +1,316 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Search of languages, countries and scripts by name.
+
+Names are folded to lowercase without accents and split into words. A query matches a
+name when each of its words matches a word of the name, either exactly, as a prefix or
+within a small edit distance, so that partial and misspelled names typed in a search box
+are found::
+
+    >>> search_languages('portugese')
+    [<Language [pt]>, ...]
+
+The indexes are built on first use.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Generic, Iterable, TypeVar
+
+from . import country, language, script
+from .cache import LazyAttributes
+from .country import Country
+from .language import Language
+from .script import Script
+
+T = TypeVar('T')
+
+#: Cost of a query word matching the beginning of a word
+PREFIX_COST = 0.5
+
+_WORD = re.compile(r'\w+')
+_QUALIFIER = re.compile(r'(.*?)\s*\(([^()]*)\)\s*')
+
+
+def normalize(name: str) -> str:
+    """Fold the case of a name and strip its accents."""
+    decomposed = unicodedata.normalize('NFKD', name.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def split_words(name: str) -> list[str]:
+    """Split a name into normalized words."""
+    return _WORD.findall(normalize(name))
+
+
+def trigrams(word: str) -> set[str]:
+    """Set of the 3-letter sequences of a word padded with spaces."""
+    padded = f' {word} '
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def max_distance(word: str) -> int:
+    """Maximum edit distance tolerated for a query word."""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 5:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, maximum: int) -> int:
+    """Edit distance between two words, counting transpositions, up to `maximum` + 1."""
+    if abs(len(a) - len(b)) > maximum:
+        return maximum + 1
+    before: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current.append(distance)
+        if min(current) > maximum:
+            return maximum + 1
+        before, previous = previous, current
+    return min(previous[-1], maximum + 1)
+
+
+class NameIndex(Generic[T]):
+    """A search index of names.
+
+    Words of the names are kept sorted for prefix matching and indexed by trigrams to
+    find misspelled words. Exact matches of a name come first, then results are ranked
+    by the position of the first matched word, the total cost of the matched words, the
+    rank of the entry and the number of words of the name.
+
+    :param entries: names with their value and rank, a lower rank coming first on ties
+
+    """
+
+    names: list[str]
+    values: list[T]
+    keys: list[tuple[int, int]]
+    words: list[str]
+    postings: list[list[tuple[int, int]]]
+    trigrams: dict[str, list[int]]
+
+    def __init__(self, entries: Iterable[tuple[str, T, int]]) -> None:
+        self.names = []
+        self.values = []
+        self.keys = []
+        entry_words = []
+        for name, value, rank in entries:
+            name_words = split_words(name)
+            self.names.append(' '.join(name_words))
+            self.values.append(value)
+            self.keys.append((rank, len(name_words)))
+            entry_words.append(name_words)
+
+        #: Sorted words of the names, a word id is its index
+        self.words = sorted({word for name_words in entry_words for word in name_words})
+        word_ids = {word: word_id for word_id, word in enumerate(self.words)}
+
+        #: Entries and positions of the words, by word id
+        self.postings = [[] for _ in self.words]
+        for entry, name_words in enumerate(entry_words):
+            for position, word in enumerate(name_words):
+                self.postings[word_ids[word]].append((entry, position))
+
+        #: Word ids by trigram
+        self.trigrams = {}
+        for word_id, word in enumerate(self.words):
+            for trigram in trigrams(word):
+                self.trigrams.setdefault(trigram, []).append(word_id)
+
+    def match_word(self, query_word: str) -> dict[int, float]:
+        """Find the words matching a normalized query word.
+
+        :param string query_word: the query word
+        :return: the cost of the matching words, by word id
+        :rtype: dict
+
+        """
+        costs: dict[int, float] = {}
+        start = bisect_left(self.words, query_word)
+        for word_id in range(start, len(self.words)):
+            word = self.words[word_id]
+            if not word.startswith(query_word):
+                break
+            costs[word_id] = 0 if word == query_word else PREFIX_COST
+        maximum = max_distance(query_word)
+        if costs or not maximum:
+            return costs
+
+        # each edit changes at most 3 trigrams
+        query_trigrams = trigrams(query_word)
+        shared: dict[int, int] = {}
+        for trigram in query_trigrams:
+            for word_id in self.trigrams.get(trigram, ()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        minimum_shared = len(query_trigrams) - 3 * maximum
+        for word_id, count in shared.items():
+            if count < minimum_shared:
+                continue
+            word = self.words[word_id]
+            distance = min(
+                edit_distance(query_word, word, maximum),
+                edit_distance(query_word, word[: len(query_word)], maximum) + PREFIX_COST,
+            )
+            if distance <= maximum:
+                costs[word_id] = distance
+        return costs
+
+    def match(self, query: str) -> dict[int, tuple[float, int]]:
+        """Find the entries matching a query.
+
+        :param string query: the query
+        :return: the total cost and the position of the first matched word, by entry
+        :rtype: dict
+
+        """
+        matches: dict[int, tuple[float, int]] | None = None
+        for query_word in split_words(query):
+            word_matches: dict[int, tuple[float, int]] = {}
+            for word_id, cost in self.match_word(query_word).items():
+                for entry, position in self.postings[word_id]:
+                    if entry not in word_matches or (cost, position) < word_matches[entry]:
+                        word_matches[entry] = (cost, position)
+            if matches is None:
+                matches = word_matches
+            else:
+                matches = {
+                    entry: (cost + word_matches[entry][0], min(position, word_matches[entry][1]))
+                    for entry, (cost, position) in matches.items()
+                    if entry in word_matches
+                }
+            if not matches:
+                break
+        return matches or {}
+
+    def search(self, query: str, limit: int = 10) -> list[tuple[float, T]]:
+        """Search names matching a query.
+
+        :param string query: the query
+        :param int limit: maximum number of results
+        :return: the best results as cost and value, a cost of -1 being an exact match of the name
+        :rtype: list
+
+        """
+        matches = self.match(query)
+        name = ' '.join(split_words(query))
+
+        def key(entry: int) -> tuple[bool, int, float, tuple[int, int], int]:
+            cost, position = matches[entry]
+            return self.names[entry] != name, position, cost, self.keys[entry], entry
+
+        return [
+            (-1 if self.names[entry] == name else matches[entry][0], self.values[entry])
+            for entry in heapq.nsmallest(limit, matches, key=key)
+        ]
+
+
+def _language_rank(alpha2: str, language_type: str) -> int:
+    if alpha2:
+        return 0
+    if language_type == 'L':
+        return 1
+    return 2
+
+
+#: Index of the language names to alpha3 codes, languages with an alpha2 code and living languages first
+LANGUAGE_NAMES: NameIndex[str]
+
+#: Index of the country names to alpha2 codes
+COUNTRY_NAMES: NameIndex[str]
+
+#: Index of the script names to codes
+SCRIPT_NAMES: NameIndex[str]
+
+
+def _language_names() -> NameIndex[str]:
+    columns = language.LANGUAGE_COLUMNS
+    return NameIndex(
+        (name, alpha3, _language_rank(alpha2, language_type))
+        for alpha3, alpha2, language_type, name in zip(columns.alpha3, columns.alpha2, columns.type, columns.name)
+    )
+
+
+def _country_names() -> NameIndex[str]:
+    return NameIndex((iso_country.name, iso_country.alpha2, 0) for iso_country in country.COUNTRY_MATRIX)
+
+
+def _script_names() -> NameIndex[str]:
+    return NameIndex((iso_script.name, iso_script.code, 0) for iso_script in script.SCRIPT_MATRIX)
+
+
+#: Lazy loading of the indexes above
+_data = LazyAttributes(
+    __name__,
+    LANGUAGE_NAMES=_language_names,
+    COUNTRY_NAMES=_country_names,
+    SCRIPT_NAMES=_script_names,
+)
+__getattr__ = _data
+
+
+def search_countries(query: str, limit: int = 10) -> list[Country]:
+    """Search countries by name.
+
+    :param string query: the name, possibly partial or misspelled
+    :param int limit: maximum number of results
+    :return: the matching countries, best first
+    :rtype: list of :class:`~babelfish.country.Country`
+
+    """
+    return [Country(alpha2) for _, alpha2 in _data('COUNTRY_NAMES').search(query, limit)]
+
+
+def search_scripts(query: str, limit: int = 10) -> list[Script]:
+    """Search scripts by name.
+
+    :param string query: the name, possibly partial or misspelled
+    :param int limit: maximum number of results
+    :return: the matching scripts, best first
+    :rtype: list of :class:`~babelfish.script.Script`
+
+    """
+    return [Script(code) for _, code in _data('SCRIPT_NAMES').search(query, limit)]
+
+
+def search_languages(query: str, limit: int = 10) -> list[Language]:
+    """Search languages by name.
+
+    A qualifier in parentheses is searched among the countries and the scripts, e.g.
+    ``Portuguese (Brazil)`` or ``Chinese (Traditional)``. It is part of the language name
+    when it matches neither a country nor a script.
+
+    :param string query: the name, possibly partial or misspelled
+    :param int limit: maximum number of results
+    :return: the matching languages, best first
+    :rtype: list of :class:`~babelfish.language.Language`
+
+    """
+    qualifier_country = qualifier_script = None
+    match = _QUALIFIER.fullmatch(query)
+    if match is not None:
+        countries = _data('COUNTRY_NAMES').search(match.group(2), 1)
+        scripts = _data('SCRIPT_NAMES').search(match.group(2), 1)
+        if countries and countries[0][0] <= PREFIX_COST and (not scripts or countries[0][0] <= scripts[0][0]):
+            qualifier_country = countries[0][1]
+            query = match.group(1)
+        elif scripts and scripts[0][0] <= PREFIX_COST:
+            qualifier_script = scripts[0][1]
+            query = match.group(1)
+    return [
+        Language(alpha3, qualifier_country, qualifier_script)
+        for _, alpha3 in _data('LANGUAGE_NAMES').search(query, limit)
+    ]
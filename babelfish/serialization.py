@@ -0,0 +1,185 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Compact serialization of languages, countries and scripts.
+
+:func:`dumps` packs a list of languages into 4 bytes per language using their ids, see
+:meth:`~babelfish.language.Language.to_id`. Ids depend on the data tables so the payload
+carries a fingerprint of the tables and :func:`loads` refuses payloads from other tables.
+
+JSON and msgpack hooks encode languages as their IETF language tag, countries and scripts
+as their code, which are stable across versions::
+
+    >>> json.dumps([Language('por', 'BR')], default=json_default)
+    '[{"__language__": "pt-BR"}]'
+    >>> json.loads('[{"__language__": "pt-BR"}]', object_hook=json_object_hook)
+    [<Language [pt-BR]>]
+
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Iterable
+
+from . import country, language, script
+from .cache import InstanceCache
+from .country import Country
+from .language import Language
+from .script import Script
+
+#: Version of the :func:`dumps` format
+VERSION = 1
+
+#: Magic bytes, version, fingerprint and number of languages of :func:`dumps`
+HEADER = struct.Struct('<2sBII')
+MAGIC = b'BF'
+
+#: Packed id of a missing language
+NONE_ID = 0xFFFFFFFF
+
+_cached_id = attrgetter('_id')
+
+#: Languages recently loaded by id
+_loaded: InstanceCache[Language] = InstanceCache(4096)
+
+# array type code of unsigned 32-bit integers
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+
+#: msgpack extension type codes
+LANGUAGE_EXT_TYPE = 66
+COUNTRY_EXT_TYPE = 67
+SCRIPT_EXT_TYPE = 68
+
+
+@lru_cache(maxsize=None)
+def fingerprint() -> int:
+    """CRC32 of the codes in the data tables, which define the language ids."""
+    codes = (*language.LANGUAGE_COLUMNS.alpha3, *country.COUNTRY_COLUMNS.alpha2, *script.SCRIPT_COLUMNS.code)
+    return zlib.crc32('\n'.join(codes).encode('ascii'))
+
+
+def dumps(languages: Iterable[Language | None]) -> bytes:
+    """Serialize languages into compact bytes.
+
+    :param languages: the languages, ``None`` being allowed
+    :return: the serialized languages
+    :rtype: bytes
+
+    """
+    languages = list(languages)
+    try:
+        # ids are cached on the languages once computed
+        ids = list(map(_cached_id, languages))
+    except AttributeError:
+        ids = [NONE_ID if item is None else item.to_id() for item in languages]
+    packed = array(_UINT32, ids)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return HEADER.pack(MAGIC, VERSION, fingerprint(), len(ids)) + packed.tobytes()
+
+
+def loads(data: bytes | bytearray | memoryview) -> list[Language | None]:
+    """Deserialize languages serialized with :func:`dumps`.
+
+    :param data: the serialized languages, as a bytes-like object
+    :return: the languages
+    :rtype: list
+    :raise: ValueError if the data is invalid or was serialized with other data tables
+
+    """
+    try:
+        magic, version, data_fingerprint, count = HEADER.unpack_from(data)
+    except struct.error as err:
+        msg = 'Invalid serialized languages'
+        raise ValueError(msg) from err
+    if magic != MAGIC or version != VERSION or len(data) != HEADER.size + 4 * count:
+        msg = 'Invalid serialized languages'
+        raise ValueError(msg)
+    if data_fingerprint != fingerprint():
+        msg = 'Languages serialized with other data tables'
+        raise ValueError(msg)
+    # frombytes reads any bytes-like object, e.g. a memoryview, as 32-bit integers
+    ids = array(_UINT32)
+    ids.frombytes(data[HEADER.size :])
+    if sys.byteorder == 'big':
+        ids.byteswap()
+    languages: dict[int, Language | None] = {NONE_ID: None}
+    loaded = _loaded.lookups
+    for language_id in set(ids).difference(languages):
+        loaded_language = loaded.get(language_id)
+        if loaded_language is None:
+            loaded_language = _loaded.add(language_id, Language.from_id(language_id))
+        languages[language_id] = loaded_language
+    return list(map(languages.__getitem__, ids))
+
+
+def json_default(obj: Any) -> Any:
+    """Encode languages, countries and scripts, to be used as the `default` of :func:`json.dumps`.
+
+    :raise: TypeError if `obj` cannot be encoded
+
+    """
+    if isinstance(obj, Language):
+        return {'__language__': obj.ietf}
+    if isinstance(obj, Country):
+        return {'__country__': obj.alpha2}
+    if isinstance(obj, Script):
+        return {'__script__': obj.code}
+    msg = f'Object of type {obj.__class__.__name__} is not JSON serializable'
+    raise TypeError(msg)
+
+
+def json_object_hook(obj: dict[str, Any]) -> Any:
+    """Decode languages, countries and scripts, to be used as the `object_hook` of :func:`json.loads`."""
+    if len(obj) == 1:
+        if '__language__' in obj:
+            return Language.fromietf(obj['__language__'])
+        if '__country__' in obj:
+            return Country(obj['__country__'])
+        if '__script__' in obj:
+            return Script(obj['__script__'])
+    return obj
+
+
+def msgpack_default(obj: Any) -> Any:
+    """Encode languages, countries and scripts, to be used as the `default` of :func:`msgpack.packb`.
+
+    Requires msgpack.
+
+    :raise: TypeError if `obj` cannot be encoded
+
+    """
+    import msgpack  # optional dependency
+
+    if isinstance(obj, Language):
+        return msgpack.ExtType(LANGUAGE_EXT_TYPE, obj.ietf.encode('ascii'))
+    if isinstance(obj, Country):
+        return msgpack.ExtType(COUNTRY_EXT_TYPE, obj.alpha2.encode('ascii'))
+    if isinstance(obj, Script):
+        return msgpack.ExtType(SCRIPT_EXT_TYPE, obj.code.encode('ascii'))
+    msg = f'Object of type {obj.__class__.__name__} is not msgpack serializable'
+    raise TypeError(msg)
+
+
+def msgpack_ext_hook(code: int, data: bytes) -> Any:
+    """Decode languages, countries and scripts, to be used as the `ext_hook` of :func:`msgpack.unpackb`.
+
+    Requires msgpack.
+
+    """
+    if code == LANGUAGE_EXT_TYPE:
+        return Language.fromietf(data.decode('ascii'))
+    if code == COUNTRY_EXT_TYPE:
+        return Country(data.decode('ascii'))
+    if code == SCRIPT_EXT_TYPE:
+        return Script(data.decode('ascii'))
+    import msgpack  # optional dependency
+
+    return msgpack.ExtType(code, data)
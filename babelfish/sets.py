@@ -0,0 +1,397 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Immutable sets of languages and countries backed by bitmaps.
+
+Members are bits of an integer, at a fixed position derived from their index in the
+:data:`~babelfish.language.LANGUAGE_MATRIX` or the :data:`~babelfish.country.COUNTRY_MATRIX`,
+so that set operations work on whole machine words instead of hashing each member. Languages
+with a country or a script are kept aside by id::
+
+    >>> available = LanguageSet([Language('eng'), Language('fra'), Language('por', 'BR')])
+    >>> wanted = LanguageSet([Language('fra'), Language('por', 'BR'), Language('deu')])
+    >>> available & wanted
+    LanguageSet({fr, pt-BR})
+
+Bit positions depend on the data tables, like the ids of the members, so :meth:`BitmapSet.to_bytes`
+records a fingerprint of the tables which :meth:`BitmapSet.from_bytes` checks.
+
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+from typing import Any, ClassVar, Generic, Iterable, Iterator, TypeVar
+
+from . import country, language, serialization
+from .country import Country
+from .language import COUNTRY_ID_SHIFT, Language, split_id
+
+T = TypeVar('T')
+S = TypeVar('S', bound='BitmapSet[Any]')
+
+#: Magic bytes, version, fingerprint and number of variants of :meth:`BitmapSet.to_bytes`
+HEADER = struct.Struct('<2sBII')
+
+#: Version of the :meth:`BitmapSet.to_bytes` format
+VERSION = 1
+
+_EMPTY: frozenset[int] = frozenset()
+
+# languages by key, instances being interned anyway
+_LANGUAGES: dict[int, Language] = {}
+
+# array type code of unsigned 32-bit integers
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+
+if sys.version_info >= (3, 10):
+    # introduced in python 3.10
+    popcount = int.bit_count
+else:
+
+    def popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+
+@lru_cache(maxsize=None)
+def language_bits() -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """Bit positions of the languages, those with an ISO-639-1 code first, then the living languages,
+    so that the bitmaps of common languages fit in a few machine words.
+
+    :return: the bit position by index in the :data:`~babelfish.language.LANGUAGE_MATRIX`,
+        and the alpha3 code by bit position
+    :rtype: tuple
+
+    """
+    columns = language.LANGUAGE_COLUMNS
+    order = sorted(
+        range(len(columns.alpha3)), key=lambda index: (not columns.alpha2[index], columns.type[index] != 'L', index)
+    )
+    positions = [0] * len(order)
+    for position, index in enumerate(order):
+        positions[index] = position
+    return tuple(positions), tuple(columns.alpha3[index] for index in order)
+
+
+@lru_cache(maxsize=None)
+def fingerprint() -> int:
+    """CRC32 of the codes in the data tables and of the bit positions of the languages, which define the keys."""
+    return zlib.crc32(' '.join(language_bits()[1]).encode('ascii'), serialization.fingerprint())
+
+
+class BitmapSet(Generic[T]):
+    """An immutable set of members identified by small integer keys.
+
+    Members whose key is below :attr:`BITMAP_KEYS` are bits of a bitmap, the other ones, the
+    variants, are kept in a side table. Operators take sets of the same class, the methods any
+    iterable of members, like :class:`frozenset`. Use :class:`set` and :meth:`BitmapSet.__init__`
+    to convert from and to regular sets.
+
+    :param members: the members
+    :raise: TypeError if a member is not of the type of the set
+
+    """
+
+    __slots__ = ('_bits', '_variants')
+
+    #: Keys of the members stored in the bitmap, the other ones being variants
+    BITMAP_KEYS: ClassVar[int]
+
+    #: Magic bytes of :meth:`to_bytes`
+    MAGIC: ClassVar[bytes]
+
+    _bits: int
+    _variants: frozenset[int]
+
+    def __init__(self, members: Iterable[T] = ()) -> None:
+        bits = 0
+        variants = []
+        limit = self.BITMAP_KEYS
+        for key in map(self._key, members):
+            if key < limit:
+                bits |= 1 << key
+            else:
+                variants.append(key)
+        self._bits = bits
+        self._variants = frozenset(variants) if variants else _EMPTY
+
+    @classmethod
+    def _make(cls: type[S], bits: int, variants: frozenset[int]) -> S:
+        instance = object.__new__(cls)
+        instance._bits = bits
+        instance._variants = variants
+        return instance
+
+    @staticmethod
+    def _key(member: T) -> int:
+        raise NotImplementedError
+
+    @staticmethod
+    def _member(key: int) -> T:
+        raise NotImplementedError
+
+    @staticmethod
+    def _size() -> int:
+        raise NotImplementedError
+
+    @classmethod
+    def _check_variant(cls, key: int) -> None:
+        msg = f'{key!r} is not a valid {cls.__name__} variant'
+        raise ValueError(msg)
+
+    def _coerce(self: S, other: Iterable[T]) -> S:
+        if other.__class__ is self.__class__:
+            return other  # type: ignore[return-value]
+        return self.__class__(other)
+
+    def _keys(self) -> list[int]:
+        keys = []
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            keys.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        keys.extend(sorted(self._variants))
+        return keys
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set into compact bytes: the bitmap, in as many bytes as its highest member
+        needs, and 4 bytes per variant.
+
+        :return: the serialized set
+        :rtype: bytes
+
+        """
+        variants = array(_UINT32, sorted(self._variants))
+        if sys.byteorder == 'big':
+            variants.byteswap()
+        bitmap = self._bits.to_bytes((self._bits.bit_length() + 7) // 8, 'little')
+        return HEADER.pack(self.MAGIC, VERSION, fingerprint(), len(variants)) + variants.tobytes() + bitmap
+
+    @classmethod
+    def from_bytes(cls: type[S], data: bytes | bytearray | memoryview) -> S:
+        """Deserialize a set serialized with :meth:`to_bytes`.
+
+        :param data: the serialized set, as a bytes-like object
+        :return: the set
+        :raise: ValueError if the data is invalid or was serialized with other data tables
+
+        """
+        try:
+            magic, version, data_fingerprint, count = HEADER.unpack_from(data)
+        except struct.error as err:
+            msg = f'Invalid serialized {cls.__name__}'
+            raise ValueError(msg) from err
+        start = HEADER.size + 4 * count
+        if magic != cls.MAGIC or version != VERSION or len(data) < start:
+            msg = f'Invalid serialized {cls.__name__}'
+            raise ValueError(msg)
+        if data_fingerprint != fingerprint():
+            msg = f'{cls.__name__} serialized with other data tables'
+            raise ValueError(msg)
+        variants = array(_UINT32)
+        variants.frombytes(data[HEADER.size : start])
+        if sys.byteorder == 'big':
+            variants.byteswap()
+        bits = int.from_bytes(data[start:], 'little')
+        if bits.bit_length() > cls._size() or any(variant < cls.BITMAP_KEYS for variant in variants):
+            msg = f'Invalid serialized {cls.__name__}'
+            raise ValueError(msg)
+        for variant in variants:
+            cls._check_variant(variant)
+        return cls._make(bits, frozenset(variants) if variants else _EMPTY)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__.from_bytes, (self.to_bytes(),)
+
+    def __contains__(self, member: object) -> bool:
+        try:
+            key = self._key(member)  # type: ignore[arg-type]
+        except TypeError:
+            return False
+        if key < self.BITMAP_KEYS:
+            return bool(self._bits >> key & 1)
+        return key in self._variants
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._member, self._keys())
+
+    def __len__(self) -> int:
+        return popcount(self._bits) + len(self._variants)
+
+    def __bool__(self) -> bool:
+        return bool(self._bits or self._variants)
+
+    def __or__(self: S, other: S) -> S:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        instance = object.__new__(self.__class__)
+        instance._bits = self._bits | other._bits
+        instance._variants = self._variants | other._variants if other._variants else self._variants
+        return instance
+
+    def __and__(self: S, other: S) -> S:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        instance = object.__new__(self.__class__)
+        instance._bits = self._bits & other._bits
+        instance._variants = self._variants & other._variants if self._variants else _EMPTY
+        return instance
+
+    def __sub__(self: S, other: S) -> S:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        instance = object.__new__(self.__class__)
+        instance._bits = self._bits & ~other._bits
+        instance._variants = self._variants - other._variants if other._variants else self._variants
+        return instance
+
+    def __xor__(self: S, other: S) -> S:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        instance = object.__new__(self.__class__)
+        instance._bits = self._bits ^ other._bits
+        instance._variants = self._variants ^ other._variants if other._variants else self._variants
+        return instance
+
+    def union(self: S, *others: Iterable[T]) -> S:
+        """Members of the set or any of the `others`."""
+        result = self
+        for other in others:
+            result = result | self._coerce(other)
+        return result
+
+    def intersection(self: S, *others: Iterable[T]) -> S:
+        """Members of the set and all the `others`."""
+        result = self
+        for other in others:
+            result = result & self._coerce(other)
+        return result
+
+    def difference(self: S, *others: Iterable[T]) -> S:
+        """Members of the set but none of the `others`."""
+        result = self
+        for other in others:
+            result = result - self._coerce(other)
+        return result
+
+    def symmetric_difference(self: S, other: Iterable[T]) -> S:
+        """Members of either the set or `other` but not both."""
+        return self ^ self._coerce(other)
+
+    def isdisjoint(self, other: Iterable[T]) -> bool:
+        """Whether the set has no member in common with `other`."""
+        other = self._coerce(other)
+        return not (self._bits & other._bits or self._variants & other._variants)  # type: ignore[attr-defined]
+
+    def issubset(self, other: Iterable[T]) -> bool:
+        """Whether every member of the set is in `other`."""
+        return self <= self._coerce(other)
+
+    def issuperset(self, other: Iterable[T]) -> bool:
+        """Whether every member of `other` is in the set."""
+        return self >= self._coerce(other)
+
+    def __le__(self: S, other: S) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return not self._bits & ~other._bits and self._variants <= other._variants
+
+    def __ge__(self: S, other: S) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return other <= self
+
+    def __lt__(self: S, other: S) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self <= other and self != other
+
+    def __gt__(self: S, other: S) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return other < self
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._bits == other._bits and self._variants == other._variants  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash((self._bits, self._variants))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({{{", ".join(map(str, self))}}})'
+
+
+class LanguageSet(BitmapSet[Language]):
+    """An immutable set of :class:`~babelfish.language.Language`, see :class:`BitmapSet`.
+
+    Languages without a country nor a script are bits of the bitmap, at their position in
+    :func:`language_bits`. The other ones are variants, kept aside by id.
+
+    """
+
+    __slots__ = ()
+
+    BITMAP_KEYS = 1 << COUNTRY_ID_SHIFT
+    MAGIC = b'LS'
+
+    @staticmethod
+    def _key(member: Language) -> int:
+        if not isinstance(member, Language):
+            msg = f'{member!r} is not a Language'
+            raise TypeError(msg)
+        language_id = member.to_id()
+        if language_id < LanguageSet.BITMAP_KEYS:
+            return language_bits()[0][language_id]
+        return language_id
+
+    @staticmethod
+    def _member(key: int) -> Language:
+        member = _LANGUAGES.get(key)
+        if member is None:
+            member = Language(language_bits()[1][key]) if key < LanguageSet.BITMAP_KEYS else Language(*split_id(key))
+            _LANGUAGES[key] = member
+        return member
+
+    @staticmethod
+    def _size() -> int:
+        return len(language_bits()[1])
+
+    @classmethod
+    def _check_variant(cls, key: int) -> None:
+        split_id(key)
+
+
+class CountrySet(BitmapSet[Country]):
+    """An immutable set of :class:`~babelfish.country.Country`, see :class:`BitmapSet`.
+
+    All the countries are bits of the bitmap, at their index in the :data:`~babelfish.country.COUNTRY_MATRIX`.
+
+    """
+
+    __slots__ = ()
+
+    BITMAP_KEYS = 1 << 16
+    MAGIC = b'CS'
+
+    @staticmethod
+    def _key(member: Country) -> int:
+        if not isinstance(member, Country):
+            msg = f'{member!r} is not a Country'
+            raise TypeError(msg)
+        return member.to_id()
+
+    @staticmethod
+    def _member(key: int) -> Country:
+        return Country.from_id(key)
+
+    @staticmethod
+    def _size() -> int:
+        return len(country.COUNTRY_MATRIX)
@@ -0,0 +1,139 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Precompiled snapshots of the data files.
+
+Parsing the ISO data files line by line is a significant part of the import time, so each
+data file is shipped along with a snapshot of its parsed columns serialized with
+:mod:`marshal`. The data files remain the source of truth and are parsed as a fallback
+when a snapshot is missing or unreadable. Snapshots must be rebuilt whenever a data file
+changes::
+
+    python -m babelfish.snapshot
+
+"""
+
+from __future__ import annotations
+
+import marshal
+from pathlib import Path
+from typing import IO, Callable, Tuple
+
+from .compat import resource_stream
+
+#: Version of the snapshot layout, snapshots with another version are ignored
+SNAPSHOT_VERSION = 1
+
+#: Version of the :mod:`marshal` format, readable by all supported python versions
+MARSHAL_VERSION = 4
+
+#: Columns of a data file
+Columns = Tuple[Tuple[str, ...], ...]
+
+
+def parse_iso_639_3(f: IO[bytes]) -> list[tuple[str, ...]]:
+    """Parse the ISO-639-3 data file into rows."""
+    f.readline()
+    return [tuple(line.decode('utf-8').split('\t')) for line in f]
+
+
+def parse_iso_3166_1(f: IO[bytes]) -> list[tuple[str, ...]]:
+    """Parse the ISO-3166-1 data file into rows."""
+    f.readline()
+    return [tuple(line.decode('utf-8').strip().split(';')) for line in f]
+
+
+def parse_iso_15924(f: IO[bytes]) -> list[tuple[str, ...]]:
+    """Parse the ISO-15924 data file into rows."""
+    f.readline()
+    rows = []
+    for raw_line in f:
+        line = raw_line.decode('utf-8').strip()
+        if not line or line.startswith('#'):
+            continue
+        rows.append(tuple(line.split(';')))
+    return rows
+
+
+def parse_opensubtitles(f: IO[bytes]) -> list[tuple[str, ...]]:
+    """Parse the OpenSubtitles languages data file into rows."""
+    f.readline()
+    return [tuple(line.decode('utf-8').strip().split('\t')) for line in f]
+
+
+#: Parsers of the data files
+PARSERS: dict[str, Callable[[IO[bytes]], list[tuple[str, ...]]]] = {
+    'iso-639-3.tab': parse_iso_639_3,
+    'iso-3166-1.txt': parse_iso_3166_1,
+    'iso15924-utf8-20131012.txt': parse_iso_15924,
+    'opensubtitles_languages.txt': parse_opensubtitles,
+}
+
+
+def parse(name: str) -> Columns:
+    """Parse the data file `name` into columns.
+
+    :param string name: name of the data file
+    :return: the columns of the data file
+    :rtype: tuple
+
+    """
+    with resource_stream('babelfish', f'data/{name}') as f:
+        rows = PARSERS[name](f)
+    return tuple(zip(*rows))
+
+
+def read(name: str) -> Columns:
+    """Read the snapshot of the data file `name`.
+
+    :param string name: name of the data file
+    :return: the columns of the data file
+    :rtype: tuple
+    :raise: ValueError if the snapshot has another version
+
+    """
+    with resource_stream('babelfish', f'data/{name}.marshal') as f:
+        version, columns = marshal.loads(f.read())  # noqa: S302 snapshot shipped with the package
+    if version != SNAPSHOT_VERSION:
+        msg = f'Unsupported snapshot version {version!r}'
+        raise ValueError(msg)
+    return columns  # type: ignore[no-any-return]
+
+
+def load(name: str) -> Columns:
+    """Load the columns of the data file `name` from its snapshot, parsing the data file if needed.
+
+    :param string name: name of the data file
+    :return: the columns of the data file
+    :rtype: tuple
+
+    """
+    try:
+        return read(name)
+    except (OSError, EOFError, ValueError, TypeError):
+        return parse(name)
+
+
+def build(directory: Path | None = None) -> list[Path]:
+    """Build the snapshots of all the data files.
+
+    :param directory: directory where to write the snapshots, defaults to the package data directory
+    :type directory: :class:`~pathlib.Path` or None
+    :return: paths of the written snapshots
+    :rtype: list
+
+    """
+    if directory is None:
+        directory = Path(__file__).parent / 'data'
+    paths = []
+    for name in PARSERS:
+        path = directory / f'{name}.marshal'
+        path.write_bytes(marshal.dumps((SNAPSHOT_VERSION, parse(name)), MARSHAL_VERSION))
+        paths.append(path)
+    return paths
+
+
+if __name__ == '__main__':
+    for path in build():
+        print(path)
@@ -0,0 +1,20 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Benchmarks of babelfish, run them with ``python -m benchmarks``.
+
+Benchmark modules are named ``bench_*.py`` and define, in the style of asv:
+
+* ``time_*`` functions, called repeatedly to measure their duration in seconds
+* ``track_*`` functions, returning a measured value such as a number of bytes
+
+Results are stored in a baseline with ``--save`` and compared with it with ``--compare``,
+the benchmarks slower than the baseline by more than ``--threshold`` being reported as
+regressions with a non-zero exit status. The stored ``baseline.json`` depends on the machine,
+regenerate it on the machine used for comparisons::
+
+    python -m benchmarks --save
+    python -m benchmarks --compare --threshold 0.2
+
+"""
@@ -0,0 +1,100 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+import benchmarks
+
+#: Default path of the stored baseline
+BASELINE = Path(__file__).parent / 'baseline.json'
+
+
+def collect(pattern: str = '') -> dict[str, Callable[[], Any]]:
+    """Collect the benchmark functions whose name contains `pattern`."""
+    functions = {}
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'benchmarks.{module_info.name}')
+        for name, function in vars(module).items():
+            if name.startswith(('time_', 'track_')) and pattern in f'{module_info.name}.{name}':
+                functions[f'{module_info.name}.{name}'] = function
+    return functions
+
+
+def run(name: str, function: Callable[[], Any], repeat: int = 5) -> float:
+    """Run a benchmark function, returning the best duration per call or the tracked value."""
+    if name.split('.')[-1].startswith('track_'):
+        return float(function())
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Load the results stored in the baseline at `path`."""
+    with path.open() as f:
+        return json.load(f)['results']  # type: ignore[no-any-return]
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    """Store `results` in the baseline at `path`, keeping the stored results of the other benchmarks."""
+    stored = load_baseline(path) if path.exists() else {}
+    stored.update(results)
+    baseline = {'python': platform.python_version(), 'machine': platform.machine(), 'results': stored}
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run babelfish benchmarks')
+    parser.add_argument('pattern', nargs='?', default='', help='only run benchmarks containing this pattern')
+    parser.add_argument('--baseline', type=Path, default=BASELINE, help='path of the baseline (default: %(default)s)')
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='timing repetitions, the best is kept (default: %(default)s)'
+    )
+    parser.add_argument('--save', action='store_true', help='store the results in the baseline')
+    parser.add_argument('--compare', action='store_true', help='compare the results with the baseline')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='relative increase over the baseline reported as a regression (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if args.compare else {}
+    results = {}
+    regressions = []
+    for name, function in collect(args.pattern).items():
+        value = results[name] = run(name, function, args.repeat)
+        unit = 'bytes' if 'bytes' in name else 's'
+        line = f'{name:60} {value:12.6g} {unit:5}'
+        if name in baseline:
+            change = value / baseline[name] - 1
+            line += f' {change:+8.1%}'
+            if change > args.threshold:
+                line += '  REGRESSION'
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+    if regressions:
+        print(f'{len(regressions)} regression(s) over {args.threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Lookups in the CaseInsensitiveDict backing the case-insensitive converters."""
+
+from __future__ import annotations
+
+from babelfish import language
+from babelfish.converters import CaseInsensitiveDict
+
+NAMES: CaseInsensitiveDict[str] = CaseInsensitiveDict(
+    (iso_language.name, iso_language.alpha3) for iso_language in language.LANGUAGE_MATRIX
+)
+COPY = NAMES.copy()
+
+
+def time_getitem_exact_case() -> None:
+    NAMES['Portuguese']
+
+
+def time_getitem_other_case() -> None:
+    NAMES['portuguese']
+
+
+def time_get_missing() -> None:
+    NAMES.get('Klingon')
+
+
+def time_contains() -> None:
+    'PORTUGUESE' in NAMES  # noqa: B015
+
+
+def time_eq() -> None:
+    NAMES == COPY  # noqa: B015
@@ -0,0 +1,28 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Language and Country from codes of every internal converter, ``time_fromcode_<converter>``."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from babelfish import Country, Language, country_converters, language_converters
+
+LANGUAGE = Language('por', 'BR')
+
+
+def fromcode(cls: type, code: str, converter: str) -> Callable[[], None]:
+    def benchmark() -> None:
+        cls.fromcode(code, converter)  # type: ignore[attr-defined]
+
+    return benchmark
+
+
+for _name in language_converters.load_all():
+    _converter = language_converters[_name]
+    if hasattr(_converter, 'reverse'):
+        globals()[f'time_fromcode_{_name}'] = fromcode(Language, getattr(LANGUAGE, _name), _name)
+for _name in country_converters.load_all():
+    globals()[f'time_country_fromcode_{_name}'] = fromcode(Country, getattr(LANGUAGE.country, _name), _name)
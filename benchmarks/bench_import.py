@@ -0,0 +1,34 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Cold import and first use, each measured in a new interpreter."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+REPEAT = 5
+
+
+def seconds(code: str) -> float:
+    """Best duration of `code` run in a new interpreter, after ``import time``."""
+    script = f'import time\nstart = time.perf_counter()\n{code}\nprint(time.perf_counter() - start)\n'
+    command = [sys.executable, '-c', script]
+    return min(
+        float(subprocess.run(command, check=True, capture_output=True, text=True).stdout)  # noqa: S603 script above
+        for _ in range(REPEAT)
+    )
+
+
+def track_import_seconds() -> float:
+    return seconds('import babelfish')
+
+
+def track_import_first_language_seconds() -> float:
+    return seconds("import babelfish\nbabelfish.Language('eng', 'US')")
+
+
+def track_import_first_conversion_seconds() -> float:
+    return seconds("import babelfish\nbabelfish.Language.fromopensubtitles('pob').name")
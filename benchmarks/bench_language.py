@@ -0,0 +1,89 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Construction and common operations of Language, Country and Script."""
+
+from __future__ import annotations
+
+import pickle
+
+from babelfish import Country, Language, Script
+from babelfish.cache import InstanceCache
+
+LANGUAGE = Language('por', 'BR', 'Latn')
+OTHER = Language('por', 'PT')
+COUNTRY = Country('BR')
+PICKLED = pickle.dumps(LANGUAGE)
+
+# uninterned instances, see time_language_uncached
+UNCACHED = InstanceCache(0)
+
+
+def time_language() -> None:
+    Language('por', 'BR')
+
+
+def time_language_uncached() -> None:
+    instances = Language._instances
+    Language._instances = UNCACHED
+    try:
+        Language('por', 'BR')
+    finally:
+        Language._instances = instances
+
+
+def time_country() -> None:
+    Country('BR')
+
+
+def time_script() -> None:
+    Script('Latn')
+
+
+def time_fromietf() -> None:
+    Language.fromietf('pt-BR')
+
+
+def time_fromietf_bcp47() -> None:
+    Language.fromietf('zh-Hant-TW-x-private')
+
+
+def time_fromany() -> None:
+    Language.fromany('pt_BR')
+
+
+def time_getattr_alpha2() -> None:
+    LANGUAGE.alpha2  # noqa: B018
+
+
+def time_getattr_name() -> None:
+    LANGUAGE.name  # noqa: B018
+
+
+def time_country_getattr_name() -> None:
+    COUNTRY.name  # noqa: B018
+
+
+def time_str() -> None:
+    str(LANGUAGE)
+
+
+def time_repr() -> None:
+    repr(LANGUAGE)
+
+
+def time_hash() -> None:
+    hash(LANGUAGE)
+
+
+def time_eq() -> None:
+    LANGUAGE == OTHER  # noqa: B015
+
+
+def time_pickle_dumps() -> None:
+    pickle.dumps(LANGUAGE)
+
+
+def time_pickle_loads() -> None:
+    pickle.loads(PICKLED)  # noqa: S301 pickled by the benchmark itself
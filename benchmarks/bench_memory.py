@@ -0,0 +1,55 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Memory used by each Language, Country and Script instance."""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from babelfish import Country, Language, Script
+from babelfish.cache import InstanceCache
+
+NUMBER = 10000
+
+
+def bytes_per_instance(cls: type, factory: Callable[[], Any]) -> float:
+    """Memory allocated by each instance created by `factory`, with interning disabled."""
+    factory()  # load the data and converters
+    instances = cls._instances  # type: ignore[attr-defined]
+    cls._instances = InstanceCache(0)  # type: ignore[attr-defined]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        created = [factory() for _ in range(NUMBER)]
+        allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(created)
+    finally:
+        tracemalloc.stop()
+        cls._instances = instances  # type: ignore[attr-defined]
+    return allocated / NUMBER
+
+
+def track_language_bytes() -> float:
+    return bytes_per_instance(Language, lambda: Language('eng', 'US', 'Latn'))
+
+
+def track_language_converted_bytes() -> float:
+    def factory() -> Language:
+        language = Language('eng', 'US', 'Latn')
+        language.name  # noqa: B018
+        return language
+
+    return bytes_per_instance(Language, factory)
+
+
+def track_country_bytes() -> float:
+    return bytes_per_instance(Country, lambda: Country('US'))
+
+
+def track_script_bytes() -> float:
+    return bytes_per_instance(Script, lambda: Script('Latn'))
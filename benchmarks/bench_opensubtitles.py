@@ -0,0 +1,40 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Conversions of the OpenSubtitles converter, bypassing the memoization of the Language constructors."""
+
+from __future__ import annotations
+
+from babelfish import language_converters
+from babelfish.converters.opensubtitles import OpenSubtitlesConverter
+
+CONVERTER = language_converters['opensubtitles']
+
+
+def time_init() -> None:
+    OpenSubtitlesConverter()
+
+
+def time_convert() -> None:
+    CONVERTER.convert('fra')
+
+
+def time_convert_country() -> None:
+    CONVERTER.convert('por', 'BR')
+
+
+def time_reverse_alpha3b() -> None:
+    CONVERTER.reverse('fre')
+
+
+def time_reverse_alpha2() -> None:
+    CONVERTER.reverse('fr')
+
+
+def time_reverse_special() -> None:
+    CONVERTER.reverse('pob')
+
+
+def time_try_reverse_missing() -> None:
+    CONVERTER.try_reverse('zzz')
@@ -0,0 +1,32 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Searches typed in a search box, the indexes being already built."""
+
+from __future__ import annotations
+
+from babelfish import search_countries, search_languages
+
+search_languages('')
+search_countries('')
+
+
+def time_search_language_prefix() -> None:
+    search_languages('fren')
+
+
+def time_search_language_single_letter() -> None:
+    search_languages('a')
+
+
+def time_search_language_misspelled() -> None:
+    search_languages('portugese')
+
+
+def time_search_language_qualifier() -> None:
+    search_languages('Portuguese (Brazil)')
+
+
+def time_search_country_misspelled() -> None:
+    search_countries('frnce')
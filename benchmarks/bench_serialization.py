@@ -0,0 +1,39 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Serialization of 1000 distinct languages, with pickle and with babelfish.dumps."""
+
+from __future__ import annotations
+
+import pickle
+
+from babelfish import Language, dumps, loads
+
+LANGUAGES = [Language.from_id(language_id) for language_id in range(0, 7874, 7)][:1000]
+PICKLED = pickle.dumps(LANGUAGES)
+DUMPED = dumps(LANGUAGES)
+
+
+def time_pickle_dumps() -> None:
+    pickle.dumps(LANGUAGES)
+
+
+def time_pickle_loads() -> None:
+    pickle.loads(PICKLED)  # noqa: S301 pickled by the benchmark itself
+
+
+def time_dumps() -> None:
+    dumps(LANGUAGES)
+
+
+def time_loads() -> None:
+    loads(DUMPED)
+
+
+def track_pickle_payload_bytes() -> float:
+    return len(PICKLED)
+
+
+def track_dumps_payload_bytes() -> float:
+    return len(DUMPED)
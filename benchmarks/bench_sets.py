@@ -0,0 +1,59 @@
+# Copyright (c) 2013 the BabelFish authors. All rights reserved.
+# Use of this source code is governed by the 3-clause BSD license
+# that can be found in the LICENSE file.
+#
+"""Availability queries over 40 languages, with frozensets and with LanguageSet."""
+
+from __future__ import annotations
+
+import pickle
+
+from babelfish import Language, LanguageSet, language
+
+COLUMNS = language.LANGUAGE_COLUMNS
+ALPHA3S = [alpha3 for alpha3, alpha2 in zip(COLUMNS.alpha3, COLUMNS.alpha2) if alpha2]
+AVAILABLE = [Language(alpha3) for alpha3 in ALPHA3S[::4]] + [Language('por', 'BR')]
+WANTED = [Language(alpha3) for alpha3 in ALPHA3S[1::4]] + AVAILABLE[::4]
+FROZENSET_AVAILABLE, FROZENSET_WANTED = frozenset(AVAILABLE), frozenset(WANTED)
+SET_AVAILABLE, SET_WANTED = LanguageSet(AVAILABLE), LanguageSet(WANTED)
+MEMBER = AVAILABLE[7]
+
+
+def time_frozenset_intersection() -> None:
+    FROZENSET_AVAILABLE & FROZENSET_WANTED
+
+
+def time_intersection() -> None:
+    SET_AVAILABLE & SET_WANTED
+
+
+def time_frozenset_union() -> None:
+    FROZENSET_AVAILABLE | FROZENSET_WANTED
+
+
+def time_union() -> None:
+    SET_AVAILABLE | SET_WANTED
+
+
+def time_frozenset_contains() -> bool:
+    return MEMBER in FROZENSET_AVAILABLE
+
+
+def time_contains() -> bool:
+    return MEMBER in SET_AVAILABLE
+
+
+def time_init() -> None:
+    LanguageSet(AVAILABLE)
+
+
+def time_iter() -> None:
+    list(SET_AVAILABLE)
+
+
+def track_pickle_payload_bytes() -> float:
+    return len(pickle.dumps(FROZENSET_AVAILABLE))
+
+
+def track_to_bytes_payload_bytes() -> float:
+    return len(SET_AVAILABLE.to_bytes())
@@ -0,0 +1,92 @@
+import pytest
+from babelfish import AmbiguousLanguageError, Language, LanguageReverseError, language_converters
+from babelfish.aliases import alias_index, candidates
+from babelfish.converters.alpha2 import Alpha2Converter
+
+
+@pytest.mark.parametrize(
+    ('code', 'expected'),
+    [
+        ('en', Language('eng')),
+        ('EN', Language('eng')),
+        ('eng', Language('eng')),
+        ('fre', Language('fra')),
+        ('ell', Language('ell')),
+        ('French', Language('fra')),
+        (' french ', Language('fra')),
+        ('pob', Language('por', 'BR')),
+        ('pt_BR', Language('por', 'BR')),
+        ('pt-br', Language('por', 'BR')),
+        ('fre-FR', Language('fra', 'FR')),
+        ('zh-Hant-TW', Language('zho', 'TW', 'Hant')),
+        ('sr_Latn', Language('srp', None, 'Latn')),
+        ('iw', Language('heb')),
+        ('in', Language('ind')),
+        ('mo', Language('ron')),
+    ],
+)
+def test_fromany(code, expected):
+    assert Language.fromany(code) == expected
+
+
+@pytest.mark.parametrize('code', ['', 'zzzz', 'not a language', 'en-', 'en-Latn-US-Cyrl', 'zzz-FR'])
+def test_fromany_unknown(code):
+    with pytest.raises(LanguageReverseError):
+        Language.fromany(code)
+
+
+def test_fromany_priority():
+    # alpha2 code before the name of another language
+    assert [source for source, _ in candidates('en')] == ['alpha2', 'name']
+    assert Language.fromany('en') == Language('eng')
+    assert candidates('eng') == (('alpha3', ('eng', None, None)),)
+
+
+def test_fromany_strict():
+    assert Language.fromany('fre', strict=True) == Language('fra')
+    # codes which are also names
+    assert Language.fromany('en', strict=True) == Language('eng')
+    assert Language.fromany('ko', strict=True) == Language('kor')
+    with pytest.raises(AmbiguousLanguageError) as excinfo:
+        Language.fromany('mne', strict=True)
+    assert excinfo.value.candidates == [Language('mne'), Language('srp', 'ME')]
+    assert str(excinfo.value) == "'mne' designates mne, sr-ME"
+
+
+def test_fromany_converters_change():
+    converter = Alpha2Converter()
+    converter.codes = {'xx'}
+    converter.from_symbol = {'xx': ('fra', None, None)}
+    assert candidates('xx') == ()
+    language_converters['custom'] = converter
+    try:
+        assert candidates('xx') == (('custom', ('fra', None, None)),)
+        assert Language.fromany('xx') == Language('fra')
+    finally:
+        del language_converters['custom']
+    assert 'xx' not in alias_index()
+    with pytest.raises(LanguageReverseError):
+        Language.fromany('xx')
+
+
+def test_fromany_does_not_load_other_converters():
+    entry_point = 'broken = babelfish.nonexistent:BrokenConverter'
+    language_converters.register(entry_point)
+    try:
+        assert Language.fromany('fre') == Language('fra')
+        assert 'broken' not in language_converters
+    finally:
+        language_converters.unregister(entry_point)
+
+
+def test_fromany_loaded_converters():
+    converter = Alpha2Converter()
+    converter.codes = {'xx'}
+    converter.from_symbol = {'xx': ('fra', None, None)}
+    assert candidates('xx') == ()
+    # loaded without notifying the listeners, like lazy loaded converters
+    language_converters.converters['custom'] = converter
+    try:
+        assert Language.fromany('xx') == Language('fra')
+    finally:
+        del language_converters['custom']
@@ -0,0 +1,53 @@
+from babelfish.cache import AttributeCache, InstanceCache
+
+
+def test_instance_cache_canonical():
+    cache = InstanceCache(4)
+    first = cache.add('first', (1, 2))
+    assert cache.add('second', (1, 2)) is first
+    assert cache.get('second') is first
+    assert len(cache) == 1
+
+
+def test_instance_cache_bounded():
+    cache = InstanceCache(2)
+    for i in range(5):
+        cache.add(i, (i,))
+    assert len(cache) == 2
+    assert cache.get(0) is None
+    assert cache.get(4) == (4,)
+
+
+def test_instance_cache_evicts_lookups_with_instances():
+    cache = InstanceCache(3)
+    for key, value in [('a', 0), ('b', 1), ('c', 2)]:
+        cache.add(key, (value,))
+    first = cache.instances[(0,)]
+    assert cache.add('alias', (0,)) is first
+    assert cache.lookups == {'b': (1,), 'c': (2,), 'alias': (0,)}
+    cache.add('d', (3,))
+    assert (0,) not in cache.instances
+    assert cache.get('alias') is None
+    assert cache.lookups == {'b': (1,), 'c': (2,), 'd': (3,)}
+    assert all(cache.get(key) is cache.instances[value] for key, value in cache.lookups.items())
+
+
+def test_instance_cache_disabled():
+    cache = InstanceCache(0)
+    cache.add('key', (1,))
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_attribute_cache():
+    class Object:
+        pass
+
+    cache = AttributeCache()
+    instance = Object()
+    instance.other = 'other'
+    cache.set(instance, 'value', 1)
+    assert instance.value == 1
+    cache.clear()
+    assert not hasattr(instance, 'value')
+    assert instance.other == 'other'
@@ -1,10 +1,24 @@
 # ruff: noqa: B018
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from babelfish import language_converters
+from babelfish import awarmup, compat, language_converters
 from babelfish.compat import resource_stream
-from babelfish.converters import LanguageReverseConverter
+from babelfish.converters import CaseInsensitiveDict, LanguageReverseConverter
+from babelfish.converters.alpha2 import Alpha2Converter
+from babelfish.converters.name import NameConverter
+from babelfish.converters.opensubtitles import OpenSubtitlesConverter
+from babelfish.converters.scope import ScopeConverter
+from babelfish.converters.type import LanguageTypeConverter
+from babelfish.country import Country
 from babelfish.exceptions import LanguageConvertError, LanguageReverseError
-from babelfish.language import Language
+from babelfish.language import Language, LanguageConverterManager
 
 
 def test_converter_alpha2():
@@ -98,6 +112,20 @@ def test_converter_opensubtitles_codes():
         assert code in language_converters['opensubtitles'].codes
 
 
+def test_converter_opensubtitles_table():
+    converter = language_converters['opensubtitles']
+    assert converter.reverse('POB') == converter.reverse('pb') == ('por', 'BR', None)
+    assert converter.reverse('FR') == converter.reverse('fre') == ('fra', None, None)
+    assert converter.convert('ell', 'GR') == converter.convert('ell') == 'ell'
+    assert converter.convert('srp', 'RS') == 'scc'
+    assert converter.convert('por', 'PT') == 'por'
+    assert {'pob', 'ell', 'mne'} <= converter.upload_enabled
+    assert 'mne' not in converter.web_enabled
+    assert 'afa' not in converter.upload_enabled | converter.web_enabled
+    assert converter.upload_enabled <= converter.codes
+    assert OpenSubtitlesConverter().from_opensubtitles is converter.from_opensubtitles
+
+
 def test_register_converter():
     class TestConverter(LanguageReverseConverter):
         def __init__(self):
@@ -127,3 +155,459 @@ def test_register_converter():
         Language.fromtest('test1')
     with pytest.raises(AttributeError):
         Language('fra').test
+
+
+def test_fromcode_memoized():
+    assert Language.fromcode('fr', 'alpha2') is Language.fromcode('fr', 'alpha2') is Language('fra')
+    assert Country.fromname('france') is Country('FR')
+    assert Language.fromalpha2('fr') is Language('fra')
+    assert 'fromalpha2' in vars(Language)
+    assert 'fromname' in vars(Country)
+
+    class Other(Language):
+        pass
+
+    assert Other.fromalpha2('fr').__class__ is Other
+    assert Language.fromalpha2('fr').__class__ is Language
+
+
+def test_from_converter_cached_for_available_converters():
+    assert hasattr(Language, 'from_json')
+    assert 'from_json' not in vars(Language)
+    with pytest.raises(KeyError):
+        Country.fromunknown('FR')
+    assert 'fromunknown' not in vars(Country)
+    entry_point = 'cached = babelfish.converters.alpha2:Alpha2Converter'
+    language_converters.register(entry_point)
+    try:
+        assert Language.fromcached('fr') == Language('fra')
+        assert 'fromcached' in vars(Language)
+    finally:
+        del language_converters['cached']
+        language_converters.unregister(entry_point)
+    assert 'fromcached' not in vars(Language)
+    with pytest.raises(KeyError):
+        Language.fromcached('fr')
+
+
+def test_fromcode_memoized_until_converters_change():
+    language_converters['swapped'] = Alpha2Converter()
+    try:
+        assert Language.fromswapped('fr') == Language('fra')
+        converter = Alpha2Converter()
+        converter.from_symbol = {'fr': ('eng', None, None)}
+        language_converters['swapped'] = converter
+        assert Language.fromswapped('fr') == Language('eng')
+    finally:
+        del language_converters['swapped']
+    with pytest.raises(KeyError):
+        Language.fromswapped('fr')
+
+
+@pytest.fixture
+def entry_point_lookups(monkeypatch):
+    lookups = []
+    iter_entry_points = compat.iter_entry_points
+
+    def counting_iter_entry_points(group, **kwargs):
+        lookups.append(group)
+        return iter_entry_points(group, **kwargs)
+
+    monkeypatch.setattr(compat, 'iter_entry_points', counting_iter_entry_points)
+    return lookups
+
+
+def test_manager_entry_points_looked_up_once(entry_point_lookups):
+    manager = LanguageConverterManager()
+    assert isinstance(manager['alpha2'], Alpha2Converter)
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            manager['unknown']
+    assert entry_point_lookups == ['babelfish.language_converters']
+    manager.refresh()
+    with pytest.raises(KeyError):
+        manager['unknown']
+    assert len(entry_point_lookups) == 2
+
+
+def test_manager_register_after_miss():
+    manager = LanguageConverterManager()
+    with pytest.raises(KeyError):
+        manager['other']
+    manager.register('other = babelfish.converters.alpha2:Alpha2Converter')
+    assert isinstance(manager['other'], Alpha2Converter)
+    manager.unregister('other = babelfish.converters.alpha2:Alpha2Converter')
+    assert 'other' not in manager.parsed_converters
+
+
+def test_manager_forgets_locks_of_missing_names():
+    manager = LanguageConverterManager()
+    for name in ['unknown', 'other']:
+        with pytest.raises(KeyError):
+            manager[name]
+    manager.refresh()
+    with pytest.raises(KeyError):
+        manager['unknown']
+    manager['alpha2']
+    assert list(manager._loading) == ['alpha2']
+
+
+def test_manager_register_while_missing():
+    manager = LanguageConverterManager()
+    manager.entry_points
+    entry_point = 'other = babelfish.converters.alpha2:Alpha2Converter'
+
+    class Converters(dict):
+        lookups = 0
+
+        def __contains__(self, name):
+            Converters.lookups += 1
+            # registered once the name is found to be missing, before it is remembered
+            if Converters.lookups == 2:
+                manager.register(entry_point)
+            return super().__contains__(name)
+
+    manager._parsed_converters = Converters(manager.parsed_converters)
+    with pytest.raises(KeyError):
+        manager['other']
+    assert isinstance(manager['other'], Alpha2Converter)
+
+
+def test_manager_load_all():
+    manager = LanguageConverterManager()
+    assert sorted(manager.load_all()) == sorted(ep.split(' = ')[0] for ep in manager.internal_converters)
+    assert manager.load_all() == list(manager.converters)
+
+
+def test_manager_freeze():
+    manager = LanguageConverterManager()
+    manager.freeze()
+    assert 'opensubtitles' in manager.converters
+    assert isinstance(manager['alpha2'], Alpha2Converter)
+    # missing names are not looked up, nor remembered
+    manager._lock = None
+    with pytest.raises(KeyError):
+        manager['unknown']
+    assert not manager._missing
+    manager._lock = threading.RLock()
+    with pytest.raises(RuntimeError):
+        manager.register('other = babelfish.converters.alpha2:Alpha2Converter')
+    with pytest.raises(RuntimeError):
+        manager.unregister('alpha2 = babelfish.converters.alpha2:Alpha2Converter')
+    with pytest.raises(RuntimeError):
+        manager['other'] = Alpha2Converter()
+    with pytest.raises(RuntimeError):
+        del manager['alpha2']
+    with pytest.raises(RuntimeError):
+        manager.refresh()
+
+
+def test_warmup():
+    code = (
+        'import babelfish\n'
+        'babelfish.warmup(freeze=True)\n'
+        "assert 'LANGUAGE_MATRIX' in vars(babelfish.language)\n"
+        "assert 'opensubtitles' in babelfish.language_converters.converters\n"
+        "assert 'name' in babelfish.country_converters.converters\n"
+        'assert babelfish.language_converters.frozen and babelfish.country_converters.frozen\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_manager_aload():
+    manager = LanguageConverterManager()
+
+    async def load():
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            converter = await manager.aload('alpha2')
+            assert await manager.aload('alpha2') is converter
+            assert manager['alpha2'] is converter
+            with pytest.raises(KeyError):
+                await manager.aload('unknown')
+
+    asyncio.run(load())
+
+
+def test_manager_warns_blocking_load_in_event_loop():
+    manager = LanguageConverterManager()
+
+    async def load():
+        with pytest.warns(RuntimeWarning, match='blocks the running event loop'):
+            manager['alpha2']
+
+    asyncio.run(load())
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        manager['alpha3b']
+
+
+def test_awarmup():
+    async def convert():
+        await awarmup()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert Language('fra').opensubtitles == 'fre'
+            assert Country('FR').name == 'FRANCE'
+
+    asyncio.run(convert())
+
+
+def test_convert_many():
+    converter = language_converters['alpha2']
+    assert converter.convert_many(['eng', 'fra', 'aaa', 'eng']) == ['en', 'fr', None, 'en']
+    assert converter.convert_many([('por', 'BR', None)], default='') == ['pt']
+    converter = language_converters['opensubtitles']
+    assert converter.convert_many([('por', 'BR', None), 'por', 'aaa']) == ['pob', 'por', None]
+
+
+def test_reverse_many():
+    assert language_converters['alpha2'].reverse_many(['en', 'zz']) == [('eng', None, None), None]
+    assert language_converters['name'].reverse_many(['FRENCH', 'french', 'Zzz'], default=False) == [
+        ('fra', None, None),
+        ('fra', None, None),
+        False,
+    ]
+    converter = language_converters['opensubtitles']
+    assert converter.reverse_many(['pob', 'fre']) == [('por', 'BR', None), ('fra', None, None)]
+
+
+def test_convert_many_arrays():
+    class Array:
+        def __init__(self, values):
+            self.values = values
+
+        def __iter__(self):
+            raise AssertionError
+
+        def to_pylist(self):
+            return list(self.values)
+
+    assert language_converters['alpha3b'].convert_many(Array(['fra', 'deu'])) == ['fre', 'ger']
+    assert language_converters['alpha3b'].reverse_many(Array(['fre'])) == [('fra', None, None)]
+
+
+@pytest.mark.parametrize(('name', 'code'), [('alpha2', 'fr'), ('name', 'french'), ('opensubtitles', 'fre')])
+def test_reverse_many_nulls(name, code):
+    class Array:
+        def to_pylist(self):
+            return [code, None, code, None]
+
+    converter = language_converters[name]
+    assert converter.try_reverse(None) is None
+    assert converter.reverse_many(Array(), default='') == [('fra', None, None), '', ('fra', None, None), '']
+
+
+def test_transcoder():
+    transcoder = language_converters.transcoder('alpha3b', 'name')
+    assert transcoder.table is not None
+    assert transcoder.translate('fre') == 'French'
+    with pytest.raises(LanguageReverseError):
+        transcoder.translate('zzz')
+    assert language_converters.transcoder('name', 'alpha2').translate('FRENCH') == 'fr'
+    with pytest.raises(LanguageConvertError):
+        language_converters.transcoder('alpha3b', 'alpha2').translate('ach')
+
+
+def test_transcoder_chained():
+    transcoder = language_converters.transcoder('opensubtitles', 'alpha2')
+    assert transcoder.table is None
+    assert transcoder.translate('pob') == 'pt'
+    assert transcoder.translate_many(['pob', 'fre', 'zzz', 'pob']) == ['pt', 'fr', None, 'pt']
+    assert language_converters.transcoder('alpha2', 'opensubtitles').translate('pt') == 'por'
+
+
+def test_try_convert():
+    assert language_converters['alpha2'].try_convert('eng') == 'en'
+    assert language_converters['alpha2'].try_convert('aaa') is None
+    assert language_converters['scope'].try_convert('eng') == 'individual'
+    assert language_converters['opensubtitles'].try_convert('por', 'BR') == 'pob'
+    assert language_converters['opensubtitles'].try_convert('aaa') is None
+
+
+def test_try_reverse():
+    assert language_converters['name'].try_reverse('FRENCH') == ('fra', None, None)
+    assert language_converters['name'].try_reverse('Zzzzzzzzz') is None
+    assert language_converters['opensubtitles'].try_reverse('pob') == ('por', 'BR', None)
+    assert language_converters['opensubtitles'].try_reverse('zzz') is None
+
+
+def test_transcoder_try_translate():
+    assert language_converters.transcoder('alpha3b', 'alpha2').try_translate('ach') is None
+    assert language_converters.transcoder('opensubtitles', 'alpha2').try_translate('zzz') is None
+
+
+def test_converted_values_cached():
+    class UpperConverter(LanguageReverseConverter):
+        def __init__(self, suffix):
+            self.suffix = suffix
+
+        def convert(self, alpha3, country=None, script=None):
+            return alpha3.upper() + self.suffix
+
+    language_converters['upper'] = UpperConverter('1')
+    try:
+        language = Language('fra')
+        assert language.upper == 'FRA1'
+        assert vars(language)['upper'] == 'FRA1'
+        language_converters['upper'] = UpperConverter('2')
+        assert 'upper' not in vars(language)
+        assert language.upper == 'FRA2'
+    finally:
+        del language_converters['upper']
+    with pytest.raises(AttributeError):
+        language.upper
+
+
+def test_country_converted_values_cached():
+    country = Country('FR')
+    assert country.name == 'FRANCE'
+    assert vars(country)['name'] == 'FRANCE'
+
+
+def test_convert_ids():
+    ids = [Language('eng', 'US').to_id(), Language('aaa').to_id(), Language('eng', 'US').to_id()]
+    assert language_converters['alpha2'].convert_ids(ids, default='') == ['en', '', 'en']
+    assert language_converters['opensubtitles'].convert_ids(ids) == ['eng', None, 'eng']
+    assert language_converters['opensubtitles'].convert_ids([Language('por', 'BR').to_id()]) == ['pob']
+    with pytest.raises(ValueError):
+        language_converters['opensubtitles'].convert_ids([-1])
+
+
+@pytest.mark.parametrize('language_id', [-1, 9000, 300 << 14, 1 << 40])
+def test_equivalence_convert_ids_invalid(language_id):
+    with pytest.raises(ValueError):
+        language_converters['alpha2'].convert_ids([language_id])
+
+
+def test_equivalence_convert_ids_default():
+    converter = Alpha2Converter()
+    assert converter.convert_ids([Language('aaa').to_id()], default='') == ['']
+    symbols = converter.index_symbols
+    sentinel = object()
+    assert converter.convert_ids([Language('eng').to_id(), Language('aaa').to_id()], default=sentinel) == [
+        'en',
+        sentinel,
+    ]
+    assert converter.convert_ids([Language('aaa').to_id()], default=True)[0] is True
+    assert converter.convert_ids([Language('aaa').to_id()], default=1) == [1]
+    assert converter.convert_ids([Language('aaa').to_id()], default=[]) == [[]]
+    assert converter.index_symbols is symbols
+
+
+def test_case_insensitive_dict():
+    cid = CaseInsensitiveDict({'English': 'eng', 'ÅLAND ISLANDS': 'AX'})
+    assert cid['ENGLISH'] == cid['english'] == 'eng'
+    assert cid['åland islands'] == 'AX'
+    assert 'eNgLiSh' in cid
+    assert 'French' not in cid
+    assert cid.get('French') is None
+    assert list(cid) == ['English', 'ÅLAND ISLANDS']
+    assert cid == {'english': 'eng', 'åland ISLANDS': 'AX'}
+    assert cid == cid.copy()
+    assert cid != {'english': 'eng'}
+    assert cid != {'english': 'eng', 'åland islands': 'AL'}
+    cid['ENGLISH'] = 'en'
+    assert cid['english'] == 'en'
+    assert list(cid) == ['ENGLISH', 'ÅLAND ISLANDS']
+    del cid['English']
+    assert 'english' not in cid
+    assert cid.get('ENGLISH', 'default') == 'default'
+    with pytest.raises(KeyError):
+        cid['english']
+    assert ['english'] not in cid
+
+
+def test_case_insensitive_dict_aliases(monkeypatch):
+    monkeypatch.setattr(CaseInsensitiveDict, 'ALIASES', 2)
+    cid = CaseInsensitiveDict({'English': 'eng'})
+    for key in ['ENGLISH', 'english', 'eNgLiSh', 'english']:
+        assert cid[key] == 'eng'
+    assert list(cid._aliases) == ['english', 'eNgLiSh']
+    assert set(cid._lookups) == {'English', 'eNgLiSh', 'english'}
+
+
+def test_case_insensitive_dict_casefold():
+    cid = CaseInsensitiveDict({'Straße': 'street'})
+    assert cid['STRASSE'] == 'street'
+
+
+def test_case_insensitive_dict_init():
+    cid = CaseInsensitiveDict([('English', 'eng'), ('ENGLISH', 'en')], French='fra')
+    assert list(cid.items()) == [('ENGLISH', 'en'), ('French', 'fra')]
+    assert CaseInsensitiveDict(cid) == cid
+    assert len(CaseInsensitiveDict()) == 0
+
+
+def test_equivalence_converter_shared_tables():
+    converter = Alpha2Converter()
+    assert converter.from_symbol is language_converters['alpha2'].from_symbol
+    assert converter.to_symbol is language_converters['alpha2'].to_symbol
+    assert converter.codes is language_converters['alpha2'].codes
+    assert converter.index_symbols is None
+    assert converter.convert('eng') == 'en'
+    assert converter.reverse('en') == ('eng', None, None)
+
+
+def test_converter_class_symbols():
+    assert Alpha2Converter.SYMBOLS['eng'] == 'en'
+    assert NameConverter.SYMBOLS['fra'] == 'French'
+    assert ScopeConverter.SYMBOLS['eng'] == 'I'
+    assert ScopeConverter.codes == {'I', 'S', 'M'}
+    assert LanguageTypeConverter.SYMBOLS['und'] == 'S'
+
+    class MyAlpha2Converter(Alpha2Converter):
+        SYMBOLS = {**Alpha2Converter.SYMBOLS, 'por': 'pb'}
+
+    converter = MyAlpha2Converter()
+    assert converter.convert('por') == 'pb'
+    assert converter.reverse('en') == ('eng', None, None)
+    assert Alpha2Converter.SYMBOLS['por'] == 'pt'
+
+
+def test_manager_loads_converter_once_across_threads(monkeypatch):
+    instances = []
+    init = Alpha2Converter.__init__
+
+    def slow_init(self):
+        instances.append(self)
+        time.sleep(0.01)
+        init(self)
+
+    monkeypatch.setattr(Alpha2Converter, '__init__', slow_init)
+    manager = LanguageConverterManager()
+    barrier = threading.Barrier(16)
+
+    def load():
+        barrier.wait()
+        return manager['alpha2']
+
+    with ThreadPoolExecutor(16) as executor:
+        converters = list(executor.map(lambda _: load(), range(16)))
+    assert len(instances) == 1
+    assert all(converter is instances[0] for converter in converters)
+
+
+def test_converters_stress_threads():
+    manager = LanguageConverterManager()
+    barrier = threading.Barrier(8)
+    codes = ['pob', 'fre', 'eng', 'spa', 'ger', 'ita']
+
+    def work(i):
+        barrier.wait()
+        results = []
+        for _ in range(200):
+            for code in codes:
+                alpha3, country, script = manager['opensubtitles'].reverse(code)
+                language = Language(alpha3, country, script)
+                results.append((manager['alpha2'].convert(alpha3), language.opensubtitles, language.name))
+            if i == 0:
+                manager.register('other = babelfish.converters.alpha2:Alpha2Converter')
+                manager.unregister('other = babelfish.converters.alpha2:Alpha2Converter')
+        return results
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(work, range(8)))
+    assert all(result == results[0] for result in results)
+    assert results[0][:2] == [('pt', 'pob', 'Portuguese'), ('fr', 'fre', 'French')]
+    assert Language.fromcode('pob', 'opensubtitles') == Language('por', 'BR')
@@ -32,3 +32,14 @@ def test_wrong():
 
 def test_pickle():
     assert pickle.loads(pickle.dumps(Country('GB'))) == Country('GB')
+
+
+def test_interned():
+    assert Country('GB') is Country('GB')
+    assert pickle.loads(pickle.dumps(Country('GB'))) is Country('GB')
+
+
+def test_id():
+    assert Country.from_id(Country('US').to_id()) is Country('US')
+    with pytest.raises(ValueError):
+        Country.from_id(249)
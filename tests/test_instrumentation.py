@@ -0,0 +1,97 @@
+import pytest
+from babelfish import Country, Language, instrumentation, language_converters
+from babelfish.converters import LanguageReverseConverter
+from babelfish.converters.alpha2 import Alpha2Converter
+from babelfish.exceptions import LanguageReverseError
+
+
+@pytest.fixture
+def events():
+    events = []
+    instrumentation.enable(lambda *event: events.append(event))
+    try:
+        yield events
+    finally:
+        instrumentation.disable()
+
+
+def test_calls_and_misses(events):
+    assert Language.fromalpha2('fr') == Language('fra')
+    with pytest.raises(LanguageReverseError):
+        Language.fromalpha2('zz')
+    assert language_converters['alpha2'].try_reverse('zz') is None
+    stats = instrumentation.stats()['language_converters']['alpha2']
+    assert stats['calls'] == {'reverse': 2, 'try_reverse': 1}
+    assert stats['misses'] == {'reverse': 1, 'try_reverse': 1}
+    assert ('miss', 'language_converters.alpha2', 'reverse') in events
+
+
+def test_nested_calls_counted_once(events):
+    class Converter(LanguageReverseConverter):
+        codes = {'fr'}
+
+        def convert(self, alpha3, country=None, script=None):
+            return language_converters['alpha2'].convert(alpha3, country, script)
+
+        def reverse(self, code):
+            return language_converters['alpha2'].reverse(code)
+
+    language_converters['instrumented'] = Converter()
+    try:
+        converter = language_converters['instrumented']
+        assert converter.try_reverse('zz') is None
+        assert converter.convert_many(['fra', 'zzz']) == ['fr', None]
+        stats = instrumentation.stats()['language_converters']['instrumented']
+        assert stats['calls'] == {'try_reverse': 1, 'convert_many': 1}
+        assert stats['misses'] == {'try_reverse': 1}
+    finally:
+        del language_converters['instrumented']
+
+
+def test_country_calls(events):
+    assert Country.fromname('FRANCE') == Country('FR')
+    assert instrumentation.stats()['country_converters']['name']['calls'] == {'reverse': 1}
+
+
+def test_load_time(events):
+    entry_point = 'instrumented = babelfish.converters.alpha2:Alpha2Converter'
+    language_converters.register(entry_point)
+    try:
+        converter = language_converters['instrumented']
+        assert converter.convert('fra') == 'fr'
+        stats = instrumentation.stats()['language_converters']['instrumented']
+        assert stats['calls'] == {'convert': 1}
+        assert stats['load_seconds'] > 0
+        assert events[0][:2] == ('load', 'language_converters.instrumented')
+    finally:
+        del language_converters['instrumented']
+        language_converters.unregister(entry_point)
+    assert 'convert' not in vars(converter)
+
+
+def test_loaded_converter(events):
+    language_converters['instrumented'] = Alpha2Converter()
+    try:
+        language_converters['instrumented'].try_convert('aaa')
+        stats = instrumentation.stats()['language_converters']['instrumented']
+        assert stats == {'calls': {'try_convert': 1}, 'misses': {'try_convert': 1}, 'load_seconds': None}
+    finally:
+        del language_converters['instrumented']
+
+
+def test_disabled():
+    converter = language_converters['alpha2']
+    instrumentation.enable()
+    assert 'convert' in vars(converter)
+    instrumentation.disable()
+    assert 'convert' not in vars(converter)
+    assert language_converters.instrumentation is None
+    assert set(instrumentation.stats()) == {'caches'}
+
+
+def test_cache_stats():
+    Language.fromietf('pt-BR')
+    Language.fromietf('pt-BR')
+    caches = instrumentation.stats()['caches']
+    assert caches['parse_ietf']['hits'] >= 1
+    assert caches['languages'] >= 1
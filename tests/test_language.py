@@ -1,7 +1,10 @@
 import pickle
+import subprocess
+import sys
 
 import pytest
 from babelfish.country import Country
+from babelfish.exceptions import LanguageReverseError
 from babelfish.language import LANGUAGES, Language
 from babelfish.script import Script
 
@@ -106,6 +109,11 @@ def test_fromietf_with_script_and_no_country():
     assert Language.fromietf('eng-Latn') == Language('eng', script='Latn')
 
 
+def test_fromietf_wrong_alpha2_raises_reverseerror():
+    with pytest.raises(LanguageReverseError):
+        Language.fromietf('zz-FR')
+
+
 def test_fromietf_wrong_language_raises_valueerror():
     with pytest.raises(ValueError):
         Language.fromietf('xyz-FR')
@@ -119,3 +127,99 @@ def test_fromietf_wrong_country_raises_valueerror():
 def test_fromietf_wrong_script_raises_valueerror():
     with pytest.raises(ValueError):
         Language.fromietf('fra-FR-Wxyz')
+
+
+def test_fromietf_bcp47():
+    assert Language.fromietf('zh-Hant-TW') == Language('zho', 'TW', 'Hant')
+    assert Language.fromietf('EN-us') == Language('eng', 'US')
+    assert Language.fromietf('zh-yue-HK') == Language('yue', 'HK')
+    assert Language.fromietf('es-419') == Language('spa')
+    assert Language.fromietf('sl-rozaj-biske') == Language('slv')
+    assert Language.fromietf('sr-Latn-RS-1994') == Language('srp', 'RS', 'Latn')
+    assert Language.fromietf('de-DE-u-co-phonebk-x-private') == Language('deu', 'DE')
+    assert Language.fromietf('en-x-twain') == Language('eng')
+
+
+def test_fromietf_malformed_raises_valueerror():
+    for ietf in ['', 'e', 'x-private', 'en-', 'en-US-US', 'en-Latn-Latn', 'en-a', 'en-a-bb-x', 'en-FR-toolongvariant']:
+        with pytest.raises(ValueError):
+            Language.fromietf(ietf)
+
+
+@pytest.mark.parametrize('ietf', ['pt-BRA', 'en-USA', 'zh-xyz', 'fra-yue'])
+def test_fromietf_extlang_of_macrolanguage_only(ietf):
+    with pytest.raises(ValueError):
+        Language.fromietf(ietf)
+
+
+def test_fromietf_many():
+    languages = Language.fromietf_many(['en', 'pt-BR', 'zz', 'en'], default=Language('und'))
+    assert languages == [Language('eng'), Language('por', 'BR'), Language('und'), Language('eng')]
+
+
+def test_ietf():
+    assert Language('zho', 'TW', 'Hant').ietf == 'zh-Hant-TW'
+    assert Language('aaa', 'FR').ietf == 'aaa-FR'
+    for language in [Language('eng'), Language('srp', 'RS', 'Latn'), Language('aaa', script='Latn')]:
+        assert Language.fromietf(language.ietf) is language
+
+
+def test_interned():
+    assert Language('eng', 'US') is Language('eng', Country('US'))
+    assert Language('eng', country='US') is Language('eng', 'US')
+    assert Language('zzzz', unknown='und') is Language('und')
+
+
+def test_interned_country_and_script():
+    language = Language('srp', 'RS', 'Cyrl')
+    assert language.country is Country('RS')
+    assert language.script is Script('Cyrl')
+
+
+@pytest.mark.parametrize('language', [Language('fra'), Language('eng', 'US', 'Latn')])
+def test_pickle_interned(language):
+    assert pickle.loads(pickle.dumps(language)) is language
+
+
+def test_hash_cached():
+    assert hash(Language('eng', 'US')) == hash(Language('eng', Country('US')))
+
+
+def test_lazy_data_tables():
+    code = (
+        'import babelfish\n'
+        "babelfish.Country('US')\n"
+        "assert 'LANGUAGES' not in vars(babelfish.language)\n"
+        "assert 'LANGUAGE_MATRIX' not in vars(babelfish.language)\n"
+        "babelfish.Language('eng')\n"
+        "assert 'LANGUAGE_MATRIX' not in vars(babelfish.language)\n"
+        'assert len(babelfish.LANGUAGE_MATRIX) == len(babelfish.LANGUAGES) == 7874\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_data_tables_unknown_attribute():
+    import babelfish.language
+
+    with pytest.raises(AttributeError):
+        babelfish.language.UNKNOWN  # noqa: B018
+
+
+def test_slots():
+    language = Language('fra', 'FR', 'Latn')
+    assert vars(language) == {}
+    assert (language.language, language.country, language.script) == ('fra', Country('FR'), Script('Latn'))
+
+
+def test_id():
+    languages = [Language('eng'), Language('eng', 'US'), Language('srp', script='Cyrl'), Language('zho', 'TW', 'Hant')]
+    for language in languages:
+        assert Language.from_id(language.to_id()) is language
+    assert Language('aaa').to_id() == 0
+    assert Language('fra').to_id() < Language('fra', 'FR').to_id()
+
+
+def test_id_invalid():
+    for language_id in [-1, 7874, 250 << 14, 170 << 23]:
+        with pytest.raises(ValueError):
+            Language.from_id(language_id)
@@ -23,3 +23,18 @@ def test_hash_eq():
 
 def test_pickle():
     assert pickle.loads(pickle.dumps(Script('Latn'))) == Script('Latn')
+
+
+def test_interned():
+    assert Script('Latn') is Script('Latn')
+    assert pickle.loads(pickle.dumps(Script('Latn'))) is Script('Latn')
+
+
+def test_slots():
+    assert not hasattr(Script('Latn'), '__dict__')
+
+
+def test_id():
+    assert Script.from_id(Script('Latn').to_id()) is Script('Latn')
+    with pytest.raises(ValueError):
+        Script.from_id(-1)
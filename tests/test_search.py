@@ -0,0 +1,48 @@
+from babelfish import Country, Language, Script, search_countries, search_languages, search_scripts
+from babelfish.search import NameIndex, edit_distance, split_words
+
+
+def test_split_words():
+    assert split_words('Greek, Modern (1453-)') == ['greek', 'modern', '1453']
+    assert split_words('ÅLAND ISLANDS') == ['aland', 'islands']
+
+
+def test_edit_distance():
+    assert edit_distance('portugese', 'portuguese', 2) == 1
+    assert edit_distance('protuguese', 'portuguese', 2) == 1
+    assert edit_distance('french', 'german', 2) == 3
+
+
+def test_name_index():
+    index = NameIndex([('Middle French', 'frm', 1), ('French', 'fra', 0), ('Cajun French', 'frc', 1)])
+    assert index.search('french') == [(-1, 'fra'), (0, 'frm'), (0, 'frc')]
+    assert index.search('fren', limit=1) == [(0.5, 'fra')]
+    assert index.search('middle frnch') == [(1, 'frm')]
+    assert index.search('german') == []
+    assert index.search('') == []
+
+
+def test_search_languages():
+    assert search_languages('French')[0] == Language('fra')
+    assert search_languages('fren')[0] == Language('fra')
+    assert search_languages('portugese')[0] == Language('por')
+    assert search_languages('protuguese')[0] == Language('por')
+    assert search_languages('chi', limit=3)[0] == Language('zho')
+    assert len(search_languages('a', limit=3)) == 3
+    assert search_languages('zzzzzz') == []
+
+
+def test_search_languages_qualifier():
+    assert search_languages('Portuguese (Brazil)')[0] == Language('por', 'BR')
+    assert search_languages('Chinese (Traditional)')[0] == Language('zho', script='Hant')
+    assert search_languages('Greek, Modern (1453-)') == [Language('ell')]
+
+
+def test_search_countries():
+    assert search_countries('frnce') == [Country('FR')]
+    assert search_countries('aland')[0] == Country('AX')
+    assert Country('US') in search_countries('united')
+
+
+def test_search_scripts():
+    assert search_scripts('cyril')[0] == Script('Cyrl')
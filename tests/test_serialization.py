@@ -0,0 +1,61 @@
+import json
+import pickle
+
+import pytest
+from babelfish import Country, Language, Script, dumps, loads
+from babelfish.serialization import (
+    HEADER,
+    json_default,
+    json_object_hook,
+    msgpack_default,
+    msgpack_ext_hook,
+)
+
+LANGUAGES = [Language('por', 'BR'), Language('eng'), None, Language('srp', 'RS', 'Latn'), Language('eng')]
+
+
+def test_dumps_loads():
+    data = dumps(LANGUAGES)
+    assert len(data) == HEADER.size + 4 * len(LANGUAGES)
+    assert loads(data) == LANGUAGES
+    assert loads(dumps(iter(LANGUAGES))) == LANGUAGES
+    assert loads(dumps([])) == []
+
+
+def test_loads_buffers():
+    data = dumps(LANGUAGES)
+    assert loads(memoryview(data)) == LANGUAGES
+    assert loads(bytearray(data)) == LANGUAGES
+    assert loads(memoryview(b'padding' + data)[7:]) == LANGUAGES
+
+
+def test_loads_invalid():
+    data = dumps(LANGUAGES)
+    for invalid in [b'', data[:-1], b'XX' + data[2:], data[:2] + b'\x02' + data[3:]]:
+        with pytest.raises(ValueError, match='Invalid'):
+            loads(invalid)
+    with pytest.raises(ValueError, match='other data tables'):
+        loads(data[:3] + b'\x00\x00\x00\x00' + data[7:])
+
+
+def test_pickle_compact():
+    for language in LANGUAGES[:-1]:
+        assert pickle.loads(pickle.dumps(language)) is language
+    assert Language.__reduce__(Language('eng')) == (Language, ('eng',))
+    assert Language.__reduce__(Language('srp', script='Latn')) == (Language, ('srp', None, 'Latn'))
+
+
+def test_json():
+    objects = [Language('zho', 'TW', 'Hant'), Country('FR'), Script('Latn'), {'other': 1}]
+    data = json.dumps(objects, default=json_default)
+    assert data == '[{"__language__": "zh-Hant-TW"}, {"__country__": "FR"}, {"__script__": "Latn"}, {"other": 1}]'
+    assert json.loads(data, object_hook=json_object_hook) == objects
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=json_default)
+
+
+def test_msgpack():
+    msgpack = pytest.importorskip('msgpack')
+    objects = [Language('zho', 'TW', 'Hant'), Country('FR'), Script('Latn'), msgpack.ExtType(1, b'x')]
+    data = msgpack.packb(objects, default=msgpack_default)
+    assert msgpack.unpackb(data, ext_hook=msgpack_ext_hook) == objects
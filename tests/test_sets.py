@@ -0,0 +1,141 @@
+import pickle
+
+import pytest
+from babelfish import Country, CountrySet, Language, LanguageSet, language
+from babelfish.sets import HEADER, fingerprint, language_bits
+
+A = [Language('eng'), Language('fra'), Language('por', 'BR'), Language('srp', 'RS', 'Latn'), Language('zza')]
+B = [Language('fra'), Language('por', 'BR'), Language('por'), Language('srp', None, 'Latn'), Language('zza')]
+
+
+def test_language_bits():
+    positions, alpha3s = language_bits()
+    assert sorted(positions) == list(range(len(language.LANGUAGE_COLUMNS.alpha3)))
+    assert all(alpha3s[position] == alpha3 for position, alpha3 in zip(positions, language.LANGUAGE_COLUMNS.alpha3))
+    # languages with an ISO-639-1 code come first
+    count = sum(1 for alpha2 in language.LANGUAGE_COLUMNS.alpha2 if alpha2)
+    assert all(Language(alpha3).alpha2 for alpha3 in alpha3s[:count])
+
+
+def test_language_set():
+    languages = LanguageSet(A)
+    assert len(languages) == len(A)
+    assert set(languages) == set(A)
+    assert all(member in languages for member in A)
+    assert Language('por') not in languages
+    assert Language('srp', 'RS') not in languages
+    assert 'eng' not in languages
+    assert None not in languages
+    assert LanguageSet(A + A) == languages
+    assert hash(LanguageSet(reversed(A))) == hash(languages)
+    assert not LanguageSet()
+    assert len(LanguageSet()) == 0
+
+
+@pytest.mark.parametrize(
+    'operation',
+    [
+        lambda a, b: a | b,
+        lambda a, b: a & b,
+        lambda a, b: a - b,
+        lambda a, b: b - a,
+        lambda a, b: a ^ b,
+        lambda a, b: a.union(b, [Language('deu')]),
+        lambda a, b: a.intersection(b),
+        lambda a, b: a.difference(b, [Language('zza')]),
+        lambda a, b: a.symmetric_difference(b),
+    ],
+)
+def test_language_set_operations(operation):
+    expected = operation(frozenset(A), frozenset(B))
+    result = operation(LanguageSet(A), LanguageSet(B))
+    assert isinstance(result, LanguageSet)
+    assert set(result) == expected
+    assert len(result) == len(expected)
+
+
+def test_language_set_comparisons():
+    a, b = LanguageSet(A), LanguageSet(A[:2])
+    assert b <= a
+    assert b < a
+    assert a >= b
+    assert a > b
+    assert not a < a
+    assert a <= a
+    assert b.issubset(A)
+    assert a.issuperset(A[:2])
+    assert not a.isdisjoint(B)
+    assert a.isdisjoint([Language('deu')])
+    assert a != LanguageSet(B)
+    assert a != set(A)
+    with pytest.raises(TypeError):
+        a | set(B)
+
+
+def test_language_set_repr():
+    assert repr(LanguageSet([Language('por', 'BR'), Language('fra')])) == 'LanguageSet({fr, pt-BR})'
+    assert repr(LanguageSet()) == 'LanguageSet({})'
+
+
+def test_language_set_to_bytes():
+    languages = LanguageSet(A)
+    assert LanguageSet.from_bytes(languages.to_bytes()) == languages
+    # bitmaps of languages with an ISO-639-1 code fit in a few bytes
+    assert len(LanguageSet(A[:4]).to_bytes()) < HEADER.size + 4 * 4
+    assert LanguageSet.from_bytes(LanguageSet().to_bytes()) == LanguageSet()
+    assert pickle.loads(pickle.dumps(languages)) == languages
+    assert LanguageSet.from_bytes(memoryview(languages.to_bytes())) == languages
+    assert LanguageSet.from_bytes(bytearray(languages.to_bytes())) == languages
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        b'',
+        b'LS',
+        CountrySet([Country('FR')]).to_bytes(),
+        LanguageSet([Language('por', 'BR')]).to_bytes()[: HEADER.size + 2],
+        HEADER.pack(b'LS', 1, 0, 0),
+        HEADER.pack(b'LS', 1, fingerprint(), 1) + (0xFFFFFFFF).to_bytes(4, 'little'),
+        HEADER.pack(b'LS', 1, fingerprint(), 0) + (1 << 8000).to_bytes(1001, 'little'),
+    ],
+)
+def test_language_set_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        LanguageSet.from_bytes(data)
+
+
+def test_language_set_wrong_type():
+    with pytest.raises(TypeError):
+        LanguageSet([Language('eng'), Country('FR')])
+    assert Country('FR') not in LanguageSet([Language('fra')])
+
+
+def test_country_set():
+    countries = CountrySet([Country('FR'), Country('US'), Country('BR')])
+    assert set(countries) == {Country('FR'), Country('US'), Country('BR')}
+    assert Country('FR') in countries
+    assert Country('DE') not in countries
+    assert 'FR' not in countries
+    assert countries & CountrySet([Country('FR'), Country('DE')]) == CountrySet([Country('FR')])
+    assert CountrySet.from_bytes(countries.to_bytes()) == countries
+    assert pickle.loads(pickle.dumps(countries)) == countries
+    assert repr(CountrySet([Country('US'), Country('FR')])) == 'CountrySet({FR, US})'
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        HEADER.pack(b'CS', 1, fingerprint(), 0) + (1 << 300).to_bytes(38, 'little'),
+        HEADER.pack(b'CS', 1, fingerprint(), 1) + (1 << 16).to_bytes(4, 'little'),
+    ],
+)
+def test_country_set_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        CountrySet.from_bytes(data)
+
+
+def test_country_set_wrong_type():
+    with pytest.raises(TypeError):
+        CountrySet([Country('FR'), Language('eng')])
+    assert Language('eng') not in CountrySet([Country('FR')])
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+from babelfish import snapshot
+
+#: Budget in seconds for the import of babelfish in a fresh interpreter
+IMPORT_TIME_BUDGET = 0.5
+
+
+@pytest.mark.parametrize('name', list(snapshot.PARSERS))
+def test_snapshot_up_to_date(name):
+    assert snapshot.read(name) == snapshot.parse(name)
+
+
+def test_snapshot_fallback(monkeypatch):
+    def read(name):
+        raise OSError
+
+    monkeypatch.setattr(snapshot, 'read', read)
+    assert snapshot.load('iso-3166-1.txt') == snapshot.parse('iso-3166-1.txt')
+
+
+def test_build(tmp_path):
+    paths = snapshot.build(tmp_path)
+    assert sorted(path.name for path in paths) == sorted(f'{name}.marshal' for name in snapshot.PARSERS)
+
+
+def test_import_time_budget():
+    code = 'import time; start = time.perf_counter(); import babelfish; print(time.perf_counter() - start)'
+    durations = [float(subprocess.check_output([sys.executable, '-c', code])) for _ in range(3)]
+    assert min(durations) < IMPORT_TIME_BUDGET
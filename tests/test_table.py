@@ -0,0 +1,165 @@
+import json
+
+import pytest
+from babelfish import Language, language_converters, serialization
+from babelfish.converters import table
+from babelfish.converters.table import TableConverter
+from babelfish.exceptions import LanguageConvertError, LanguageReverseError
+
+ROWS = [
+    {'code': 'pob', 'alpha3': 'por', 'country': 'BR'},
+    {'code': 'pb', 'alpha3': 'por', 'country': 'BR'},
+    {'code': 'por', 'alpha3': 'por'},
+    {'code': 'zht', 'alpha3': 'zho', 'country': 'TW', 'script': 'Hant'},
+]
+
+TSV = 'code\talpha3\tcountry\tscript\npob\tpor\tBR\t\npb\tpor\tBR\t\npor\tpor\t\t\nzht\tzho\tTW\tHant\n'
+
+
+class ProviderConverter(TableConverter):
+    PATH = None
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'cache'
+    monkeypatch.setenv('BABELFISH_CACHE_DIR', str(directory))
+    return directory
+
+
+@pytest.fixture(params=['tsv', 'csv', 'json'])
+def mapping_file(request, tmp_path):
+    path = tmp_path / f'provider.{request.param}'
+    if request.param == 'tsv':
+        path.write_text(TSV)
+    elif request.param == 'csv':
+        path.write_text(TSV.replace('\t', ','))
+    else:
+        path.write_text(json.dumps(ROWS))
+    return path
+
+
+def test_table_converter(mapping_file):
+    converter = TableConverter(mapping_file)
+    assert converter.codes == {'pob', 'pb', 'por', 'zht'}
+    assert converter.convert('por', 'BR') == 'pob'
+    assert converter.convert('por') == converter.convert('por', 'PT') == 'por'
+    assert converter.convert('zho', 'TW', 'Hant') == 'zht'
+    assert converter.try_convert('zho', 'TW') is None
+    with pytest.raises(LanguageConvertError):
+        converter.convert('fra')
+    assert converter.reverse('pb') == converter.reverse('POB') == ('por', 'BR', None)
+    assert converter.reverse('zht') == ('zho', 'TW', 'Hant')
+    with pytest.raises(LanguageReverseError):
+        converter.reverse('fre')
+
+
+def test_table_converter_case_sensitive(mapping_file):
+    class CaseSensitiveConverter(TableConverter):
+        CASE_SENSITIVE = True
+
+    converter = CaseSensitiveConverter(mapping_file)
+    assert converter.reverse('pob') == ('por', 'BR', None)
+    assert converter.try_reverse('POB') is None
+
+
+def test_table_converter_compiled_once(mapping_file, cache_dir, monkeypatch):
+    tables = table.load_tables(mapping_file)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def compile_rows(rows):
+        raise AssertionError
+
+    monkeypatch.setattr(table, 'compile_rows', compile_rows)
+    assert table.load_tables(mapping_file) == tables
+    with pytest.raises(AssertionError):
+        table.load_tables(mapping_file, cache=False)
+
+
+def test_table_converter_recompiled_when_changed(tmp_path):
+    path = tmp_path / 'provider.tsv'
+    path.write_text(TSV)
+    assert TableConverter(path).reverse('pb') == ('por', 'BR', None)
+    path.write_text(TSV.replace('pb\tpor\tBR', 'pb\tpor\tPT'))
+    assert TableConverter(path).reverse('pb') == ('por', 'PT', None)
+
+
+def test_table_converter_compiled_by_format(tmp_path):
+    content = 'code,alpha3\npb,por\n'
+    (tmp_path / 'provider.csv').write_text(content)
+    (tmp_path / 'provider.tsv').write_text(content)
+    assert TableConverter(tmp_path / 'provider.csv').reverse('pb') == ('por', None, None)
+    with pytest.raises(ValueError, match='missing code'):
+        TableConverter(tmp_path / 'provider.tsv')
+
+
+def test_table_converter_compiled_by_data_tables(mapping_file, cache_dir, monkeypatch):
+    table.load_tables(mapping_file)
+    monkeypatch.setattr(serialization, 'fingerprint', lambda: 0)
+    table.load_tables(mapping_file)
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_table_converter_failed_write(mapping_file, cache_dir, monkeypatch):
+    def replace(source, destination):
+        raise OSError
+
+    monkeypatch.setattr(table.os, 'replace', replace)
+    assert TableConverter(mapping_file).convert('por', 'BR') == 'pob'
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_table_converter_unwritable_cache(mapping_file, cache_dir):
+    cache_dir.write_text('not a directory')
+    assert TableConverter(mapping_file).convert('por', 'BR') == 'pob'
+
+
+@pytest.mark.parametrize(
+    ('content', 'message'),
+    [
+        ('code\talpha3\npob\tzzz\n', 'invalid alpha3'),
+        ('code\talpha3\n\tpor\n', 'missing code'),
+        ('code\talpha3\tcountry\npob\tpor\tZZ\n', 'invalid country'),
+        ('code\talpha3\npob\tpor\npob\tfra\n', 'already designates'),
+    ],
+)
+def test_table_converter_invalid(tmp_path, content, message):
+    path = tmp_path / 'provider.tsv'
+    path.write_text(content)
+    with pytest.raises(ValueError, match=message):
+        TableConverter(path)
+
+
+@pytest.mark.parametrize('row', [{'code': 1, 'alpha3': 'por'}, {'code': 'pb', 'alpha3': ['por']}])
+def test_table_converter_invalid_json(tmp_path, row):
+    path = tmp_path / 'provider.json'
+    path.write_text(json.dumps([row]))
+    with pytest.raises(ValueError, match='Row 1: codes must be strings'):
+        TableConverter(path)
+
+
+def test_table_converter_invalid_format(tmp_path):
+    path = tmp_path / 'provider.xml'
+    path.write_text('<codes/>')
+    with pytest.raises(ValueError, match='Unsupported'):
+        TableConverter(path)
+    path = tmp_path / 'provider.json'
+    path.write_text('{"pob": "por"}')
+    with pytest.raises(ValueError, match='list of objects'):
+        TableConverter(path)
+    with pytest.raises(ValueError, match='no mapping file'):
+        TableConverter()
+
+
+def test_table_converter_register(tmp_path, monkeypatch):
+    path = tmp_path / 'provider.tsv'
+    path.write_text(TSV)
+    monkeypatch.setattr(ProviderConverter, 'PATH', path)
+    entry_point = f'provider = {__name__}:ProviderConverter'
+    language_converters.register(entry_point)
+    try:
+        assert Language.fromprovider('pob') == Language('por', 'BR')
+        assert Language('zho', 'TW', 'Hant').provider == 'zht'
+    finally:
+        language_converters.unregister(entry_point)
+        del language_converters['provider']